@@ -1,13 +1,29 @@
 import hashlib
 import json
+import os
+import threading
+import time
 from datetime import datetime
 
-from algorand_anchor import anchor_decision_hash, list_anchor_hashes
-from db import get_connection, release_connection
+from algorand_anchor import anchor_decision_hash
+from anchor_mirror import mirror_synced_round, sync_anchor_mirror
+from anchor_batcher import AnchorTable, MerkleAnchorBatcher
+from db import db_cursor
 
 ADMIN_AUDIT_VOTER_REF = "admin_audit"
 SYSTEM_AUDITOR_ID = "SYSTEM_AUDITOR"
 HIGH_RISK_LEVELS = {"HIGH", "CRITICAL"}
+GOVERNANCE_SUMMARY_KEY = "governance_audit_summary"
+TAMPER_SAMPLE_SIZE = 10
+GOVERNANCE_SUMMARY_REFRESH_SECONDS = float(os.getenv("GOVERNANCE_SUMMARY_REFRESH_SECONDS", "30"))
+
+ADMIN_AUDIT_ANCHOR_TABLE = AnchorTable(
+    table="admin_audit_log",
+    hash_column="decision_hash",
+    tx_column="algorand_tx_id",
+    round_column=None,
+    pending_filter="risk_level IN ('HIGH', 'CRITICAL') AND decision_hash IS NOT NULL AND algorand_tx_id IS NULL",
+)
 
 
 def _deterministic_hash(payload):
@@ -22,6 +38,13 @@ def _normalized_risk(risk_level):
     return level
 
 
+def _anchor_admin_root(merkle_root):
+    return anchor_decision_hash(merkle_root, voter_ref=ADMIN_AUDIT_VOTER_REF), None
+
+
+ADMIN_ANCHOR_BATCHER = MerkleAnchorBatcher(ADMIN_AUDIT_ANCHOR_TABLE, _anchor_admin_root)
+
+
 def log_admin_event(admin_id, event_type, election_id, event_details=None, risk_level="LOW"):
     risk_level = _normalized_risk(risk_level)
     event_payload = {
@@ -35,15 +58,8 @@ def log_admin_event(admin_id, event_type, election_id, event_details=None, risk_
 
     decision_hash = _deterministic_hash(event_payload)
     algorand_tx_id = None
-    if risk_level in HIGH_RISK_LEVELS:
-        try:
-            algorand_tx_id = anchor_decision_hash(decision_hash, voter_ref=ADMIN_AUDIT_VOTER_REF)
-        except Exception:
-            algorand_tx_id = None
-
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
+
+    with db_cursor() as (conn, cur):
         cur.execute(
             """
             INSERT INTO admin_audit_log
@@ -62,9 +78,11 @@ def log_admin_event(admin_id, event_type, election_id, event_details=None, risk_
         )
         row = cur.fetchone()
         conn.commit()
-    finally:
-        cur.close()
-        release_connection(conn)
+
+    # High-risk hashes are anchored asynchronously as leaves of a shared Merkle root.
+    anchor_pending = risk_level in HIGH_RISK_LEVELS
+    if anchor_pending:
+        ADMIN_ANCHOR_BATCHER.notify()
 
     return {
         "id": row[0] if row else None,
@@ -72,45 +90,159 @@ def log_admin_event(admin_id, event_type, election_id, event_details=None, risk_
         "event_payload": event_payload,
         "decision_hash": decision_hash,
         "algorand_tx_id": algorand_tx_id,
+        "anchor_pending": anchor_pending,
         "risk_level": risk_level,
     }
 
 
-def detect_admin_log_tampering(election_id):
+def _load_governance_summary(cur):
+    cur.execute("SELECT value FROM governance_state WHERE key = %s", (GOVERNANCE_SUMMARY_KEY,))
+    row = cur.fetchone()
+    return json.loads(row[0]) if row else None
+
+
+def detect_admin_log_tampering(cur, since_round=0, sample_size=TAMPER_SAMPLE_SIZE):
+    # A sync that stops at its page limit can leave a round half mirrored; stop at the last complete one.
+    last_checked_round = max(since_round, mirror_synced_round(cur))
+    cur.execute(
+        "SELECT COUNT(*) FROM anchor_notes WHERE note_ref = %s AND confirmed_round <= %s",
+        (ADMIN_AUDIT_VOTER_REF, last_checked_round),
+    )
+    chain_hash_count = cur.fetchone()[0]
+
+    # Anti-join in Postgres: mirrored chain hashes that no anchored row accounts for. Every pass covers
+    # the whole mirror, so a row deleted after its round was first checked is still reported.
+    cur.execute(
+        """
+        INSERT INTO admin_anchor_unmatched (payload_hash, tx_id, confirmed_round)
+        SELECT n.payload_hash, n.tx_id, n.confirmed_round
+        FROM anchor_notes n
+        WHERE n.note_ref = %s
+          AND n.confirmed_round <= %s
+          AND NOT EXISTS (
+              SELECT 1
+              FROM admin_audit_log a
+              WHERE a.algorand_tx_id IS NOT NULL
+                AND COALESCE(a.merkle_root, a.decision_hash) = n.payload_hash
+          )
+        ON CONFLICT (payload_hash) DO NOTHING
+        """,
+        (ADMIN_AUDIT_VOTER_REF, last_checked_round),
+    )
+    # Hashes can be seen on chain before the batcher commits their rows, so re-check the leftovers.
+    cur.execute(
+        """
+        DELETE FROM admin_anchor_unmatched u
+        WHERE EXISTS (
+            SELECT 1
+            FROM admin_audit_log a
+            WHERE a.algorand_tx_id IS NOT NULL
+              AND COALESCE(a.merkle_root, a.decision_hash) = u.payload_hash
+        )
+        """
+    )
+    cur.execute("SELECT COUNT(*) FROM admin_anchor_unmatched")
+    missing_hash_count = cur.fetchone()[0]
+    cur.execute(
+        "SELECT payload_hash FROM admin_anchor_unmatched ORDER BY first_seen_at, payload_hash LIMIT %s",
+        (sample_size,),
+    )
+    return {
+        "missing_hash_count": int(missing_hash_count),
+        "missing_hashes_sample": [row[0] for row in cur.fetchall()],
+        "last_checked_round": int(last_checked_round),
+        "chain_hash_count": int(chain_hash_count),
+    }
+
+
+def refresh_governance_audit_summary(election_id):
+    mirror_error = None
     try:
-        chain_hashes = set(list_anchor_hashes(ADMIN_AUDIT_VOTER_REF, limit=4000))
-        chain_lookup_error = None
+        sync_anchor_mirror()
     except Exception as exc:
-        chain_hashes = set()
-        chain_lookup_error = str(exc)
+        mirror_error = str(exc)
+
+    with db_cursor() as (conn, cur):
+        # One refresher at a time across processes; the others keep serving the stored summary.
+        cur.execute("SELECT pg_try_advisory_xact_lock(hashtext('governance_audit_summary'))")
+        if not cur.fetchone()[0]:
+            conn.rollback()
+            return None
+
+        previous = _load_governance_summary(cur) or {}
+        last_round = int(previous.get("last_scanned_round") or 0)
+        last_admin_id = int(previous.get("last_compared_admin_id") or 0)
+
+        chain_lookup_error = mirror_error
+        tamper_check = detect_admin_log_tampering(cur, since_round=last_round)
+        last_round = tamper_check["last_checked_round"]
+        chain_hash_count = tamper_check["chain_hash_count"]
+        missing_hash_count = tamper_check["missing_hash_count"]
+        missing_hashes_sample = tamper_check["missing_hashes_sample"]
 
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
         cur.execute(
             """
-            SELECT decision_hash
+            SELECT
+                COALESCE(MAX(id), %s),
+                COUNT(*) FILTER (WHERE risk_level IN ('HIGH', 'CRITICAL')),
+                COUNT(*) FILTER (WHERE risk_level = 'CRITICAL'),
+                COUNT(*) FILTER (WHERE event_type = 'CRITICAL_ADMIN_LOG_TAMPERING')
             FROM admin_audit_log
-            WHERE decision_hash IS NOT NULL
-              AND algorand_tx_id IS NOT NULL
-            """
+            WHERE id > %s
+            """,
+            (last_admin_id, last_admin_id),
+        )
+        max_id, new_high_risk, new_critical, new_tamper_events = cur.fetchone()
+        high_risk_events = int(previous.get("total_admin_high_risk_events") or 0) + int(new_high_risk or 0)
+        critical_events = int(previous.get("total_admin_critical_events") or 0) + int(new_critical or 0)
+        previous_critical_tampering_events = int(previous.get("previous_critical_tampering_events") or 0) + int(
+            new_tamper_events or 0
         )
-        db_hashes = {row[0] for row in cur.fetchall()}
 
         cur.execute(
             """
             SELECT COUNT(*)
             FROM admin_audit_log
-            WHERE event_type = 'CRITICAL_ADMIN_LOG_TAMPERING'
+            WHERE algorand_tx_id IS NULL AND risk_level IN ('HIGH', 'CRITICAL')
             """
         )
-        previous_critical_tampering_events = cur.fetchone()[0]
-    finally:
-        cur.close()
-        release_connection(conn)
+        pending_anchor_events = int(cur.fetchone()[0] or 0)
+
+        tampering_detected_now = missing_hash_count > 0
+        governance_compromised = tampering_detected_now or previous_critical_tampering_events > 0
+        if chain_lookup_error:
+            blockchain_verification_status = "UNAVAILABLE"
+        elif tampering_detected_now:
+            blockchain_verification_status = "MISMATCH_DETECTED"
+        else:
+            blockchain_verification_status = "VERIFIED"
 
-    missing_hashes = sorted(chain_hashes - db_hashes)
-    tampering_detected_now = len(missing_hashes) > 0
+        summary = {
+            "total_admin_high_risk_events": high_risk_events,
+            "total_admin_critical_events": critical_events,
+            "anchored_high_risk_events": high_risk_events - pending_anchor_events,
+            "blockchain_admin_anchor_count": chain_hash_count,
+            "blockchain_verification_status": blockchain_verification_status,
+            "tampering_detection_result": "CRITICAL_ADMIN_LOG_TAMPERING" if governance_compromised else "CLEAR",
+            "missing_hash_count": missing_hash_count,
+            "missing_hashes_sample": missing_hashes_sample,
+            "chain_lookup_error": chain_lookup_error,
+            "governance_integrity_status": "COMPROMISED" if governance_compromised else "HEALTHY",
+            "previous_critical_tampering_events": previous_critical_tampering_events,
+            "last_scanned_round": last_round,
+            "last_compared_admin_id": int(max_id),
+            "refreshed_at": datetime.utcnow().replace(microsecond=0).isoformat() + "Z",
+        }
+        cur.execute(
+            """
+            INSERT INTO governance_state (key, value, updated_at)
+            VALUES (%s, %s, NOW())
+            ON CONFLICT (key)
+            DO UPDATE SET value = EXCLUDED.value, updated_at = NOW()
+            """,
+            (GOVERNANCE_SUMMARY_KEY, json.dumps(summary, sort_keys=True)),
+        )
+        conn.commit()
 
     if tampering_detected_now and previous_critical_tampering_events == 0:
         log_admin_event(
@@ -118,111 +250,64 @@ def detect_admin_log_tampering(election_id):
             event_type="CRITICAL_ADMIN_LOG_TAMPERING",
             election_id=election_id,
             event_details={
-                "missing_hash_count": len(missing_hashes),
-                "missing_hashes_sample": missing_hashes[:10],
+                "missing_hash_count": missing_hash_count,
+                "missing_hashes_sample": missing_hashes_sample,
                 "detection_scope": "anchored_admin_hashes_without_matching_db_rows",
             },
             risk_level="CRITICAL",
         )
 
-    return {
-        "tampering_detected_now": tampering_detected_now,
-        "missing_hash_count": len(missing_hashes),
-        "missing_hashes_sample": missing_hashes[:10],
-        "previous_critical_tampering_events": int(previous_critical_tampering_events),
-        "governance_compromised": tampering_detected_now or previous_critical_tampering_events > 0,
-        "chain_lookup_error": chain_lookup_error,
-        "chain_hash_count": len(chain_hashes),
-    }
+    return summary
 
 
-def get_governance_audit_summary(election_id):
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
-        cur.execute(
-            """
-            SELECT
-                COUNT(*) FILTER (WHERE risk_level IN ('HIGH', 'CRITICAL')) AS high_risk_events,
-                COUNT(*) FILTER (WHERE risk_level = 'CRITICAL') AS critical_events,
-                COUNT(*) FILTER (WHERE risk_level IN ('HIGH', 'CRITICAL') AND algorand_tx_id IS NOT NULL) AS anchored_high_risk_events
-            FROM admin_audit_log
-            """
-        )
-        row = cur.fetchone()
-        high_risk_events = int(row[0] or 0)
-        critical_events = int(row[1] or 0)
-        anchored_high_risk_events = int(row[2] or 0)
-    finally:
-        cur.close()
-        release_connection(conn)
-
-    tamper_check = detect_admin_log_tampering(election_id)
-    if tamper_check.get("chain_lookup_error"):
-        chain_hash_count = 0
-        blockchain_verification_status = "UNAVAILABLE"
-    else:
-        chain_hash_count = int(tamper_check.get("chain_hash_count", 0))
-        blockchain_verification_status = "VERIFIED"
-        if tamper_check["missing_hash_count"] > 0:
-            blockchain_verification_status = "MISMATCH_DETECTED"
+class GovernanceSummaryRefresher:
+    def __init__(self, interval_seconds=GOVERNANCE_SUMMARY_REFRESH_SECONDS):
+        self._interval_seconds = max(1.0, interval_seconds)
+        self._lock = threading.Lock()
+        self._thread = None
 
-    return {
-        "total_admin_high_risk_events": high_risk_events,
-        "total_admin_critical_events": critical_events,
-        "anchored_high_risk_events": anchored_high_risk_events,
-        "blockchain_admin_anchor_count": chain_hash_count,
-        "blockchain_verification_status": blockchain_verification_status,
-        "tampering_detection_result": "CRITICAL_ADMIN_LOG_TAMPERING" if tamper_check["governance_compromised"] else "CLEAR",
-        "missing_hash_count": tamper_check["missing_hash_count"],
-        "missing_hashes_sample": tamper_check["missing_hashes_sample"],
-        "chain_lookup_error": tamper_check.get("chain_lookup_error"),
-        "governance_integrity_status": "COMPROMISED" if tamper_check["governance_compromised"] else "HEALTHY",
-    }
+    def start(self, election_id):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(election_id,),
+                name="governance-summary-refresher",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self, election_id):
+        while True:
+            try:
+                refresh_governance_audit_summary(election_id)
+            except Exception:
+                pass
+            time.sleep(self._interval_seconds)
+
+
+GOVERNANCE_SUMMARY_REFRESHER = GovernanceSummaryRefresher()
+
+
+def get_governance_audit_summary(election_id):
+    GOVERNANCE_SUMMARY_REFRESHER.start(election_id)
+    with db_cursor() as (conn, cur):
+        summary = _load_governance_summary(cur)
+    if summary is None:
+        summary = refresh_governance_audit_summary(election_id)
+    if summary is None:
+        return {
+            "blockchain_verification_status": "PENDING",
+            "tampering_detection_result": "CLEAR",
+            "governance_integrity_status": "HEALTHY",
+        }
+    return summary
 
 
 def backfill_high_risk_anchors(batch_size=50):
-    conn = get_connection()
-    cur = conn.cursor()
     try:
-        cur.execute(
-            """
-            SELECT id, decision_hash
-            FROM admin_audit_log
-            WHERE risk_level IN ('HIGH', 'CRITICAL')
-              AND decision_hash IS NOT NULL
-              AND algorand_tx_id IS NULL
-            ORDER BY created_at ASC
-            LIMIT %s
-            """,
-            (batch_size,),
-        )
-        rows = cur.fetchall()
-    finally:
-        cur.close()
-        release_connection(conn)
-
-    anchored_count = 0
-    for row_id, decision_hash in rows:
-        try:
-            tx_id = anchor_decision_hash(decision_hash, voter_ref=ADMIN_AUDIT_VOTER_REF)
-        except Exception:
-            tx_id = None
-        if not tx_id:
-            continue
-
-        conn = get_connection()
-        cur = conn.cursor()
-        try:
-            cur.execute(
-                "UPDATE admin_audit_log SET algorand_tx_id = %s WHERE id = %s AND algorand_tx_id IS NULL",
-                (tx_id, row_id),
-            )
-            conn.commit()
-            if cur.rowcount > 0:
-                anchored_count += 1
-        finally:
-            cur.close()
-            release_connection(conn)
-
-    return {"pending_checked": len(rows), "anchored_count": anchored_count}
+        result = ADMIN_ANCHOR_BATCHER.flush(max_leaves=batch_size)
+    except Exception:
+        return {"pending_checked": 0, "anchored_count": 0}
+    return {"pending_checked": result["pending_checked"], "anchored_count": result["anchored_count"]}
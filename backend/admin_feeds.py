@@ -0,0 +1,163 @@
+import base64
+import json
+import os
+from datetime import datetime
+from typing import Any, Iterator
+
+from db import db_connection, db_cursor
+
+ADMIN_FEED_DEFAULT_LIMIT = int(os.getenv("ADMIN_FEED_DEFAULT_LIMIT", "100"))
+ADMIN_FEED_MAX_LIMIT = int(os.getenv("ADMIN_FEED_MAX_LIMIT", "500"))
+ADMIN_FEED_EXPORT_FETCH_SIZE = int(os.getenv("ADMIN_FEED_EXPORT_FETCH_SIZE", "1000"))
+
+
+def _dumps(data: dict[str, Any]) -> str:
+    return json.dumps(data, sort_keys=True, separators=(",", ":"))
+
+
+def _ai_flag_json(row) -> str:
+    return _dumps(
+        {
+            "id": row[0],
+            "email": row[1],
+            "reason": row[2],
+            "severity": row[3],
+            "created_at": row[4].isoformat(),
+        }
+    )
+
+
+def _audit_event_json(row) -> str:
+    meta = _dumps(
+        {
+            "id": row[0],
+            "event_type": row[1],
+            "severity": row[2],
+            "entry_hash": row[4],
+            "anchored_tx_id": row[5],
+            "anchored_round": row[6],
+            "created_at": row[7].isoformat(),
+        }
+    )
+    # payload_json is always written as canonical JSON, so it is spliced in verbatim
+    # rather than parsed and re-serialised per row.
+    return meta[:-1] + ',"payload":' + row[3] + "}"
+
+
+FEEDS = {
+    "ai_flags": {
+        "columns": "id, wallet, reason, severity, created_at",
+        "filters": {
+            "email": "wallet = %s",
+            "min_severity": "severity >= %s",
+        },
+        "to_json": _ai_flag_json,
+        # This feed has always returned every flag, so it is only paged when the caller asks.
+        "paged_by_default": False,
+    },
+    "audit_events": {
+        "columns": "id, event_type, severity, payload_json, entry_hash, anchored_tx_id, anchored_round, created_at",
+        "filters": {
+            "email": "(payload_json::jsonb #>> '{payload,email}') = %s",
+            "event_type": "event_type = %s",
+            "severity": "severity = %s",
+        },
+        "to_json": _audit_event_json,
+        "paged_by_default": True,
+    },
+}
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode("utf-8")
+        created_at, row_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except Exception as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def parse_feed_filters(feed: str, args) -> dict[str, Any]:
+    filters: dict[str, Any] = {}
+    for name in FEEDS[feed]["filters"]:
+        value = (args.get(name) or "").strip()
+        if not value:
+            continue
+        if name == "min_severity":
+            try:
+                filters[name] = int(value)
+            except ValueError as exc:
+                raise ValueError("min_severity must be an integer") from exc
+        elif name == "severity":
+            filters[name] = value.upper()
+        elif name == "email":
+            filters[name] = value.lower()
+        else:
+            filters[name] = value
+    return filters
+
+
+def _feed_query(feed: str, filters: dict[str, Any], cursor: str | None) -> tuple[str, list[Any]]:
+    spec = FEEDS[feed]
+    clauses = []
+    params: list[Any] = []
+    for name, value in filters.items():
+        clauses.append(spec["filters"][name])
+        params.append(value)
+    if cursor:
+        clauses.append("(created_at, id) < (%s, %s)")
+        params.extend(decode_cursor(cursor))
+    query = f"SELECT {spec['columns']} FROM {feed}"
+    if clauses:
+        query += " WHERE " + " AND ".join(clauses)
+    return query + " ORDER BY created_at DESC, id DESC", params
+
+
+def read_feed_page(
+    feed: str, filters: dict[str, Any], cursor: str | None = None, limit: int = ADMIN_FEED_DEFAULT_LIMIT
+) -> tuple[list[str], str | None]:
+    limit = max(1, min(ADMIN_FEED_MAX_LIMIT, limit))
+    query, params = _feed_query(feed, filters, cursor)
+    with db_cursor() as (conn, cur):
+        cur.execute(query + " LIMIT %s", params + [limit + 1])
+        rows = cur.fetchall()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1][-1], rows[-1][0])
+    return [FEEDS[feed]["to_json"](row) for row in rows], next_cursor
+
+
+def _iter_feed_rows(feed: str, filters: dict[str, Any], cursor: str | None = None) -> Iterator[str]:
+    query, params = _feed_query(feed, filters, cursor)
+    to_json = FEEDS[feed]["to_json"]
+    with db_connection() as conn:
+        # A server-side cursor streams rows in fetch-size chunks instead of materialising the feed.
+        cur = conn.cursor(name=f"{feed}_export")
+        cur.itersize = ADMIN_FEED_EXPORT_FETCH_SIZE
+        try:
+            cur.execute(query, params)
+            for row in cur:
+                yield to_json(row)
+        finally:
+            cur.close()
+            conn.rollback()
+
+
+def iter_feed_export(feed: str, filters: dict[str, Any], cursor: str | None = None) -> Iterator[str]:
+    for row in _iter_feed_rows(feed, filters, cursor):
+        yield row + "\n"
+
+
+def iter_feed_array(feed: str, filters: dict[str, Any]) -> Iterator[str]:
+    yield "["
+    separator = ""
+    for row in _iter_feed_rows(feed, filters):
+        yield separator + row
+        separator = ","
+    yield "]"
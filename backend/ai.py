@@ -1,21 +1,23 @@
-import json
-import hashlib
-from db import get_connection, release_connection
+import os
 
-def check_anomaly(identity_key):
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
-        cur.execute("""
-            SELECT COUNT(*) 
-            FROM vote_attempts
-            WHERE wallet = %s
-            AND timestamp > NOW() - INTERVAL '1 minute'
-        """, (identity_key,))
+from consensus import run_consensus
+from rate_limiter import RateLimit
 
-        count = cur.fetchone()[0]
-    finally:
-        cur.close()
-        release_connection(conn)
+VOTE_ATTEMPT_RATE = RateLimit(
+    "vote_attempt",
+    int(os.getenv("VOTE_ATTEMPT_RATE_LIMIT", "5")),
+    int(os.getenv("VOTE_ATTEMPT_RATE_WINDOW_SECONDS", "60")),
+)
 
-    return payload, payload_hash
+
+def check_anomaly(identity_key, limiter, store, ip_hash=None, device_hash=None):
+    allowed, attempts = limiter.hit(VOTE_ATTEMPT_RATE, identity_key)
+    # Features come from the in-process store, so scoring never waits on the database.
+    metadata = store.record(identity_key, ip_hash, device_hash)
+    verdict, validators, _ = run_consensus("ALLOW" if allowed else "BLOCK", metadata)
+    if not allowed:
+        return True, f"{attempts} vote attempts within {VOTE_ATTEMPT_RATE.window_seconds}s"
+    if verdict == "ALLOW":
+        return False, None
+    rules = sorted({rule for name, result in validators.items() if name != "ai" for rule in result["rules"]})
+    return True, f"{verdict}: {', '.join(rules)}"
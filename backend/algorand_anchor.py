@@ -4,6 +4,8 @@ from algosdk import mnemonic, transaction
 from algosdk.account import address_from_private_key
 from algosdk.v2client import algod, indexer
 
+from params_cache import SUGGESTED_PARAMS_CACHE
+
 
 ANCHOR_NOTE_PREFIX = "TP1|"
 
@@ -57,11 +59,11 @@ def anchor_decision_hash(payload_hash, voter_ref):
 
     private_key = _get_private_key_for_sender(sender_wallet)
     client = _algod_client()
-    params = client.suggested_params()
+    params = SUGGESTED_PARAMS_CACHE.get(client)
     note = build_anchor_note(voter_ref, payload_hash).encode("utf-8")
     txn = transaction.PaymentTxn(sender_wallet, params, sender_wallet, 0, note=note)
     signed = txn.sign(private_key)
-    txid = client.send_transaction(signed)
+    txid = SUGGESTED_PARAMS_CACHE.send(client, signed)
     return txid
 
 
@@ -75,65 +77,20 @@ def fetch_tx_note(tx_id):
     return note_bytes.decode("utf-8")
 
 
-def count_wallet_anchors(voter_ref):
-    client = _indexer_client()
-    sender_wallet = os.getenv("ANCHOR_SENDER")
-    if not sender_wallet:
-        raise RuntimeError("ANCHOR_SENDER is not set")
-    note_prefix = f"{ANCHOR_NOTE_PREFIX}{voter_ref}|".encode("utf-8")
-
-    count = 0
+def scan_sender_notes(client, sender_wallet, min_round=None, max_round=None, page_size=1000):
+    notes = {}
+    pages = 0
     next_token = None
     while True:
+        query = {"address": sender_wallet, "address_role": "sender", "tx_type": "pay", "limit": page_size}
+        if min_round:
+            query["min_round"] = min_round
+        if max_round:
+            query["max_round"] = max_round
         if next_token:
-            res = client.search_transactions(
-                address=sender_wallet,
-                tx_type="pay",
-                note_prefix=note_prefix,
-                limit=100,
-                next_page=next_token,
-            )
-        else:
-            res = client.search_transactions(
-                address=sender_wallet,
-                tx_type="pay",
-                note_prefix=note_prefix,
-                limit=100,
-            )
-        txns = res.get("transactions", [])
-        count += len(txns)
-        next_token = res.get("next-token")
-        if not next_token:
-            break
-    return count
-
-
-def list_anchor_hashes(voter_ref, limit=2000):
-    client = _indexer_client()
-    sender_wallet = os.getenv("ANCHOR_SENDER")
-    if not sender_wallet:
-        raise RuntimeError("ANCHOR_SENDER is not set")
-    note_prefix = f"{ANCHOR_NOTE_PREFIX}{voter_ref}|".encode("utf-8")
-
-    hashes = []
-    next_token = None
-    while len(hashes) < limit:
-        page_limit = min(100, limit - len(hashes))
-        if next_token:
-            res = client.search_transactions(
-                address=sender_wallet,
-                tx_type="pay",
-                note_prefix=note_prefix,
-                limit=page_limit,
-                next_page=next_token,
-            )
-        else:
-            res = client.search_transactions(
-                address=sender_wallet,
-                tx_type="pay",
-                note_prefix=note_prefix,
-                limit=page_limit,
-            )
+            query["next_page"] = next_token
+        res = client.search_transactions(**query)
+        pages += 1
 
         txns = res.get("transactions", [])
         for tx in txns:
@@ -141,16 +98,19 @@ def list_anchor_hashes(voter_ref, limit=2000):
             if not note_b64:
                 continue
             try:
-                note_bytes = base64.b64decode(note_b64)
-                note_text = note_bytes.decode("utf-8")
+                note_text = base64.b64decode(note_b64).decode("utf-8")
             except Exception:
                 continue
-            parsed_ref, payload_hash = parse_anchor_note(note_text)
-            if parsed_ref == voter_ref and payload_hash:
-                hashes.append(payload_hash)
+            notes[tx["id"]] = {"note": note_text, "confirmed_round": tx.get("confirmed-round")}
 
         next_token = res.get("next-token")
-        if not next_token:
+        if not next_token or not txns:
             break
+    return notes, pages
+
 
-    return hashes
+def scan_anchor_notes(min_round=None, max_round=None):
+    sender_wallet = os.getenv("ANCHOR_SENDER")
+    if not sender_wallet:
+        raise RuntimeError("ANCHOR_SENDER is not set")
+    return scan_sender_notes(_indexer_client(), sender_wallet, min_round=min_round, max_round=max_round)
@@ -1,10 +1,62 @@
 import base64
+import hashlib
 import os
 from typing import Any
 
-from algosdk import account, mnemonic, transaction
+from algosdk import transaction
 from algosdk.v2client import algod, indexer
 
+from algorand_anchor import scan_sender_notes
+from block_follower import follower_for
+from params_cache import SUGGESTED_PARAMS_CACHE
+from signer_pool import load_signer_pool
+
+DEFAULT_ELECTION_ID = os.getenv("ELECTION_ID", "default-election")
+TALLY_STORAGE = os.getenv("ALGORAND_TALLY_STORAGE", "global").strip().lower()
+TALLY_BOX_NAME = b"tallies"
+TALLY_BOX_SLOTS = int(os.getenv("SMART_CONTRACT_MAX_CANDIDATES", "50")) + 1
+
+
+def supports_multiple_elections() -> bool:
+    return TALLY_STORAGE == "box"
+
+
+def election_key(election_id: str | None) -> bytes:
+    return hashlib.sha256((election_id or DEFAULT_ELECTION_ID).encode("utf-8")).digest()[:8]
+
+
+def tally_box_name(election_id: str | None) -> bytes:
+    return TALLY_BOX_NAME + election_key(election_id)
+
+
+def tally_box_mbr() -> int:
+    return 2500 + 400 * (len(TALLY_BOX_NAME) + 8 + TALLY_BOX_SLOTS * 8)
+
+
+def voter_box_name(email_hash_hex: str, election_id: str | None) -> bytes:
+    if supports_multiple_elections():
+        return b"voter_" + election_key(election_id) + bytes.fromhex(email_hash_hex)
+    return b"voter_" + bytes.fromhex(email_hash_hex)
+
+
+def election_app_args(election_id: str | None) -> list[bytes]:
+    # The single-election contract keeps its one election in global state and takes no key.
+    return [election_key(election_id)] if supports_multiple_elections() else []
+
+
+def with_tally_box_refs(boxes: list[tuple[int, bytes]], election_id: str | None = None) -> list[tuple[int, bytes]]:
+    if TALLY_STORAGE != "box":
+        return boxes
+    # Every box reference buys 1KB of box I/O; empty references top the budget up
+    # so the whole packed tally array (plus the one-byte voter box) can be touched.
+    box_bytes = TALLY_BOX_SLOTS * 8 + len(boxes)
+    refs = max(len(boxes) + 1, -(-box_bytes // 1024))
+    return boxes + [(0, tally_box_name(election_id))] + [(0, b"")] * (refs - len(boxes) - 1)
+
+
+def candidate_counts_for_slots(slot_counts: dict[int, int], candidate_slots: dict[int, int]) -> dict[int, int]:
+    return {cid: int(slot_counts.get(slot, 0)) for cid, slot in candidate_slots.items()}
+
 
 class AlgorandGovernanceClient:
     def __init__(self) -> None:
@@ -25,54 +77,35 @@ class AlgorandGovernanceClient:
         if self.app_id <= 0:
             raise RuntimeError("ALGORAND_APP_ID must be set to a deployed application id")
 
-        service_mnemonic = os.getenv("ALGORAND_SERVICE_MNEMONIC", "")
-        if not service_mnemonic:
-            raise RuntimeError("ALGORAND_SERVICE_MNEMONIC is required")
-        self.private_key = mnemonic.to_private_key(service_mnemonic)
-        self.sender = account.address_from_private_key(self.private_key)
+        self.signers = load_signer_pool()
+        self.private_key = self.signers.primary.private_key
+        self.sender = self.signers.primary.address
         self.timeout_rounds = int(os.getenv("ALGORAND_TX_TIMEOUT_ROUNDS", "12"))
 
-    @staticmethod
-    def _box_key(email_hash_hex: str) -> bytes:
-        return b"voter_" + bytes.fromhex(email_hash_hex)
-
     @staticmethod
     def _u64(value: int) -> bytes:
         return int(value).to_bytes(8, "big")
 
     def wait_for_confirmation(self, tx_id: str, timeout_rounds: int | None = None) -> dict[str, Any]:
         timeout = timeout_rounds if timeout_rounds is not None else self.timeout_rounds
-        start_round = self.algod.status()["last-round"] + 1
-        current_round = start_round
-        while current_round < start_round + timeout:
-            pending_txn = self.algod.pending_transaction_info(tx_id)
-            confirmed_round = pending_txn.get("confirmed-round", 0)
-            if confirmed_round > 0:
-                return pending_txn
-            pool_error = pending_txn.get("pool-error")
-            if pool_error:
-                raise RuntimeError(f"Transaction rejected: {pool_error}")
-            self.algod.status_after_block(current_round)
-            current_round += 1
-        raise TimeoutError(f"Transaction not confirmed after {timeout} rounds")
-
-    def cast_vote(self, email_hash_hex: str, candidate_id: int) -> dict[str, int | str]:
-        sp = self.algod.suggested_params()
-        app_args = [b"cast_vote", bytes.fromhex(email_hash_hex), self._u64(candidate_id)]
-        boxes = [(self.app_id, self._box_key(email_hash_hex))]
-        txn = transaction.ApplicationNoOpTxn(
-            sender=self.sender,
-            sp=sp,
-            index=self.app_id,
-            app_args=app_args,
-            boxes=boxes,
-        )
-        signed = txn.sign(self.private_key)
-        tx_id = self.algod.send_transaction(signed)
+        return follower_for(self.algod).wait(tx_id, timeout)
+
+    def cast_vote(self, email_hash_hex: str, candidate_slot: int, election_id: str | None = None) -> dict[str, int | str]:
+        sp = SUGGESTED_PARAMS_CACHE.get(self.algod)
+        app_args = [b"cast_vote", bytes.fromhex(email_hash_hex), self._u64(candidate_slot)] + election_app_args(election_id)
+        boxes = with_tally_box_refs([(self.app_id, voter_box_name(email_hash_hex, election_id))], election_id)
+        with self.signers.signer(email_hash_hex) as acct:
+            txn = transaction.ApplicationNoOpTxn(
+                sender=acct.address,
+                sp=sp,
+                index=self.app_id,
+                app_args=app_args,
+                boxes=boxes,
+            )
+            tx_id = self.signers.send(self.algod, acct, txn.sign(acct.private_key))
         pending = self.wait_for_confirmation(tx_id)
         confirmed_round = int(pending.get("confirmed-round", 0))
-        block_info = self.algod.block_info(confirmed_round)
-        block_timestamp = int(block_info["block"]["ts"])
+        block_timestamp = int(pending["block-timestamp"])
         return {
             "tx_id": tx_id,
             "confirmed_round": confirmed_round,
@@ -90,22 +123,46 @@ class AlgorandGovernanceClient:
                 decoded[key] = base64.b64decode(value.get("bytes", ""))
         return decoded
 
-    def get_candidate_counts(self, candidate_ids: list[int]) -> dict[int, int]:
+    @staticmethod
+    def slot_counts_from_state(decoded: dict[bytes, int | bytes]) -> dict[int, int]:
+        # Lowest precedence first so `cand_<u64>` keys win over the legacy text formats.
+        legacy: dict[int, int] = {}
+        binary: dict[int, int] = {}
+        for key, value in decoded.items():
+            if not isinstance(value, int):
+                continue
+            if key.startswith(b"cand_") and len(key) == 13:
+                binary[int.from_bytes(key[5:], "big")] = value
+            text = key.decode("utf-8", errors="ignore")
+            if text.startswith("cand_") and text[5:].isdigit():
+                legacy.setdefault(int(text[5:]), value)
+            elif text.startswith("candidate_") and text.endswith("_count") and text[10:-6].isdigit():
+                legacy[int(text[10:-6])] = value
+        legacy.update(binary)
+        return legacy
+
+    @staticmethod
+    def slot_counts_from_box(value: bytes) -> dict[int, int]:
+        counts: dict[int, int] = {}
+        for slot in range(1, len(value) // 8):
+            stored = int.from_bytes(value[slot * 8 : slot * 8 + 8], "big")
+            if stored:
+                counts[slot] = stored - 1
+        return counts
+
+    def fetch_slot_counts(self, election_id: str | None = None) -> dict[int, int]:
+        # Tallies are keyed by each candidate's per-election slot, not its database id;
+        # every registered slot appears, including those of deleted candidates.
+        if TALLY_STORAGE == "box":
+            # One box read returns every tally, however many candidates are registered.
+            box = self.algod.application_box_by_name(self.app_id, tally_box_name(election_id))
+            return self.slot_counts_from_box(base64.b64decode(box["value"]))
         app_info = self.algod.application_info(self.app_id)
         global_state = app_info["params"].get("global-state", [])
-        decoded = self._decode_global_state(global_state)
-        result: dict[int, int] = {}
-        for cid in candidate_ids:
-            key_binary = b"cand_" + int(cid).to_bytes(8, "big")
-            key_legacy_1 = f"candidate_{cid}_count".encode("utf-8")
-            key_legacy_2 = f"cand_{cid}".encode("utf-8")
-            value = decoded.get(key_binary)
-            if value is None:
-                value = decoded.get(key_legacy_1)
-            if value is None:
-                value = decoded.get(key_legacy_2)
-            result[cid] = int(value) if isinstance(value, int) else 0
-        return result
+        return self.slot_counts_from_state(self._decode_global_state(global_state))
+
+    def get_candidate_counts(self, candidate_slots: dict[int, int], election_id: str | None = None) -> dict[int, int]:
+        return candidate_counts_for_slots(self.fetch_slot_counts(election_id), candidate_slots)
 
     def _lookup_tx(self, tx_id: str) -> dict[str, Any]:
         if self.indexer:
@@ -158,21 +215,33 @@ class AlgorandGovernanceClient:
         }
 
     def anchor_note_hash(self, digest_hex: str) -> dict[str, int | str]:
-        sp = self.algod.suggested_params()
+        sp = SUGGESTED_PARAMS_CACHE.get(self.algod)
         note_bytes = digest_hex.encode("utf-8")
-        txn = transaction.PaymentTxn(
-            sender=self.sender,
-            sp=sp,
-            receiver=self.sender,
-            amt=0,
-            note=note_bytes,
-        )
-        signed = txn.sign(self.private_key)
-        tx_id = self.algod.send_transaction(signed)
+        with self.signers.signer() as acct:
+            txn = transaction.PaymentTxn(
+                sender=acct.address,
+                sp=sp,
+                receiver=acct.address,
+                amt=0,
+                note=note_bytes,
+            )
+            tx_id = self.signers.send(self.algod, acct, txn.sign(acct.private_key))
         pending = self.wait_for_confirmation(tx_id)
         confirmed_round = int(pending.get("confirmed-round", 0))
         return {"tx_id": tx_id, "confirmed_round": confirmed_round}
 
+    def scan_sender_notes(self, min_round: int | None = None, max_round: int | None = None) -> tuple[dict[str, dict[str, Any]], int]:
+        if not self.indexer:
+            raise RuntimeError("ALGORAND_INDEXER_ADDRESS is required for bulk note scans")
+        # Anchors are spread over every pool account, so each sender's history is scanned.
+        notes: dict[str, dict[str, Any]] = {}
+        pages = 0
+        for address in self.signers.addresses:
+            sender_notes, sender_pages = scan_sender_notes(self.indexer, address, min_round=min_round, max_round=max_round)
+            notes.update(sender_notes)
+            pages += sender_pages
+        return notes, pages
+
     def fetch_note_text(self, tx_id: str) -> str | None:
         tx = self._lookup_tx(tx_id)
         if "note" in tx:
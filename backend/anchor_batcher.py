@@ -0,0 +1,141 @@
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from psycopg2.extras import execute_batch
+
+from db import db_cursor
+from merkle import build_merkle_tree
+
+ANCHOR_BATCH_WINDOW_SECONDS = float(os.getenv("ANCHOR_BATCH_WINDOW_SECONDS", "2"))
+ANCHOR_BATCH_SWEEP_SECONDS = float(os.getenv("ANCHOR_BATCH_SWEEP_SECONDS", "30"))
+ANCHOR_BATCH_MAX_LEAVES = int(os.getenv("ANCHOR_BATCH_MAX_LEAVES", "4096"))
+ANCHOR_BATCH_CLAIM_TIMEOUT_SECONDS = float(os.getenv("ANCHOR_BATCH_CLAIM_TIMEOUT_SECONDS", "600"))
+
+
+@dataclass(frozen=True)
+class AnchorTable:
+    table: str
+    hash_column: str
+    tx_column: str
+    round_column: str | None
+    pending_filter: str
+
+
+class MerkleAnchorBatcher:
+    def __init__(
+        self,
+        target: AnchorTable,
+        anchor: Callable[[str], tuple[str, int | None]],
+        window_seconds: float = ANCHOR_BATCH_WINDOW_SECONDS,
+        sweep_seconds: float = ANCHOR_BATCH_SWEEP_SECONDS,
+        max_leaves: int = ANCHOR_BATCH_MAX_LEAVES,
+        claim_timeout_seconds: float = ANCHOR_BATCH_CLAIM_TIMEOUT_SECONDS,
+    ) -> None:
+        self._target = target
+        self._anchor = anchor
+        self._window_seconds = max(0.0, window_seconds)
+        self._sweep_seconds = max(1.0, sweep_seconds)
+        self._max_leaves = max(1, max_leaves)
+        self._claim_timeout = max(1.0, claim_timeout_seconds)
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def notify(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f"merkle-anchor-{self._target.table}",
+                    daemon=True,
+                )
+                self._thread.start()
+        self._wake.set()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(timeout=self._sweep_seconds)
+            self._wake.clear()
+            if self._window_seconds:
+                time.sleep(self._window_seconds)
+            try:
+                while self.flush()["anchored_count"] >= self._max_leaves:
+                    pass
+            except Exception:
+                pass
+
+    def flush(self, max_leaves: int | None = None) -> dict[str, Any]:
+        target = self._target
+        with db_cursor() as (conn, cur):
+            # Leaves are claimed and committed before anchoring, so no row lock or pooled connection
+            # is held while the transaction confirms. A worker that dies leaves a claim that expires.
+            cur.execute(
+                f"""
+                UPDATE {target.table}
+                SET anchor_claimed_at = NOW()
+                WHERE id IN (
+                    SELECT id
+                    FROM {target.table}
+                    WHERE {target.pending_filter}
+                      AND (anchor_claimed_at IS NULL OR anchor_claimed_at < NOW() - make_interval(secs => %s))
+                    ORDER BY id
+                    LIMIT %s
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING id, {target.hash_column}
+                """,
+                (self._claim_timeout, max_leaves or self._max_leaves),
+            )
+            rows = sorted(cur.fetchall())
+            conn.commit()
+        if not rows:
+            return {"pending_checked": 0, "anchored_count": 0, "merkle_root": None, "tx_id": None}
+
+        root, proofs = build_merkle_tree([row[1] for row in rows])
+        try:
+            tx_id, confirmed_round = self._anchor(root)
+        except Exception:
+            try:
+                with db_cursor() as (conn, cur):
+                    cur.execute(
+                        f"UPDATE {target.table} SET anchor_claimed_at = NULL WHERE id = ANY(%s)",
+                        ([row[0] for row in rows],),
+                    )
+                    conn.commit()
+            except Exception:
+                pass
+            raise
+
+        assignments = ""
+        if target.round_column:
+            assignments = f", {target.round_column} = %(round)s"
+        with db_cursor() as (conn, cur):
+            execute_batch(
+                cur,
+                f"""
+                UPDATE {target.table}
+                SET {target.tx_column} = %(tx_id)s{assignments},
+                    merkle_root = %(root)s,
+                    merkle_leaf_index = %(leaf_index)s,
+                    merkle_proof = %(proof)s,
+                    anchor_claimed_at = NULL
+                WHERE id = %(id)s
+                """,
+                [
+                    {
+                        "id": row[0],
+                        "tx_id": tx_id,
+                        "round": confirmed_round,
+                        "root": root,
+                        "leaf_index": idx,
+                        "proof": json.dumps(proofs[idx]),
+                    }
+                    for idx, row in enumerate(rows)
+                ],
+            )
+            conn.commit()
+        return {"pending_checked": len(rows), "anchored_count": len(rows), "merkle_root": root, "tx_id": tx_id}
@@ -0,0 +1,200 @@
+import base64
+import csv
+import io
+import json
+import os
+
+from algorand_anchor import ANCHOR_NOTE_PREFIX, _indexer_client, parse_anchor_note
+from db import db_cursor
+
+ANCHOR_MIRROR_CURSOR_KEY = "anchor_mirror_cursor"
+MIRROR_COLUMNS = ("tx_id", "sender", "confirmed_round", "round_time", "note_ref", "payload_hash")
+ANCHOR_MIRROR_PAGE_SIZE = int(os.getenv("ANCHOR_MIRROR_PAGE_SIZE", "1000"))
+ANCHOR_MIRROR_MAX_PAGES = int(os.getenv("ANCHOR_MIRROR_MAX_PAGES", "200"))
+
+
+def _read_cursor(cur):
+    cur.execute("SELECT value FROM governance_state WHERE key = %s FOR UPDATE", (ANCHOR_MIRROR_CURSOR_KEY,))
+    row = cur.fetchone()
+    if not row:
+        return {"min_round": 0, "next_token": None, "last_round": 0, "synced_round": 0}
+    return json.loads(row[0])
+
+
+def _synced_round(cursor):
+    if "synced_round" in cursor:
+        return int(cursor["synced_round"] or 0)
+    # Cursors written before the watermark existed: a finished pass has seen all of last_round.
+    if cursor.get("next_token"):
+        return max(0, int(cursor.get("min_round") or 0) - 1)
+    return int(cursor.get("last_round") or 0)
+
+
+def mirror_synced_round(cur):
+    cur.execute("SELECT value FROM governance_state WHERE key = %s", (ANCHOR_MIRROR_CURSOR_KEY,))
+    row = cur.fetchone()
+    return _synced_round(json.loads(row[0])) if row else 0
+
+
+def _write_cursor(cur, cursor):
+    cur.execute(
+        """
+        INSERT INTO governance_state (key, value, updated_at)
+        VALUES (%s, %s, NOW())
+        ON CONFLICT (key)
+        DO UPDATE SET value = EXCLUDED.value, updated_at = NOW();
+        """,
+        (ANCHOR_MIRROR_CURSOR_KEY, json.dumps(cursor, sort_keys=True)),
+    )
+
+
+def _mirror_rows(txns, sender_wallet):
+    rows = []
+    for tx in txns:
+        note_b64 = tx.get("note")
+        if not note_b64:
+            continue
+        try:
+            note_text = base64.b64decode(note_b64).decode("utf-8")
+        except Exception:
+            continue
+        note_ref, payload_hash = parse_anchor_note(note_text)
+        if not payload_hash:
+            continue
+        rows.append(
+            {
+                "tx_id": tx["id"],
+                "sender": sender_wallet,
+                "confirmed_round": tx.get("confirmed-round"),
+                "round_time": tx.get("round-time"),
+                "note_ref": note_ref,
+                "payload_hash": payload_hash,
+            }
+        )
+    return rows
+
+
+def _copy_into_mirror(cur, rows):
+    # Pages are streamed into a session-local staging table with COPY and merged in one statement.
+    cur.execute(
+        """
+        CREATE TEMP TABLE IF NOT EXISTS anchor_notes_staging (
+            tx_id TEXT,
+            sender TEXT,
+            confirmed_round BIGINT,
+            round_time BIGINT,
+            note_ref TEXT,
+            payload_hash TEXT
+        ) ON COMMIT DELETE ROWS
+        """
+    )
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([row[column] if row[column] is not None else "" for column in MIRROR_COLUMNS])
+    buffer.seek(0)
+    cur.copy_expert(
+        f"COPY anchor_notes_staging ({', '.join(MIRROR_COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+        buffer,
+    )
+    cur.execute(
+        f"""
+        INSERT INTO anchor_notes ({', '.join(MIRROR_COLUMNS)})
+        SELECT {', '.join(MIRROR_COLUMNS)} FROM anchor_notes_staging
+        ON CONFLICT (tx_id) DO NOTHING
+        """
+    )
+    return cur.rowcount
+
+
+def sync_anchor_mirror(max_pages=ANCHOR_MIRROR_MAX_PAGES):
+    sender_wallet = os.getenv("ANCHOR_SENDER")
+    if not sender_wallet:
+        raise RuntimeError("ANCHOR_SENDER is not set")
+    client = _indexer_client()
+
+    pages = 0
+    inserted = 0
+    with db_cursor() as (conn, cur):
+        cur.execute("SELECT pg_try_advisory_lock(hashtext('anchor_mirror_sync'))")
+        if not cur.fetchone()[0]:
+            conn.rollback()
+            return {"pages": 0, "inserted": 0, "skipped": True}
+        conn.commit()
+        try:
+            while pages < max_pages:
+                cursor = _read_cursor(cur)
+                query = {
+                    "address": sender_wallet,
+                    "address_role": "sender",
+                    "tx_type": "pay",
+                    "note_prefix": ANCHOR_NOTE_PREFIX.encode("utf-8"),
+                    "limit": ANCHOR_MIRROR_PAGE_SIZE,
+                }
+                if cursor.get("min_round"):
+                    query["min_round"] = cursor["min_round"]
+                if cursor.get("next_token"):
+                    query["next_page"] = cursor["next_token"]
+                res = client.search_transactions(**query)
+                pages += 1
+
+                txns = res.get("transactions", [])
+                rows = _mirror_rows(txns, sender_wallet)
+                if rows:
+                    inserted += _copy_into_mirror(cur, rows)
+
+                last_round = max(
+                    [int(cursor.get("last_round") or 0)] + [int(tx.get("confirmed-round") or 0) for tx in txns]
+                )
+                next_token = res.get("next-token") if txns else None
+                if next_token:
+                    # Pages end anywhere inside a round, so only the rounds before the last one seen are complete.
+                    cursor = {
+                        "min_round": cursor.get("min_round") or 0,
+                        "next_token": next_token,
+                        "last_round": last_round,
+                        "synced_round": max(_synced_round(cursor), last_round - 1),
+                    }
+                else:
+                    # The indexer publishes whole rounds, so everything up to its current round has been seen.
+                    caught_up = max(last_round, int(res.get("current-round") or 0))
+                    cursor = {"min_round": caught_up + 1, "next_token": None, "last_round": caught_up, "synced_round": caught_up}
+                _write_cursor(cur, cursor)
+                conn.commit()
+                if not next_token:
+                    break
+        finally:
+            conn.rollback()
+            cur.execute("SELECT pg_advisory_unlock(hashtext('anchor_mirror_sync'))")
+            conn.commit()
+
+    return {"pages": pages, "inserted": inserted, "skipped": False}
+
+
+def mirror_status():
+    with db_cursor() as (conn, cur):
+        cur.execute("SELECT value, updated_at FROM governance_state WHERE key = %s", (ANCHOR_MIRROR_CURSOR_KEY,))
+        row = cur.fetchone()
+        cur.execute("SELECT COUNT(*), MAX(confirmed_round) FROM anchor_notes")
+        count, max_round = cur.fetchone()
+    return {
+        "cursor": json.loads(row[0]) if row else None,
+        "cursor_updated_at": row[1].isoformat() if row and row[1] else None,
+        "synced_round": _synced_round(json.loads(row[0])) if row else 0,
+        "mirrored_notes": int(count or 0),
+        "max_mirrored_round": max_round,
+    }
+
+
+def find_anchor(payload_hash, voter_ref=None):
+    with db_cursor() as (conn, cur):
+        cur.execute(
+            """
+            SELECT tx_id, note_ref, confirmed_round
+            FROM anchor_notes
+            WHERE payload_hash = %s AND (%s::TEXT IS NULL OR note_ref = %s)
+            ORDER BY confirmed_round
+            """,
+            (payload_hash, voter_ref, voter_ref),
+        )
+        return [{"tx_id": r[0], "voter_ref": r[1], "confirmed_round": r[2]} for r in cur.fetchall()]
@@ -5,34 +5,114 @@ import random
 import time
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Any
+from typing import Any, Iterator
 
 import psycopg2
-from algosdk import account, mnemonic, transaction
+from algosdk import transaction
+from algosdk.logic import get_application_address
 from algosdk.v2client import algod
 from dotenv import load_dotenv
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 from flask_cors import CORS
 from werkzeug.security import check_password_hash, generate_password_hash
 
 load_dotenv()
 
+from admin_audit import (
+    GOVERNANCE_SUMMARY_REFRESHER,
+    _deterministic_hash,
+    get_governance_audit_summary,
+    log_admin_event,
+)
 from ai import check_anomaly
-from algorand_client import AlgorandGovernanceClient
-from db import get_connection, release_connection
-from email_service import send_verification_otp
+from algorand_anchor import ANCHOR_NOTE_PREFIX, anchor_decision_hash, build_anchor_note, fetch_tx_note, parse_anchor_note
+from algorand_client import (
+    TALLY_BOX_SLOTS,
+    TALLY_STORAGE,
+    AlgorandGovernanceClient,
+    election_app_args,
+    supports_multiple_elections,
+    tally_box_mbr,
+    voter_box_name,
+    with_tally_box_refs,
+)
+from anchor_batcher import AnchorTable, MerkleAnchorBatcher
+from admin_feeds import (
+    ADMIN_FEED_DEFAULT_LIMIT,
+    FEEDS,
+    decode_cursor,
+    iter_feed_array,
+    iter_feed_export,
+    parse_feed_filters,
+    read_feed_page,
+)
+from attempt_rescorer import rescore_vote_attempts
+from anchor_mirror import find_anchor, mirror_status, sync_anchor_mirror
+from audit_reconciler import AuditReconciler
+from block_follower import follower_for, follower_stats
+from bulk_verifier import verify_anchors_in_bulk
+from candidate_tallies import (
+    CandidateTallyReconciler,
+    ensure_candidate_tallies,
+    read_election_results,
+    tally_status,
+)
+from db import db_connection, db_cursor, pool_metrics
+from feature_store import FeatureStore
+from email_service import MAIL_QUEUE, send_registration_success_email, send_verification_otp
+from fairness_engine import (
+    SNAPSHOT_WINDOW_SECONDS,
+    FairnessSnapshotScheduler,
+    rebuild_fairness_counters,
+    sync_vote_verifications,
+)
+from merkle import verify_merkle_proof
+from otp_store import (
+    OTP_EXPIRED,
+    OTP_NOT_FOUND,
+    OTP_OK,
+    OTP_TOO_MANY_ATTEMPTS,
+    create_otp_store,
+)
+from params_cache import SUGGESTED_PARAMS_CACHE
+from rate_limiter import RateLimit, create_rate_limiter
 from session_utils import create_session_token, verify_session_token
+from signer_pool import SignerPool, load_signer_pool
+from tally_cache import tally_cache_for, tally_cache_stats
+from vote_batcher import VOTE_BATCH_MAX_SIZE, VOTE_BATCH_SUBMIT_TIMEOUT_SECONDS, VoteGroupBatcher
+from vote_pipeline import (
+    PendingVote,
+    VoteConfirmationWorker,
+    mark_vote_failed,
+    mark_vote_submitted,
+    record_confirmed_vote,
+)
 
 app = Flask(__name__)
 CORS(app)
 
-OTP_STORE: dict[str, dict[str, Any]] = {}
+OTP_STORE = create_otp_store()
 OTP_EXPIRY_MINUTES = 10
 OTP_MAX_ATTEMPTS = 3
 OTP_RESEND_COOLDOWN_SECONDS = 30
 ELECTION_ID = os.getenv("ELECTION_ID", "default-election")
+FAIRNESS_DEFAULT_ELECTION_ID = ELECTION_ID
 SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", "3600"))
 IDEMPOTENCY_PENDING_SECONDS = int(os.getenv("IDEMPOTENCY_PENDING_SECONDS", "20"))
+FAIRNESS_WAIT_TIMEOUT_SECONDS = int(os.getenv("FAIRNESS_WAIT_TIMEOUT_SECONDS", "120"))
+VOTE_RATE_WINDOW_SECONDS = int(os.getenv("VOTE_RATE_WINDOW_SECONDS", "300"))
+VOTE_RATE_LIMIT = int(os.getenv("VOTE_RATE_LIMIT", "3"))
+RATE_LIMITER = create_rate_limiter()
+FEATURE_STORE = FeatureStore()
+VOTE_RATE = RateLimit("vote", VOTE_RATE_LIMIT, VOTE_RATE_WINDOW_SECONDS)
+LOGIN_RATE = RateLimit(
+    "login", int(os.getenv("LOGIN_RATE_LIMIT", "10")), int(os.getenv("LOGIN_RATE_WINDOW_SECONDS", "300"))
+)
+REGISTER_RATE = RateLimit(
+    "register_start", int(os.getenv("REGISTER_RATE_LIMIT", "5")), int(os.getenv("REGISTER_RATE_WINDOW_SECONDS", "3600"))
+)
+VOTE_SUBMISSION_MODE = os.getenv("VOTE_SUBMISSION_MODE", "sync").strip().lower()
+VOTE_CONFIRMATION_WORKERS = int(os.getenv("VOTE_CONFIRMATION_WORKERS", "2"))
 
 ALGOD_ADDRESS = os.getenv("ALGORAND_ALGOD_ADDRESS")
 ALGOD_TOKEN = os.getenv("ALGORAND_ALGOD_TOKEN", "")
@@ -43,6 +123,7 @@ ALGOD_HEADERS = {"X-API-Key": ALGOD_TOKEN} if ALGOD_TOKEN else {}
 algod_client: algod.AlgodClient | None = None
 private_key: str | None = None
 sender_address: str | None = None
+SIGNER_POOL: SignerPool | None = None
 ALGOD_SETUP_ERROR: str | None = None
 try:
     if not ALGOD_ADDRESS:
@@ -52,8 +133,9 @@ try:
     if ALGOD_APP_ID <= 0:
         raise RuntimeError("ALGORAND_APP_ID must be a positive integer")
     algod_client = algod.AlgodClient(ALGOD_TOKEN, ALGOD_ADDRESS, headers=ALGOD_HEADERS)
-    private_key = mnemonic.to_private_key(SERVICE_MNEMONIC)
-    sender_address = account.address_from_private_key(private_key)
+    SIGNER_POOL = load_signer_pool()
+    private_key = SIGNER_POOL.primary.private_key
+    sender_address = SIGNER_POOL.primary.address
 except Exception as exc:
     ALGOD_SETUP_ERROR = str(exc)
 
@@ -65,10 +147,9 @@ except Exception as exc:  # noqa: BLE001
     ALGO_INIT_ERROR = str(exc)
 
 
+
 def ensure_schema() -> None:
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
+    with db_cursor() as (conn, cur):
         cur.execute(
             """
             CREATE TABLE IF NOT EXISTS users (
@@ -87,6 +168,14 @@ def ensure_schema() -> None:
                 name TEXT NOT NULL
             );
 
+            CREATE TABLE IF NOT EXISTS elections (
+                election_id TEXT PRIMARY KEY,
+                title TEXT,
+                deadline_ts BIGINT,
+                tx_id TEXT,
+                created_at TIMESTAMP DEFAULT NOW()
+            );
+
             CREATE TABLE IF NOT EXISTS votes (
                 id SERIAL PRIMARY KEY,
                 election_id TEXT NOT NULL,
@@ -97,6 +186,9 @@ def ensure_schema() -> None:
                 tx_id TEXT,
                 confirmed_round BIGINT,
                 block_timestamp BIGINT,
+                verification_status TEXT,
+                verified_round BIGINT,
+                verified_at TIMESTAMP,
                 created_at TIMESTAMP DEFAULT NOW()
             );
 
@@ -108,6 +200,7 @@ def ensure_schema() -> None:
                 vote_hash TEXT NOT NULL,
                 status TEXT NOT NULL,
                 tx_id TEXT,
+                wallet TEXT,
                 last_error TEXT,
                 created_at TIMESTAMP DEFAULT NOW(),
                 updated_at TIMESTAMP DEFAULT NOW(),
@@ -140,9 +233,51 @@ def ensure_schema() -> None:
                 entry_hash TEXT NOT NULL,
                 anchored_tx_id TEXT,
                 anchored_round BIGINT,
+                merkle_root TEXT,
+                merkle_leaf_index INTEGER,
+                merkle_proof TEXT,
+                created_at TIMESTAMP DEFAULT NOW()
+            );
+
+            CREATE TABLE IF NOT EXISTS admin_audit_log (
+                id SERIAL PRIMARY KEY,
+                admin_id TEXT NOT NULL,
+                event_type TEXT NOT NULL,
+                event_details TEXT,
+                risk_level TEXT NOT NULL,
+                decision_hash TEXT,
+                algorand_tx_id TEXT,
+                merkle_root TEXT,
+                merkle_leaf_index INTEGER,
+                merkle_proof TEXT,
                 created_at TIMESTAMP DEFAULT NOW()
             );
 
+            CREATE TABLE IF NOT EXISTS anchor_notes (
+                tx_id TEXT PRIMARY KEY,
+                sender TEXT NOT NULL,
+                confirmed_round BIGINT NOT NULL,
+                round_time BIGINT,
+                note_ref TEXT NOT NULL,
+                payload_hash TEXT NOT NULL,
+                mirrored_at TIMESTAMP DEFAULT NOW()
+            );
+
+            CREATE TABLE IF NOT EXISTS admin_anchor_unmatched (
+                payload_hash TEXT PRIMARY KEY,
+                tx_id TEXT,
+                confirmed_round BIGINT,
+                first_seen_at TIMESTAMP DEFAULT NOW()
+            );
+
+            CREATE UNLOGGED TABLE IF NOT EXISTS otp_codes (
+                otp_key TEXT PRIMARY KEY,
+                otp_hash TEXT NOT NULL,
+                expires_at TIMESTAMPTZ NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_sent TIMESTAMPTZ NOT NULL
+            );
+
             CREATE TABLE IF NOT EXISTS governance_state (
                 key TEXT PRIMARY KEY,
                 value TEXT NOT NULL,
@@ -156,6 +291,8 @@ def ensure_schema() -> None:
                 tx_id TEXT,
                 round BIGINT,
                 score NUMERIC NOT NULL,
+                trigger TEXT,
+                coalesced_count INTEGER,
                 created_at TIMESTAMP DEFAULT NOW()
             );
             """
@@ -167,11 +304,51 @@ def ensure_schema() -> None:
         cur.execute("ALTER TABLE votes ADD COLUMN IF NOT EXISTS tx_id TEXT;")
         cur.execute("ALTER TABLE votes ADD COLUMN IF NOT EXISTS confirmed_round BIGINT;")
         cur.execute("ALTER TABLE votes ADD COLUMN IF NOT EXISTS block_timestamp BIGINT;")
+        cur.execute("ALTER TABLE votes ADD COLUMN IF NOT EXISTS verification_status TEXT;")
+        cur.execute("ALTER TABLE votes ADD COLUMN IF NOT EXISTS verified_round BIGINT;")
+        cur.execute("ALTER TABLE votes ADD COLUMN IF NOT EXISTS verified_at TIMESTAMP;")
         cur.execute("ALTER TABLE votes ALTER COLUMN candidate_id DROP NOT NULL;")
         cur.execute("ALTER TABLE pending_votes ALTER COLUMN candidate_id DROP NOT NULL;")
+        cur.execute("ALTER TABLE pending_votes ADD COLUMN IF NOT EXISTS wallet TEXT;")
+        cur.execute("ALTER TABLE pending_votes ADD COLUMN IF NOT EXISTS last_valid_round BIGINT;")
+        cur.execute("ALTER TABLE fairness_snapshots ADD COLUMN IF NOT EXISTS trigger TEXT;")
+        cur.execute("ALTER TABLE fairness_snapshots ADD COLUMN IF NOT EXISTS coalesced_count INTEGER;")
+        # Snapshots taken before fairness was tracked per election belong to the default election.
+        cur.execute("ALTER TABLE fairness_snapshots ADD COLUMN IF NOT EXISTS election_id TEXT;")
+        cur.execute("UPDATE fairness_snapshots SET election_id = %s WHERE election_id IS NULL;", (ELECTION_ID,))
+        cur.execute("CREATE INDEX IF NOT EXISTS fairness_snapshots_election ON fairness_snapshots (election_id, id);")
+        for audit_table in ("audit_events", "admin_audit_log"):
+            cur.execute(f"ALTER TABLE {audit_table} ADD COLUMN IF NOT EXISTS merkle_root TEXT;")
+            cur.execute(f"ALTER TABLE {audit_table} ADD COLUMN IF NOT EXISTS merkle_leaf_index INTEGER;")
+            cur.execute(f"ALTER TABLE {audit_table} ADD COLUMN IF NOT EXISTS merkle_proof TEXT;")
+            cur.execute(f"ALTER TABLE {audit_table} ADD COLUMN IF NOT EXISTS anchor_claimed_at TIMESTAMP;")
         cur.execute("ALTER TABLE users ADD COLUMN IF NOT EXISTS blocked_until TIMESTAMP;")
         cur.execute("ALTER TABLE users ADD COLUMN IF NOT EXISTS email_verified BOOLEAN DEFAULT FALSE;")
         cur.execute("ALTER TABLE users ADD COLUMN IF NOT EXISTS password_hash TEXT;")
+        cur.execute("ALTER TABLE candidates ADD COLUMN IF NOT EXISTS election_id TEXT;")
+        cur.execute("UPDATE candidates SET election_id = %s WHERE election_id IS NULL;", (ELECTION_ID,))
+        cur.execute("CREATE INDEX IF NOT EXISTS candidates_election ON candidates (election_id, name);")
+        # Candidates registered before per-election slots were tallied on chain under their id.
+        cur.execute("ALTER TABLE candidates ADD COLUMN IF NOT EXISTS slot INTEGER;")
+        cur.execute("UPDATE candidates SET slot = id WHERE slot IS NULL;")
+        cur.execute("ALTER TABLE candidates ALTER COLUMN slot SET NOT NULL;")
+        cur.execute("CREATE UNIQUE INDEX IF NOT EXISTS candidates_election_slot ON candidates (election_id, slot);")
+        cur.execute("CREATE INDEX IF NOT EXISTS ai_flags_feed ON ai_flags (created_at DESC, id DESC);")
+        cur.execute("CREATE INDEX IF NOT EXISTS ai_flags_wallet_feed ON ai_flags (wallet, created_at DESC, id DESC);")
+        cur.execute("CREATE INDEX IF NOT EXISTS audit_events_feed ON audit_events (created_at DESC, id DESC);")
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS audit_events_type_feed ON audit_events (event_type, created_at DESC, id DESC);"
+        )
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS audit_events_severity_feed ON audit_events (severity, created_at DESC, id DESC);"
+        )
+        cur.execute(
+            """
+            CREATE INDEX IF NOT EXISTS audit_events_email_feed
+            ON audit_events (((payload_json::jsonb #>> '{payload,email}')), created_at DESC, id DESC);
+            """
+        )
+        cur.execute("INSERT INTO elections (election_id) VALUES (%s) ON CONFLICT (election_id) DO NOTHING;", (ELECTION_ID,))
         cur.execute("DROP INDEX IF EXISTS votes_wallet_unique;")
         cur.execute(
             """
@@ -194,6 +371,162 @@ def ensure_schema() -> None:
             WHERE tx_id IS NOT NULL;
             """
         )
+        cur.execute(
+            """
+            CREATE INDEX IF NOT EXISTS audit_events_pending_anchor
+            ON audit_events (id)
+            WHERE anchored_tx_id IS NULL AND severity IN ('HIGH', 'CRITICAL');
+            """
+        )
+        cur.execute(
+            """
+            CREATE INDEX IF NOT EXISTS admin_audit_log_pending_anchor
+            ON admin_audit_log (id)
+            WHERE algorand_tx_id IS NULL AND risk_level IN ('HIGH', 'CRITICAL');
+            """
+        )
+        cur.execute("CREATE INDEX IF NOT EXISTS otp_codes_expires_at ON otp_codes (expires_at);")
+        cur.execute(
+            """
+            CREATE UNLOGGED TABLE IF NOT EXISTS rate_limit_counters (
+                rate_key TEXT PRIMARY KEY,
+                window_start BIGINT NOT NULL,
+                current_count INTEGER NOT NULL,
+                previous_count INTEGER NOT NULL,
+                expires_at BIGINT NOT NULL
+            );
+            """
+        )
+        cur.execute("CREATE INDEX IF NOT EXISTS rate_limit_counters_expires_at ON rate_limit_counters (expires_at);")
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS identity_features (
+                identity TEXT PRIMARY KEY,
+                attempts BIGINT NOT NULL,
+                last_seen DOUBLE PRECISION,
+                gap_count BIGINT NOT NULL,
+                gap_mean DOUBLE PRECISION NOT NULL,
+                gap_m2 DOUBLE PRECISION NOT NULL,
+                recent_json TEXT NOT NULL,
+                ip_hashes_json TEXT NOT NULL,
+                device_hashes_json TEXT NOT NULL,
+                updated_at TIMESTAMP DEFAULT NOW()
+            );
+            """
+        )
+        cur.execute("CREATE INDEX IF NOT EXISTS identity_features_last_seen ON identity_features (last_seen);")
+        cur.execute("CREATE INDEX IF NOT EXISTS vote_attempts_wallet_time ON vote_attempts (wallet, timestamp);")
+        cur.execute("CREATE INDEX IF NOT EXISTS admin_audit_log_decision_hash ON admin_audit_log (decision_hash);")
+        cur.execute("CREATE INDEX IF NOT EXISTS audit_events_entry_hash ON audit_events (entry_hash);")
+        cur.execute("CREATE INDEX IF NOT EXISTS anchor_notes_ref_round ON anchor_notes (note_ref, confirmed_round);")
+        cur.execute("CREATE INDEX IF NOT EXISTS anchor_notes_payload_hash ON anchor_notes (payload_hash);")
+        cur.execute(
+            """
+            CREATE INDEX IF NOT EXISTS admin_audit_log_anchored_hash
+            ON admin_audit_log ((COALESCE(merkle_root, decision_hash)))
+            WHERE algorand_tx_id IS NOT NULL;
+            """
+        )
+        cur.execute(
+            """
+            CREATE INDEX IF NOT EXISTS votes_pending_verification
+            ON votes (election_id, id)
+            WHERE verification_status IS NULL OR verification_status = 'ERROR';
+            """
+        )
+        cur.execute(
+            """
+            CREATE OR REPLACE FUNCTION admit_vote(
+                p_election_id TEXT,
+                p_email TEXT,
+                p_email_hash TEXT,
+                p_candidate_id INTEGER,
+                p_vote_hash TEXT,
+                p_async BOOLEAN,
+                p_pending_seconds INTEGER,
+                p_rate_limited BOOLEAN
+            )
+            RETURNS TABLE (
+                out_decision TEXT, out_tx_id TEXT, out_confirmed_round BIGINT, out_vote_hash TEXT, out_candidate_slot INTEGER
+            )
+            LANGUAGE plpgsql
+            AS $$
+            DECLARE
+                v_blocked_until TIMESTAMP;
+                v_email_verified BOOLEAN;
+                v_status TEXT;
+                v_tx_id TEXT;
+                v_round BIGINT;
+                v_vote_hash TEXT;
+                v_updated_at TIMESTAMP;
+                v_slot INTEGER;
+            BEGIN
+                -- Serialize admissions per voter so concurrent requests cannot both claim the pending slot.
+                PERFORM pg_advisory_xact_lock(hashtext(p_election_id || ':' || p_email_hash));
+
+                SELECT u.blocked_until, u.email_verified INTO v_blocked_until, v_email_verified
+                FROM users u WHERE u.email = p_email;
+                IF NOT FOUND THEN
+                    RETURN QUERY SELECT 'user_not_found'::TEXT, NULL::TEXT, NULL::BIGINT, NULL::TEXT, v_slot;
+                    RETURN;
+                END IF;
+                IF v_blocked_until IS NOT NULL AND v_blocked_until > (NOW() AT TIME ZONE 'UTC') THEN
+                    RETURN QUERY SELECT 'blocked'::TEXT, NULL::TEXT, NULL::BIGINT, NULL::TEXT, v_slot;
+                    RETURN;
+                END IF;
+                IF NOT COALESCE(v_email_verified, FALSE) THEN
+                    RETURN QUERY SELECT 'unverified'::TEXT, NULL::TEXT, NULL::BIGINT, NULL::TEXT, v_slot;
+                    RETURN;
+                END IF;
+                SELECT c.slot INTO v_slot FROM candidates c WHERE c.id = p_candidate_id AND c.election_id = p_election_id;
+                IF NOT FOUND THEN
+                    RETURN QUERY SELECT 'candidate_not_found'::TEXT, NULL::TEXT, NULL::BIGINT, NULL::TEXT, v_slot;
+                    RETURN;
+                END IF;
+
+                SELECT v.tx_id, v.confirmed_round, v.vote_hash INTO v_tx_id, v_round, v_vote_hash
+                FROM votes v WHERE v.election_id = p_election_id AND v.email_hash = p_email_hash;
+                IF FOUND THEN
+                    RETURN QUERY SELECT 'already_voted'::TEXT, v_tx_id, v_round, v_vote_hash, v_slot;
+                    RETURN;
+                END IF;
+
+                SELECT pv.status, pv.tx_id, pv.updated_at, pv.vote_hash INTO v_status, v_tx_id, v_updated_at, v_vote_hash
+                FROM pending_votes pv WHERE pv.election_id = p_election_id AND pv.email_hash = p_email_hash;
+                IF FOUND THEN
+                    IF v_status = 'confirmed' AND v_tx_id IS NOT NULL THEN
+                        RETURN QUERY SELECT 'already_confirmed'::TEXT, v_tx_id, NULL::BIGINT, p_vote_hash, v_slot;
+                        RETURN;
+                    END IF;
+                    IF v_status = 'pending' AND v_tx_id IS NOT NULL AND p_async THEN
+                        RETURN QUERY SELECT 'submitted'::TEXT, v_tx_id, NULL::BIGINT, v_vote_hash, v_slot;
+                        RETURN;
+                    END IF;
+                    IF v_status = 'pending' AND v_updated_at > NOW() - make_interval(secs => p_pending_seconds) THEN
+                        RETURN QUERY SELECT 'in_progress'::TEXT, NULL::TEXT, NULL::BIGINT, NULL::TEXT, v_slot;
+                        RETURN;
+                    END IF;
+                END IF;
+
+                INSERT INTO pending_votes (election_id, email_hash, vote_hash, candidate_id, wallet, status, updated_at)
+                VALUES (p_election_id, p_email_hash, p_vote_hash, p_candidate_id, p_email, 'pending', NOW())
+                ON CONFLICT (election_id, email_hash)
+                DO UPDATE SET vote_hash = EXCLUDED.vote_hash, candidate_id = EXCLUDED.candidate_id, wallet = EXCLUDED.wallet, status = 'pending', tx_id = NULL, updated_at = NOW();
+
+                INSERT INTO vote_attempts (wallet, election_id, result)
+                VALUES (p_email, p_election_id, CASE WHEN p_rate_limited THEN 'flagged' ELSE 'ok' END);
+                IF p_rate_limited THEN
+                    INSERT INTO ai_flags (wallet, reason, severity)
+                    VALUES (p_email, 'Rapid voting attempts detected', 7);
+                    RETURN QUERY SELECT 'rate_limited'::TEXT, NULL::TEXT, NULL::BIGINT, NULL::TEXT, v_slot;
+                    RETURN;
+                END IF;
+
+                RETURN QUERY SELECT 'admitted'::TEXT, NULL::TEXT, NULL::BIGINT, NULL::TEXT, v_slot;
+            END;
+            $$;
+            """
+        )
         cur.execute(
             """
             INSERT INTO governance_state (key, value)
@@ -201,10 +534,19 @@ def ensure_schema() -> None:
             ON CONFLICT (key) DO NOTHING;
             """
         )
+        ensure_candidate_tallies(cur)
+        cur.execute(
+            """
+            UPDATE votes v
+            SET candidate_id = p.candidate_id
+            FROM pending_votes p
+            WHERE v.candidate_id IS NULL
+              AND p.candidate_id IS NOT NULL
+              AND p.election_id = v.election_id
+              AND p.email_hash = v.email_hash
+            """
+        )
         conn.commit()
-    finally:
-        cur.close()
-        release_connection(conn)
 
 
 def canonical_json(data: dict[str, Any]) -> str:
@@ -244,38 +586,175 @@ def _algod_or_error() -> tuple[algod.AlgodClient | None, tuple[dict[str, str], i
 
 
 def wait_for_confirmation(client: algod.AlgodClient, txid: str, timeout: int = 10) -> dict[str, Any]:
-    start_round = client.status()["last-round"]
-    current_round = start_round
-    while current_round < start_round + timeout:
-        pending_txn = client.pending_transaction_info(txid)
-        if pending_txn.get("confirmed-round", 0) > 0:
-            return pending_txn
-        if pending_txn.get("pool-error"):
-            raise RuntimeError(f"Transaction rejected: {pending_txn['pool-error']}")
-        current_round += 1
-        client.status_after_block(current_round)
-    raise TimeoutError("Transaction not confirmed within timeout")
-
-
-def submit_candidate_app_call(method_name: bytes, candidate_id: int, timeout: int = 10) -> dict[str, int | str]:
+    return follower_for(client).wait(txid, timeout)
+
+
+def submit_candidate_app_call(
+    method_name: bytes, candidate_slot: int, election_id: str = ELECTION_ID, timeout: int = 10
+) -> dict[str, int | str]:
     client, err = _algod_or_error()
     if err:
         raise RuntimeError(err[0]["error"])
-    sp = client.suggested_params()
+    sp = SUGGESTED_PARAMS_CACHE.get(client)
     txn = transaction.ApplicationCallTxn(
         sender=sender_address,
         sp=sp,
         index=ALGOD_APP_ID,
         on_complete=transaction.OnComplete.NoOpOC,
-        app_args=[method_name, int(candidate_id).to_bytes(8, "big")],
+        app_args=[method_name, int(candidate_slot).to_bytes(8, "big")] + election_app_args(election_id),
+        boxes=with_tally_box_refs([], election_id),
     )
     signed_txn = txn.sign(private_key)
-    tx_id = client.send_transaction(signed_txn)
+    tx_id = SUGGESTED_PARAMS_CACHE.send(client, signed_txn)
     confirmed_txn = wait_for_confirmation(client, tx_id, timeout=timeout)
     confirmed_round = int(confirmed_txn["confirmed-round"])
     return {"tx_id": tx_id, "confirmed_round": confirmed_round}
 
 
+def submit_election_create(election_id: str, deadline_ts: int, timeout: int = 10) -> dict[str, int | str]:
+    client, err = _algod_or_error()
+    if err:
+        raise RuntimeError(err[0]["error"])
+    sp = SUGGESTED_PARAMS_CACHE.get(client)
+    # The app account pays for the election's tally box, so the MBR travels in the same group.
+    fund_txn = transaction.PaymentTxn(sender_address, sp, get_application_address(ALGOD_APP_ID), tally_box_mbr())
+    create_txn = transaction.ApplicationCallTxn(
+        sender=sender_address,
+        sp=sp,
+        index=ALGOD_APP_ID,
+        on_complete=transaction.OnComplete.NoOpOC,
+        app_args=[b"create_election"] + election_app_args(election_id) + [int(deadline_ts).to_bytes(8, "big")],
+        boxes=with_tally_box_refs([], election_id),
+    )
+    transaction.assign_group_id([fund_txn, create_txn])
+    SUGGESTED_PARAMS_CACHE.send(client, [fund_txn.sign(private_key), create_txn.sign(private_key)])
+    tx_id = create_txn.get_txid()
+    confirmed_txn = wait_for_confirmation(client, tx_id, timeout=timeout)
+    return {"tx_id": tx_id, "confirmed_round": int(confirmed_txn["confirmed-round"])}
+
+
+def _build_vote_txn(
+    email_hash: str, candidate_slot: int, election_id: str, sp: transaction.SuggestedParams, sender: str
+) -> transaction.Transaction:
+    return transaction.ApplicationCallTxn(
+        sender=sender,
+        sp=sp,
+        index=ALGOD_APP_ID,
+        on_complete=transaction.OnComplete.NoOpOC,
+        app_args=[b"vote", bytes.fromhex(email_hash), candidate_slot.to_bytes(8, "big")] + election_app_args(election_id),
+        boxes=with_tally_box_refs([(0, voter_box_name(email_hash, election_id))], election_id),
+    )
+
+
+VOTE_BATCHER = VoteGroupBatcher(
+    params=lambda: SUGGESTED_PARAMS_CACHE.get(algod_client),
+    build_txn=_build_vote_txn,
+    acquire=lambda: SIGNER_POOL.acquire(),
+    release=lambda acct: SIGNER_POOL.release(acct),
+    send=lambda acct, signed: SIGNER_POOL.send(algod_client, acct, signed),
+)
+
+
+def _submit_vote_txn(
+    client: algod.AlgodClient, email_hash: str, candidate_slot: int, election_id: str
+) -> tuple[str, int]:
+    if VOTE_BATCH_MAX_SIZE > 1:
+        # Concurrent votes share an atomic group; each still gets its own txid and validity window to confirm.
+        future = VOTE_BATCHER.submit(email_hash, candidate_slot, election_id)
+        return future.result(timeout=VOTE_BATCH_SUBMIT_TIMEOUT_SECONDS)
+    with SIGNER_POOL.signer(email_hash) as acct:
+        txn = _build_vote_txn(email_hash, candidate_slot, election_id, SUGGESTED_PARAMS_CACHE.get(client), acct.address)
+        return SIGNER_POOL.send(client, acct, txn.sign(acct.private_key)), txn.last_valid_round
+
+
+def _confirm_vote_txn(tx_id: str, last_valid_round: int | None = None) -> tuple[int, int]:
+    timeout = 10
+    if last_valid_round:
+        # The background worker waits out the whole validity window: until then the
+        # transaction can still land, so failing it earlier would invite a second submission.
+        current_round = SUGGESTED_PARAMS_CACHE.get(algod_client).first
+        timeout = max(1, last_valid_round - current_round)
+    confirmed_txn = wait_for_confirmation(algod_client, tx_id, timeout=timeout)
+    confirmed_round = int(confirmed_txn["confirmed-round"])
+    block_timestamp = int(confirmed_txn["block-timestamp"])
+    return confirmed_round, block_timestamp
+
+
+def _on_async_vote_confirmed(job: PendingVote, confirmed_round: int) -> None:
+    recalculate_fairness(job.election_id, "vote_cast", wait=False)
+
+
+def _on_async_vote_failed(job: PendingVote, error: str) -> None:
+    anchor_audit_event(
+        "vote_chain_failure",
+        "CRITICAL",
+        {"email": job.email, "error": error},
+    )
+
+
+VOTE_WORKER = VoteConfirmationWorker(
+    confirm=_confirm_vote_txn,
+    on_confirmed=_on_async_vote_confirmed,
+    on_failed=_on_async_vote_failed,
+    workers=VOTE_CONFIRMATION_WORKERS,
+)
+
+
+def _start_vote_pipeline_if_needed() -> None:
+    if VOTE_SUBMISSION_MODE != "async" or algod_client is None:
+        return
+    if VOTE_WORKER.start():
+        try:
+            VOTE_WORKER.recover_pending()
+        except Exception:
+            pass
+
+
+def _start_signer_monitor_if_needed() -> None:
+    if SIGNER_POOL is None or algod_client is None:
+        return
+    SIGNER_POOL.start_monitor(algod_client)
+
+
+TALLY_RECONCILER = CandidateTallyReconciler(
+    fetch_slot_counts=lambda election_id: tally_cache_for(ALGO_CLIENT, election_id).counts(),
+    on_drift=lambda result: anchor_audit_event("candidate_tally_drift", "HIGH", result),
+)
+
+
+def _start_tally_reconciler_if_needed() -> None:
+    if ALGO_CLIENT is None:
+        return
+    TALLY_RECONCILER.start()
+
+
+def _next_candidate_slot(cur, election_id: str) -> int:
+    # Slots are ordinals within one election. A deleted candidate's slot stays registered on
+    # chain, so the next slot follows both the stored slots and every slot the chain knows.
+    cur.execute("SELECT COALESCE(MAX(slot), 0) FROM candidates WHERE election_id = %s", (election_id,))
+    highest = int(cur.fetchone()[0])
+    if ALGO_CLIENT is not None:
+        highest = max([highest, *ALGO_CLIENT.fetch_slot_counts(election_id)])
+    return highest + 1
+
+
+def _start_governance_monitor_if_needed() -> None:
+    GOVERNANCE_SUMMARY_REFRESHER.start(ELECTION_ID)
+
+
+def _resolve_election_id(raw: Any) -> tuple[str, tuple[dict[str, str], int] | None]:
+    election_id = str(raw or ELECTION_ID).strip()
+    if election_id == ELECTION_ID:
+        return election_id, None
+    if not supports_multiple_elections():
+        return election_id, ({"error": "This deployment only hosts the default election"}, 400)
+    with db_cursor() as (conn, cur):
+        cur.execute("SELECT 1 FROM elections WHERE election_id = %s", (election_id,))
+        if not cur.fetchone():
+            return election_id, ({"error": "Election not found"}, 404)
+    return election_id, None
+
+
 def _extract_session() -> tuple[dict[str, Any] | None, tuple[dict[str, str], int] | None]:
     auth_header = request.headers.get("Authorization", "")
     if not auth_header.startswith("Bearer "):
@@ -314,6 +793,26 @@ def set_governance_status(conn, status: str) -> None:
         cur.close()
 
 
+def _anchor_audit_root(merkle_root: str) -> tuple[str, int | None]:
+    algo, err = _algo_or_error()
+    if err:
+        raise RuntimeError(err[0]["error"])
+    anchored = algo.anchor_note_hash(merkle_root)
+    return str(anchored["tx_id"]), int(anchored["confirmed_round"])
+
+
+AUDIT_EVENT_BATCHER = MerkleAnchorBatcher(
+    AnchorTable(
+        table="audit_events",
+        hash_column="entry_hash",
+        tx_column="anchored_tx_id",
+        round_column="anchored_round",
+        pending_filter="severity IN ('HIGH', 'CRITICAL') AND anchored_tx_id IS NULL",
+    ),
+    _anchor_audit_root,
+)
+
+
 def anchor_audit_event(event_type: str, severity: str, payload: dict[str, Any]) -> None:
     entry = {
         "event_type": event_type,
@@ -323,55 +822,31 @@ def anchor_audit_event(event_type: str, severity: str, payload: dict[str, Any])
     }
     payload_json = canonical_json(entry)
     entry_hash = sha256_hex(payload_json)
-    anchored_tx_id = None
-    anchored_round = None
-
-    if severity in ("HIGH", "CRITICAL") and ALGO_CLIENT:
-        try:
-            anchored = ALGO_CLIENT.anchor_note_hash(entry_hash)
-            anchored_tx_id = str(anchored["tx_id"])
-            anchored_round = int(anchored["confirmed_round"])
-        except Exception:
-            pass
 
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
+    with db_cursor() as (conn, cur):
         cur.execute(
             """
-            INSERT INTO audit_events (event_type, severity, payload_json, entry_hash, anchored_tx_id, anchored_round)
-            VALUES (%s, %s, %s, %s, %s, %s)
+            INSERT INTO audit_events (event_type, severity, payload_json, entry_hash)
+            VALUES (%s, %s, %s, %s)
             """,
-            (event_type, severity, payload_json, entry_hash, anchored_tx_id, anchored_round),
+            (event_type, severity, payload_json, entry_hash),
         )
         conn.commit()
-    finally:
-        cur.close()
-        release_connection(conn)
 
+    # HIGH/CRITICAL entries are anchored in the background as leaves of a shared Merkle root.
+    if severity in ("HIGH", "CRITICAL"):
+        AUDIT_EVENT_BATCHER.notify()
 
-def recalculate_fairness(trigger: str) -> dict[str, Any]:
+
+def _compute_fairness_snapshot(election_id: str, triggers: dict[str, int]) -> dict[str, Any]:
     algo, err = _algo_or_error()
     if err:
         raise RuntimeError(err[0]["error"])
 
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
-        cur.execute("SELECT COUNT(*) FROM votes WHERE tx_id IS NULL OR tx_id = ''")
-        missing_tx = int(cur.fetchone()[0])
-
-        cur.execute("SELECT tx_id FROM votes WHERE tx_id IS NOT NULL")
-        tx_ids = [row[0] for row in cur.fetchall()]
-
-        invalid_tx = 0
-        for tx_id in tx_ids:
-            try:
-                verification = algo.verify_vote_transaction(tx_id)
-                if verification.get("status") != "SUCCESS":
-                    invalid_tx += 1
-            except Exception:
-                invalid_tx += 1
+    with db_cursor() as (conn, cur):
+        verification = sync_vote_verifications(conn, algo, election_id)
+        missing_tx = verification["missing_vote_tx_count"]
+        invalid_tx = verification["invalid_vote_tx_count"]
 
         governance_status = get_governance_status(conn)
         penalty = 0
@@ -388,7 +863,9 @@ def recalculate_fairness(trigger: str) -> dict[str, Any]:
 
         score = max(Decimal("0"), Decimal("100") - Decimal(str(penalty)))
         fairness_payload = {
-            "trigger": trigger,
+            "election_id": election_id,
+            "trigger": next(iter(triggers)),
+            "coalesced_triggers": triggers,
             "computed_at": int(time.time()),
             "missing_vote_tx_count": missing_tx,
             "invalid_vote_tx_count": invalid_tx,
@@ -399,80 +876,103 @@ def recalculate_fairness(trigger: str) -> dict[str, Any]:
         fairness_json = canonical_json(fairness_payload)
         fairness_hash = sha256_hex(fairness_json)
         anchor = algo.anchor_note_hash(fairness_hash)
-        cur.execute(
-            """
-            INSERT INTO fairness_snapshots (fairness_json, fairness_hash, tx_id, round, score)
-            VALUES (%s, %s, %s, %s, %s)
-            """,
-            (
-                fairness_json,
-                fairness_hash,
-                str(anchor["tx_id"]),
-                int(anchor["confirmed_round"]),
-                score,
-            ),
-        )
+        for trigger, trigger_count in triggers.items():
+            cur.execute(
+                """
+                INSERT INTO fairness_snapshots (
+                    election_id, fairness_json, fairness_hash, tx_id, round, score, trigger, coalesced_count
+                )
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                """,
+                (
+                    election_id,
+                    fairness_json,
+                    fairness_hash,
+                    str(anchor["tx_id"]),
+                    int(anchor["confirmed_round"]),
+                    score,
+                    trigger,
+                    trigger_count,
+                ),
+            )
         conn.commit()
         fairness_payload["tx_id"] = str(anchor["tx_id"])
         fairness_payload["confirmed_round"] = int(anchor["confirmed_round"])
         fairness_payload["fairness_hash"] = fairness_hash
         return fairness_payload
-    finally:
-        cur.close()
-        release_connection(conn)
 
 
-def reconcile_audit_anchors() -> dict[str, Any]:
+FAIRNESS_SCHEDULER = FairnessSnapshotScheduler(_compute_fairness_snapshot, window_seconds=SNAPSHOT_WINDOW_SECONDS)
+
+
+def recalculate_fairness(election_id: str, trigger: str, wait: bool = True) -> dict[str, Any] | None:
+    # Triggers for one election arriving within the scheduler window share one snapshot and one anchor transaction.
+    future = FAIRNESS_SCHEDULER.request(election_id, trigger)
+    if not wait:
+        return None
+    return future.result(timeout=FAIRNESS_WAIT_TIMEOUT_SECONDS)
+
+
+def _mark_reconciliation_compromised(details: dict[str, Any]) -> None:
+    with db_connection() as conn:
+        set_governance_status(conn, "COMPROMISED")
+        conn.commit()
+    anchor_audit_event(
+        "governance_compromised",
+        "CRITICAL",
+        {"reason": "Audit reconciliation mismatch", **details},
+    )
+
+
+def iter_audit_reconciliation(full: bool = False) -> Iterator[dict[str, Any]]:
     algo, err = _algo_or_error()
     if err:
         raise RuntimeError(err[0]["error"])
 
-    conn = get_connection()
-    cur = conn.cursor()
-    compromised = False
-    checked = 0
-    try:
-        cur.execute(
-            """
-            SELECT id, payload_json, entry_hash, anchored_tx_id
-            FROM audit_events
-            WHERE severity IN ('HIGH', 'CRITICAL')
-            AND anchored_tx_id IS NOT NULL
-            ORDER BY id
-            """
+    summary: dict[str, Any] = {}
+    for item in AuditReconciler(algo.fetch_note_text).run(full=full):
+        if item["type"] == "summary":
+            summary = item
+        else:
+            yield item
+
+    if summary["compromised"]:
+        _mark_reconciliation_compromised({"status_counts": summary["status_counts"]})
+    # Governance status feeds every election's score, so each one gets a fresh snapshot.
+    with db_cursor() as (conn, cur):
+        cur.execute("SELECT election_id FROM elections")
+        election_ids = {ELECTION_ID, *(row[0] for row in cur.fetchall())}
+    futures = {election_id: FAIRNESS_SCHEDULER.request(election_id, "audit_reconciliation") for election_id in election_ids}
+    summary["fairness"] = {
+        election_id: future.result(timeout=FAIRNESS_WAIT_TIMEOUT_SECONDS) for election_id, future in futures.items()
+    }
+    with db_connection() as conn:
+        summary["governance_status"] = get_governance_status(conn)
+    yield summary
+
+
+def bulk_verify_anchors(min_round: int | None = None, max_round: int | None = None) -> dict[str, Any]:
+    algo, err = _algo_or_error()
+    if err:
+        raise RuntimeError(err[0]["error"])
+
+    result = verify_anchors_in_bulk(algo, min_round=min_round, max_round=max_round)
+    if result["compromised"]:
+        _mark_reconciliation_compromised(
+            {"mode": "bulk", "mismatched": {table: r["mismatched"] for table, r in result["tables"].items()}}
         )
-        rows = cur.fetchall()
-        for row in rows:
-            _, payload_json, stored_hash, anchored_tx_id = row
-            checked += 1
-            recomputed = sha256_hex(payload_json)
-            if recomputed != stored_hash:
-                compromised = True
-                continue
-            try:
-                note_text = algo.fetch_note_text(anchored_tx_id)
-            except Exception:
-                note_text = None
-            if note_text != stored_hash:
-                compromised = True
-
-        if compromised:
-            set_governance_status(conn, "COMPROMISED")
-            conn.commit()
-            anchor_audit_event(
-                "governance_compromised",
-                "CRITICAL",
-                {"reason": "Audit reconciliation mismatch"},
-            )
-        fairness = recalculate_fairness("audit_reconciliation")
-        return {
-            "checked_events": checked,
-            "governance_status": "COMPROMISED" if compromised else get_governance_status(conn),
-            "fairness": fairness,
-        }
-    finally:
-        cur.close()
-        release_connection(conn)
+    with db_connection() as conn:
+        result["governance_status"] = get_governance_status(conn)
+    return result
+
+
+def reconcile_audit_anchors(full: bool = False) -> dict[str, Any]:
+    summary: dict[str, Any] = {}
+    for item in iter_audit_reconciliation(full=full):
+        if item["type"] == "summary":
+            summary = item
+    return summary
+
 
 @app.route("/register/start", methods=["POST"])
 def register_start():
@@ -481,32 +981,25 @@ def register_start():
 
     if not is_valid_vit_email(email):
         return jsonify({"error": "Only @vit.edu emails are allowed."}), 400
+    allowed, _ = RATE_LIMITER.hit(REGISTER_RATE, request.remote_addr or "unknown")
+    if not allowed:
+        return jsonify({"error": "Too many registration requests. Please try again later."}), 429
 
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
+    with db_cursor() as (conn, cur):
         cur.execute("SELECT 1 FROM users WHERE email = %s", (email,))
         if cur.fetchone():
             return jsonify({"error": "Email already registered"}), 409
-    finally:
-        cur.close()
-        release_connection(conn)
 
     key = _otp_key(email)
-    now = datetime.utcnow()
-    existing = OTP_STORE.get(key)
-    if existing and existing.get("last_sent"):
-        cooldown_until = existing["last_sent"] + timedelta(seconds=OTP_RESEND_COOLDOWN_SECONDS)
-        if now < cooldown_until:
-            return jsonify({"error": "Please wait before requesting another code."}), 429
-
     otp = f"{random.randint(0, 999999):06d}"
-    OTP_STORE[key] = {
-        "otp": otp,
-        "expires_at": now + timedelta(minutes=OTP_EXPIRY_MINUTES),
-        "attempts": 0,
-        "last_sent": now,
-    }
+    issued = OTP_STORE.issue(
+        key,
+        otp,
+        ttl_seconds=OTP_EXPIRY_MINUTES * 60,
+        cooldown_seconds=OTP_RESEND_COOLDOWN_SECONDS,
+    )
+    if not issued:
+        return jsonify({"error": "Please wait before requesting another code."}), 429
 
     send_verification_otp(email, otp)
     return jsonify({"message": "Verification code sent"}), 200
@@ -523,45 +1016,32 @@ def register_verify():
     password_hash = generate_password_hash(password)
 
     key = _otp_key(email)
-    record = OTP_STORE.get(key)
-    if not record:
+    otp_status = OTP_STORE.verify(key, otp, OTP_MAX_ATTEMPTS)
+    if otp_status == OTP_NOT_FOUND:
         return jsonify({"error": "Verification code not found. Please request a new code."}), 400
-    if record["attempts"] >= OTP_MAX_ATTEMPTS:
+    if otp_status == OTP_TOO_MANY_ATTEMPTS:
         return jsonify({"error": "Too many attempts. Please request a new code."}), 429
-    if datetime.utcnow() > record["expires_at"]:
+    if otp_status == OTP_EXPIRED:
         return jsonify({"error": "Verification code expired. Please request a new code."}), 400
-    if otp != record["otp"]:
-        record["attempts"] += 1
+    if otp_status != OTP_OK:
         return jsonify({"error": "Invalid verification code."}), 400
 
-    conn = None
-    cur = None
     try:
-        conn = get_connection()
-        cur = conn.cursor()
-        user_ref = _derive_user_ref(email)
-        password_hash = generate_password_hash(password)
+        with db_cursor() as (conn, cur):
+            user_ref = _derive_user_ref(email)
+            password_hash = generate_password_hash(password)
 
-        cur.execute(
-            "INSERT INTO users (email, wallet, password_hash, email_verified) VALUES (%s, %s, %s, %s)",
-            (email, email, password_hash, True),
-        )
-        conn.commit()
+            cur.execute(
+                "INSERT INTO users (email, wallet, password_hash, email_verified) VALUES (%s, %s, %s, %s)",
+                (email, email, password_hash, True),
+            )
+            conn.commit()
     except psycopg2.errors.UniqueViolation:
-        if conn:
-            conn.rollback()
         return jsonify({"error": "Email already registered"}), 409
     except Exception:
-        if conn:
-            conn.rollback()
         return jsonify({"error": "Database error"}), 500
-    finally:
-        if cur:
-            cur.close()
-        if conn:
-            release_connection(conn)
 
-    OTP_STORE.pop(key, None)
+    OTP_STORE.delete(key)
     try:
         send_registration_success_email(email)
     except Exception:
@@ -582,10 +1062,11 @@ def login():
     password = str(data.get("password", ""))
     if not password:
         return jsonify({"error": "Password is required"}), 400
+    allowed, _ = RATE_LIMITER.hit(LOGIN_RATE, email)
+    if not allowed:
+        return jsonify({"error": "Too many login attempts. Please try again later."}), 429
 
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
+    with db_cursor() as (conn, cur):
         cur.execute(
             "SELECT blocked_until, email_verified, password_hash FROM users WHERE email = %s",
             (email,),
@@ -606,22 +1087,25 @@ def login():
 
         session_token = create_session_token(email=email, ttl_seconds=SESSION_TTL_SECONDS)
         return jsonify({"message": "Login successful", "session_token": session_token, "email": email})
-    finally:
-        cur.close()
-        release_connection(conn)
+
+
+@app.route("/elections", methods=["GET"])
+def list_elections():
+    with db_cursor() as (conn, cur):
+        cur.execute("SELECT election_id, title, deadline_ts FROM elections ORDER BY created_at, election_id")
+        rows = cur.fetchall()
+    return jsonify([{"election_id": r[0], "title": r[1], "deadline_ts": r[2]} for r in rows])
 
 
 @app.route("/candidates", methods=["GET"])
 def get_candidates():
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
-        cur.execute("SELECT id, name FROM candidates ORDER BY name")
+    election_id, election_err = _resolve_election_id(request.args.get("election_id"))
+    if election_err:
+        return jsonify(election_err[0]), election_err[1]
+    with db_cursor() as (conn, cur):
+        cur.execute("SELECT id, name FROM candidates WHERE election_id = %s ORDER BY name", (election_id,))
         rows = cur.fetchall()
         return jsonify([{"id": r[0], "name": r[1]} for r in rows])
-    finally:
-        cur.close()
-        release_connection(conn)
 
 
 @app.route("/vote", methods=["POST"])
@@ -640,13 +1124,16 @@ def vote():
         candidate_id = int(candidate_id_raw)
     except (TypeError, ValueError):
         return jsonify({"error": "candidate_id must be an integer"}), 400
+    election_id, election_err = _resolve_election_id(data.get("election_id"))
+    if election_err:
+        return jsonify(election_err[0]), election_err[1]
 
     email = normalize_email(str(session_payload["email"]))
 
     email_hash = sha256_hex(email)
     timestamp = int(time.time())
     canonical_payload = {
-        "election_id": ELECTION_ID,
+        "election_id": election_id,
         "email_hash": email_hash,
         "candidate_id": candidate_id,
         "timestamp": timestamp,
@@ -656,138 +1143,79 @@ def vote():
     if not email or not candidate_id:
         return jsonify({"error": "Email and candidate_id are required"}), 400
 
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
-        cur.execute("SELECT blocked_until, email_verified FROM users WHERE email = %s", (email,))
-        user = cur.fetchone()
-        if not user:
-            return jsonify({"error": "User not found"}), 404
-        blocked_until, email_verified, has_voted, user_ref = user
-        if blocked_until and blocked_until > datetime.utcnow():
-            return jsonify({"error": "Account temporarily blocked. Please try again later."}), 403
-        if not email_verified:
-            return jsonify({"error": "Please verify your email before voting."}), 403
-
-        cur.execute("SELECT 1 FROM candidates WHERE id = %s", (candidate_id,))
-        if not cur.fetchone():
-            return jsonify({"error": "Candidate not found"}), 404
-
-        cur.execute(
-            """
-            SELECT tx_id, confirmed_round, vote_hash
-            FROM votes
-            WHERE election_id = %s AND email_hash = %s
-            """,
-            (ELECTION_ID, email_hash),
-        )
-        existing_vote = cur.fetchone()
-        if existing_vote:
-            tx_id, confirmed_round, existing_vote_hash = existing_vote
-            return (
-                jsonify(
-                    {
-                        "status": "SUCCESS",
-                        "tx_id": tx_id,
-                        "confirmed_round": confirmed_round,
-                        "vote_hash": existing_vote_hash,
-                    }
-                ),
-                200,
-            )
-
+    # The sliding-window counter replaces a COUNT(*) over vote_attempts inside admit_vote. The hit
+    # is counted up front so concurrent requests cannot all pass one check; replays and "already
+    # voted" answers never reach the rate check in admit_vote, so their hit is refunded below.
+    rate_allowed, _ = RATE_LIMITER.hit(VOTE_RATE, email)
+    with db_cursor() as (conn, cur):
+        # Eligibility, duplicate, idempotency and rate checks plus the pending upsert run in one round-trip.
         cur.execute(
-            """
-            SELECT status, tx_id, updated_at
-            FROM pending_votes
-            WHERE election_id = %s AND email_hash = %s
-            """,
-            (ELECTION_ID, email_hash),
-        )
-        pending = cur.fetchone()
-        if pending:
-            pending_status, pending_tx_id, updated_at = pending
-            if pending_status == "confirmed" and pending_tx_id:
-                return jsonify({"status": "SUCCESS", "tx_id": pending_tx_id, "vote_hash": vote_hash}), 200
-            if pending_status == "pending" and updated_at > datetime.utcnow() - timedelta(seconds=IDEMPOTENCY_PENDING_SECONDS):
-                return jsonify({"error": "Vote submission already in progress"}), 409
-
-        cur.execute(
-            """
-            INSERT INTO pending_votes (election_id, email_hash, vote_hash, status, updated_at)
-            VALUES (%s, %s, %s, 'pending', NOW())
-            ON CONFLICT (election_id, email_hash)
-            DO UPDATE SET vote_hash = EXCLUDED.vote_hash, status = 'pending', updated_at = NOW()
-            """,
-            (ELECTION_ID, email_hash, vote_hash),
+            "SELECT * FROM admit_vote(%s, %s, %s, %s, %s, %s, %s, %s)",
+            (
+                election_id,
+                email,
+                email_hash,
+                candidate_id,
+                vote_hash,
+                VOTE_SUBMISSION_MODE == "async",
+                IDEMPOTENCY_PENDING_SECONDS,
+                not rate_allowed,
+            ),
         )
-
-        cur.execute(
-            """
-            SELECT COUNT(*)
-            FROM vote_attempts
-            WHERE wallet = %s AND timestamp > NOW() - INTERVAL '5 minutes'
-            """,
-            (email,),
+        decision, existing_tx_id, existing_round, existing_vote_hash, candidate_slot = cur.fetchone()
+        conn.commit()
+    if decision not in ("admitted", "rate_limited"):
+        RATE_LIMITER.refund(VOTE_RATE, email)
+
+    if decision == "user_not_found":
+        return jsonify({"error": "User not found"}), 404
+    if decision == "blocked":
+        return jsonify({"error": "Account temporarily blocked. Please try again later."}), 403
+    if decision == "unverified":
+        return jsonify({"error": "Please verify your email before voting."}), 403
+    if decision == "candidate_not_found":
+        return jsonify({"error": "Candidate not found"}), 404
+    if decision == "already_voted":
+        return (
+            jsonify(
+                {
+                    "status": "SUCCESS",
+                    "tx_id": existing_tx_id,
+                    "confirmed_round": existing_round,
+                    "vote_hash": existing_vote_hash,
+                }
+            ),
+            200,
         )
-        recent_attempts = int(cur.fetchone()[0])
-        suspicious = recent_attempts >= 3
-        reason = "Rapid voting attempts detected" if suspicious else None
-        cur.execute(
-            "INSERT INTO vote_attempts (wallet, election_id, result) VALUES (%s, %s, %s)",
-            (email, ELECTION_ID, "flagged" if suspicious else "ok"),
+    if decision == "already_confirmed":
+        return jsonify({"status": "SUCCESS", "tx_id": existing_tx_id, "vote_hash": existing_vote_hash}), 200
+    if decision == "submitted":
+        return jsonify({"status": "PENDING", "tx_id": existing_tx_id, "vote_hash": existing_vote_hash}), 202
+    if decision == "in_progress":
+        return jsonify({"error": "Vote submission already in progress"}), 409
+    if decision == "rate_limited":
+        reason = "Rapid voting attempts detected"
+        anchor_audit_event(
+            "vote_blocked",
+            "HIGH",
+            {"email": email, "reason": reason},
         )
-        if suspicious:
-            cur.execute(
-                "INSERT INTO ai_flags (wallet, reason, severity) VALUES (%s, %s, %s)",
-                (email, reason, 7),
-            )
-            conn.commit()
-            anchor_audit_event(
-                "vote_blocked",
-                "HIGH",
-                {"email": email, "reason": reason},
-            )
-            return jsonify({"error": reason}), 403
+        return jsonify({"error": reason}), 403
 
-        conn.commit()
-    finally:
-        cur.close()
-        release_connection(conn)
+    if VOTE_SUBMISSION_MODE == "async":
+        _start_vote_pipeline_if_needed()
 
     try:
-        sp = client.suggested_params()
-        txn = transaction.ApplicationCallTxn(
-            sender=sender_address,
-            sp=sp,
-            index=ALGOD_APP_ID,
-            on_complete=transaction.OnComplete.NoOpOC,
-            app_args=[b"vote", bytes.fromhex(email_hash), candidate_id.to_bytes(8, "big")],
-            boxes=[(0, b"voter_" + bytes.fromhex(email_hash))],
-        )
-        signed_txn = txn.sign(private_key)
-        tx_id = client.send_transaction(signed_txn)
-        confirmed_txn = wait_for_confirmation(client, tx_id, timeout=10)
-        confirmed_round = int(confirmed_txn["confirmed-round"])
-        block_info = client.block_info(confirmed_round)
-        block_timestamp = int(block_info["block"]["ts"])
+        tx_id, last_valid_round = _submit_vote_txn(client, email_hash, candidate_slot, election_id)
+        job = PendingVote(election_id, email, email_hash, vote_hash, candidate_id, tx_id, last_valid_round)
+        if VOTE_SUBMISSION_MODE == "async":
+            mark_vote_submitted(job)
+            if VOTE_WORKER.submit(job):
+                return jsonify({"status": "PENDING", "tx_id": tx_id, "vote_hash": vote_hash}), 202
+        confirmed_round, block_timestamp = _confirm_vote_txn(tx_id)
     except Exception as exc:
         err_msg = str(exc)
-        conn = get_connection()
-        cur = conn.cursor()
-        try:
-            cur.execute(
-                """
-                UPDATE pending_votes
-                SET status = 'failed', last_error = %s, updated_at = NOW()
-                WHERE election_id = %s AND email_hash = %s
-                """,
-                (err_msg, ELECTION_ID, email_hash),
-            )
-            conn.commit()
-        finally:
-            cur.close()
-            release_connection(conn)
+        mark_vote_failed(election_id, email_hash, err_msg)
         anchor_audit_event(
             "vote_chain_failure",
             "CRITICAL",
@@ -795,71 +1223,11 @@ def vote():
         )
         return jsonify({"error": "Blockchain transaction failed; vote not recorded"}), 502
 
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
-        cur.execute(
-            """
-            INSERT INTO votes (
-                election_id,
-                wallet,
-                email_hash,
-                vote_hash,
-                tx_id,
-                confirmed_round,
-                block_timestamp
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (election_id, email_hash)
-            WHERE email_hash IS NOT NULL
-            DO NOTHING
-            """,
-            (
-                ELECTION_ID,
-                email,
-                email_hash,
-                vote_hash,
-                tx_id,
-                confirmed_round,
-                block_timestamp,
-            ),
-        )
-        if cur.rowcount == 0:
-            cur.execute(
-                "SELECT tx_id, confirmed_round, vote_hash FROM votes WHERE election_id = %s AND email_hash = %s",
-                (ELECTION_ID, email_hash),
-            )
-            existing = cur.fetchone()
-            conn.commit()
-            return (
-                jsonify(
-                    {
-                        "status": "SUCCESS",
-                        "tx_id": existing[0],
-                        "confirmed_round": existing[1],
-                        "vote_hash": existing[2],
-                    }
-                ),
-                200,
-            )
-
-        cur.execute(
-            """
-            UPDATE pending_votes
-            SET status = 'confirmed', tx_id = %s, last_error = NULL, updated_at = NOW()
-            WHERE election_id = %s AND email_hash = %s
-            """,
-            (tx_id, ELECTION_ID, email_hash),
-        )
-        conn.commit()
-    finally:
-        cur.close()
-        release_connection(conn)
+    recorded, inserted = record_confirmed_vote(job, confirmed_round, block_timestamp)
+    if not inserted:
+        return jsonify({"status": "SUCCESS", **recorded}), 200
 
-    try:
-        recalculate_fairness("vote_cast")
-    except Exception:
-        pass
+    recalculate_fairness(election_id, "vote_cast", wait=False)
 
     return jsonify({"status": "SUCCESS", "tx_id": tx_id, "confirmed_round": confirmed_round, "vote_hash": vote_hash})
 
@@ -870,12 +1238,14 @@ def vote_status():
     if session_err:
         return jsonify(session_err[0]), session_err[1]
 
+    election_id, election_err = _resolve_election_id(request.args.get("election_id"))
+    if election_err:
+        return jsonify(election_err[0]), election_err[1]
+
     email = normalize_email(str(session_payload["email"]))
     email_hash = sha256_hex(email)
 
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
+    with db_cursor() as (conn, cur):
         cur.execute(
             """
             SELECT tx_id, confirmed_round, vote_hash, block_timestamp
@@ -884,45 +1254,62 @@ def vote_status():
             ORDER BY id DESC
             LIMIT 1
             """,
-            (ELECTION_ID, email_hash),
+            (election_id, email_hash),
         )
         row = cur.fetchone()
         if not row:
-            return jsonify({"has_voted": False, "election_id": ELECTION_ID})
+            cur.execute(
+                """
+                SELECT status, tx_id, vote_hash, last_error
+                FROM pending_votes
+                WHERE election_id = %s AND email_hash = %s
+                """,
+                (election_id, email_hash),
+            )
+            pending = cur.fetchone()
+            if not pending:
+                return jsonify({"has_voted": False, "election_id": election_id})
+            return jsonify(
+                {
+                    "has_voted": False,
+                    "election_id": election_id,
+                    "status": pending[0],
+                    "tx_id": pending[1],
+                    "vote_hash": pending[2],
+                    "error": pending[3],
+                }
+            )
         return jsonify(
             {
                 "has_voted": True,
-                "election_id": ELECTION_ID,
+                "election_id": election_id,
+                "status": "confirmed",
                 "tx_id": row[0],
                 "confirmed_round": row[1],
                 "vote_hash": row[2],
                 "block_timestamp": row[3],
             }
         )
-    finally:
-        cur.close()
-        release_connection(conn)
 
 
-@app.route("/results", methods=["GET"])
-def results():
+@app.route("/admin/results", methods=["GET"])
+def admin_chain_results():
+    # Live on-chain counts for the dashboard; the public /results reads the materialized tallies.
     algo, err = _algo_or_error()
     if err:
         return jsonify(err[0]), err[1]
+    election_id, election_err = _resolve_election_id(request.args.get("election_id"))
+    if election_err:
+        return jsonify(election_err[0]), election_err[1]
 
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
-        cur.execute("SELECT id, name FROM candidates ORDER BY name")
+    with db_cursor() as (conn, cur):
+        cur.execute("SELECT id, name, slot FROM candidates WHERE election_id = %s ORDER BY name", (election_id,))
         candidate_rows = cur.fetchall()
-    finally:
-        cur.close()
-        release_connection(conn)
 
-    ids = [row[0] for row in candidate_rows]
-    chain_counts = algo.get_candidate_counts(ids)
-    response = [{"id": cid, "name": name, "votes": int(chain_counts.get(cid, 0))} for cid, name in candidate_rows]
-    return jsonify({"election_id": ELECTION_ID, "source": "blockchain", "results": response})
+    slots = {row[0]: row[2] for row in candidate_rows}
+    chain_counts = tally_cache_for(algo, election_id).get_candidate_counts(slots)
+    response = [{"id": cid, "name": name, "votes": int(chain_counts.get(cid, 0))} for cid, name, _ in candidate_rows]
+    return jsonify({"election_id": election_id, "source": "blockchain", "results": response})
 
 
 @app.route("/verify/vote/<tx_id>", methods=["GET"])
@@ -942,14 +1329,18 @@ def vote_attempt():
     data = request.json or {}
     email = normalize_email(str(data.get("email", "")))
     election_id = data.get("election_id") or ELECTION_ID
-    suspicious, reason = check_anomaly(email)
+    ip_hash = sha256_hex(request.remote_addr or "unknown")
+    device_hash = str(data.get("device_fingerprint_hash") or "").strip() or None
+    FEATURE_STORE.start()
+    suspicious, reason = check_anomaly(email, RATE_LIMITER, FEATURE_STORE, ip_hash, device_hash)
 
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
+    with db_cursor() as (conn, cur):
         cur.execute(
-            "INSERT INTO vote_attempts (wallet, election_id, result) VALUES (%s, %s, %s)",
-            (email, election_id, "flagged" if suspicious else "ok"),
+            """
+            INSERT INTO vote_attempts (wallet, election_id, result, ip_hash, device_fingerprint_hash)
+            VALUES (%s, %s, %s, %s, %s)
+            """,
+            (email, election_id, "flagged" if suspicious else "ok", ip_hash, device_hash),
         )
         if suspicious:
             cur.execute(
@@ -959,9 +1350,64 @@ def vote_attempt():
             anchor_audit_event("vote_attempt_flagged", "HIGH", {"email": email, "reason": reason})
         conn.commit()
         return jsonify({"allowed": not suspicious, "reason": reason})
-    finally:
-        cur.close()
-        release_connection(conn)
+
+
+@app.route("/admin/elections", methods=["POST"])
+def admin_create_election():
+    _, err = _algod_or_error()
+    if err:
+        return jsonify(err[0]), err[1]
+    if not supports_multiple_elections():
+        return jsonify({"error": "Additional elections require ALGORAND_TALLY_STORAGE=box"}), 400
+
+    data = request.json or {}
+    admin_id = (data.get("admin_id") or "unknown-admin").strip()
+    election_id = (data.get("election_id") or "").strip()
+    title = (data.get("title") or election_id).strip()
+    try:
+        deadline_ts = int(data.get("deadline_ts"))
+    except (TypeError, ValueError):
+        return jsonify({"error": "deadline_ts must be a unix timestamp"}), 400
+    if not election_id:
+        return jsonify({"error": "election_id is required"}), 400
+    if deadline_ts <= int(time.time()):
+        return jsonify({"error": "deadline_ts must be in the future"}), 400
+
+    with db_cursor() as (conn, cur):
+        cur.execute("SELECT 1 FROM elections WHERE election_id = %s", (election_id,))
+        if cur.fetchone():
+            return jsonify({"error": "Election already exists"}), 409
+
+    try:
+        chain_result = submit_election_create(election_id, deadline_ts, timeout=10)
+    except Exception as exc:
+        anchor_audit_event(
+            "election_create_chain_failure",
+            "CRITICAL",
+            {"election_id": election_id, "error": str(exc)},
+        )
+        return jsonify({"error": "Blockchain transaction failed; election not created"}), 502
+
+    with db_cursor() as (conn, cur):
+        cur.execute(
+            "INSERT INTO elections (election_id, title, deadline_ts, tx_id) VALUES (%s, %s, %s, %s)",
+            (election_id, title, deadline_ts, chain_result["tx_id"]),
+        )
+        conn.commit()
+
+    log_admin_event(
+        admin_id=admin_id,
+        event_type="ELECTION_CREATED",
+        election_id=election_id,
+        event_details={"title": title, "deadline_ts": deadline_ts},
+        risk_level="MEDIUM",
+    )
+    anchor_audit_event(
+        "election_created",
+        "HIGH",
+        {"election_id": election_id, "deadline_ts": deadline_ts, "tx_id": chain_result["tx_id"]},
+    )
+    return jsonify({"message": "Election created", "election_id": election_id, "title": title, **chain_result})
 
 
 @app.route("/admin/add-candidate", methods=["POST"])
@@ -975,6 +1421,9 @@ def add_candidate():
     name = (data.get("name") or "").strip()
     if not name:
         return jsonify({"error": "Candidate name is required"}), 400
+    election_id, election_err = _resolve_election_id(data.get("election_id"))
+    if election_err:
+        return jsonify(election_err[0]), election_err[1]
 
     voting_active = _is_voting_window_active()
     has_anchor = _has_any_anchoring_activity()
@@ -989,44 +1438,53 @@ def add_candidate():
     log_admin_event(
         admin_id=admin_id,
         event_type=event_type,
-        election_id=FAIRNESS_DEFAULT_ELECTION_ID,
+        election_id=election_id,
         event_details={"candidate_name": name, "voting_window_active": voting_active, "anchoring_active": has_anchor},
         risk_level=risk_level,
     )
 
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
-        cur.execute("SELECT nextval(pg_get_serial_sequence('candidates', 'id'))")
-        candidate_id = int(cur.fetchone()[0])
-    finally:
-        cur.close()
-        release_connection(conn)
+    with db_cursor() as (conn, cur):
+        # Adds to one election are serialised from picking the slot until the row commits, so two
+        # concurrent adds never register the same slot on chain.
+        cur.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", (f"candidate_slot:{election_id}",))
+        try:
+            slot = _next_candidate_slot(cur, election_id)
+        except Exception as exc:
+            conn.rollback()
+            return jsonify({"error": f"Could not read election tallies: {exc}"}), 502
+        if TALLY_STORAGE == "box" and slot >= TALLY_BOX_SLOTS:
+            conn.rollback()
+            # The contract would reject the slot; refuse before anything is sent.
+            return (
+                jsonify({"error": f"Election already has the maximum of {TALLY_BOX_SLOTS - 1} candidate slots"}),
+                400,
+            )
 
-    try:
-        chain_result = submit_candidate_app_call(b"add_candidate", candidate_id, timeout=10)
-    except Exception as exc:
-        anchor_audit_event(
-            "candidate_add_chain_failure",
-            "CRITICAL",
-            {"candidate_id": candidate_id, "name": name, "error": str(exc)},
-        )
-        return jsonify({"error": "Blockchain transaction failed; candidate not added"}), 502
+        try:
+            chain_result = submit_candidate_app_call(b"add_candidate", slot, election_id, timeout=10)
+        except Exception as exc:
+            conn.rollback()
+            anchor_audit_event(
+                "candidate_add_chain_failure",
+                "CRITICAL",
+                {"election_id": election_id, "slot": slot, "name": name, "error": str(exc)},
+            )
+            return jsonify({"error": "Blockchain transaction failed; candidate not added"}), 502
 
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
-        cur.execute("INSERT INTO candidates (id, name) VALUES (%s, %s)", (candidate_id, name))
+        cur.execute(
+            "INSERT INTO candidates (name, election_id, slot) VALUES (%s, %s, %s) RETURNING id",
+            (name, election_id, slot),
+        )
+        candidate_id = int(cur.fetchone()[0])
         conn.commit()
-    finally:
-        cur.close()
-        release_connection(conn)
 
     anchor_audit_event(
         "candidate_added",
         "HIGH",
         {
             "candidate_id": candidate_id,
+            "election_id": election_id,
+            "slot": slot,
             "name": name,
             "tx_id": chain_result["tx_id"],
             "confirmed_round": chain_result["confirmed_round"],
@@ -1036,7 +1494,9 @@ def add_candidate():
         {
             "message": "Candidate added",
             "id": candidate_id,
+            "slot": slot,
             "name": name,
+            "election_id": election_id,
             "tx_id": chain_result["tx_id"],
             "confirmed_round": chain_result["confirmed_round"],
         }
@@ -1049,24 +1509,21 @@ def admin_candidates():
     if err:
         return jsonify(err[0]), err[1]
 
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
-        cur.execute("SELECT id, name FROM candidates ORDER BY name")
+    election_id, election_err = _resolve_election_id(request.args.get("election_id"))
+    if election_err:
+        return jsonify(election_err[0]), election_err[1]
+
+    with db_cursor() as (conn, cur):
+        cur.execute("SELECT id, name, slot FROM candidates WHERE election_id = %s ORDER BY name", (election_id,))
         rows = cur.fetchall()
-    finally:
-        cur.close()
-        release_connection(conn)
 
-    counts = algo.get_candidate_counts([r[0] for r in rows])
+    counts = tally_cache_for(algo, election_id).get_candidate_counts({r[0]: r[2] for r in rows})
     return jsonify([{"id": r[0], "name": r[1], "votes": int(counts.get(r[0], 0))} for r in rows])
 
 
 @app.route("/admin/stats", methods=["GET"])
 def admin_stats():
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
+    with db_cursor() as (conn, cur):
         cur.execute("SELECT COUNT(*) FROM users")
         users = cur.fetchone()[0]
         cur.execute("SELECT COUNT(*) FROM vote_attempts")
@@ -1082,18 +1539,13 @@ def admin_stats():
                 "governance_status": governance_status,
             }
         )
-    finally:
-        cur.close()
-        release_connection(conn)
 
 
 @app.route("/admin/fairness-index", methods=["GET", "POST"])
 def admin_fairness_index():
     if request.method == "GET":
         election_id = (request.args.get("election_id") or FAIRNESS_DEFAULT_ELECTION_ID).strip()
-        conn = get_connection()
-        cur = conn.cursor()
-        try:
+        with db_cursor() as (conn, cur):
             cur.execute(
                 """
                 SELECT fairness_payload, fairness_hash, fairness_score, algorand_tx_id, computed_at
@@ -1105,9 +1557,6 @@ def admin_fairness_index():
                 (election_id,),
             )
             row = cur.fetchone()
-        finally:
-            cur.close()
-            release_connection(conn)
 
         if not row:
             payload = _compute_fairness_index(election_id)
@@ -1168,9 +1617,7 @@ def admin_fairness_index():
         risk_level="MEDIUM",
     )
 
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
+    with db_cursor() as (conn, cur):
         cur.execute(
             """
             INSERT INTO fairness_reports (election_id, fairness_payload, fairness_hash, fairness_score, algorand_tx_id)
@@ -1179,9 +1626,6 @@ def admin_fairness_index():
             (election_id, json.dumps(payload, sort_keys=True), fairness_hash, payload["fairness_score"], algorand_tx_id),
         )
         conn.commit()
-    finally:
-        cur.close()
-        release_connection(conn)
 
     return jsonify(
         {
@@ -1226,32 +1670,22 @@ def delete_candidate():
         risk_level=risk_level,
     )
 
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
+    with db_cursor() as (conn, cur):
         cur.execute("DELETE FROM candidates WHERE id = %s", (candidate_id,))
         if cur.rowcount == 0:
             return jsonify({"error": "Candidate not found"}), 404
         conn.commit()
         return jsonify({"message": "Candidate deleted"})
-    finally:
-        cur.close()
-        release_connection(conn)
 
 
 @app.route("/admin/results-status", methods=["GET"])
 def admin_results_status():
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
+    with db_cursor() as (conn, cur):
         cur.execute("SELECT published, published_at FROM results_publication WHERE id = 1")
         row = cur.fetchone()
         published = bool(row[0]) if row else False
         published_at = row[1].isoformat() if row and row[1] else None
         return jsonify({"published": published, "published_at": published_at})
-    finally:
-        cur.close()
-        release_connection(conn)
 
 
 @app.route("/admin/publish-results", methods=["POST"])
@@ -1259,9 +1693,7 @@ def admin_publish_results():
     data = request.json or {}
     admin_id = (data.get("admin_id") or "unknown-admin").strip()
     publish = bool(data.get("published"))
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
+    with db_cursor() as (conn, cur):
         cur.execute("SELECT published FROM results_publication WHERE id = 1")
         row = cur.fetchone()
         currently_published = bool(row[0]) if row else False
@@ -1299,31 +1731,22 @@ def admin_publish_results():
             cur.execute("UPDATE results_publication SET published = FALSE, published_at = NULL WHERE id = 1")
         conn.commit()
         return jsonify({"published": publish})
-    finally:
-        cur.close()
-        release_connection(conn)
 
 
 @app.route("/results", methods=["GET"])
 def public_results():
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
+    election_id, election_err = _resolve_election_id(request.args.get("election_id"))
+    if election_err:
+        return jsonify(election_err[0]), election_err[1]
+    _start_tally_reconciler_if_needed()
+    with db_cursor() as (conn, cur):
         cur.execute("SELECT published FROM results_publication WHERE id = 1")
         row = cur.fetchone()
         if not row or not row[0]:
             return jsonify({"published": False, "results": []})
 
-        query = """
-            SELECT c.id, c.name, COUNT(v.wallet)
-            FROM candidates c
-            LEFT JOIN votes v ON c.id = v.candidate_id
-            GROUP BY c.id
-            ORDER BY COUNT(v.wallet) DESC, c.name
-        """
-        cur.execute(query)
-        rows = cur.fetchall()
-        results = [{"id": r[0], "name": r[1], "votes": r[2]} for r in rows]
+        # Trigger-maintained tallies keep this read proportional to the ballot, not the vote count.
+        results = read_election_results(cur, election_id)
         governance_summary = get_governance_audit_summary(FAIRNESS_DEFAULT_ELECTION_ID)
         governance_compromised = governance_summary.get("governance_integrity_status") == "COMPROMISED"
         cur.execute(
@@ -1334,7 +1757,7 @@ def public_results():
             ORDER BY computed_at DESC
             LIMIT 1
             """,
-            (FAIRNESS_DEFAULT_ELECTION_ID,),
+            (election_id,),
         )
         fairness_row = cur.fetchone()
         fairness_public = None
@@ -1361,78 +1784,38 @@ def public_results():
                 "governance_warning": "Governance Integrity Compromised" if governance_compromised else None,
             }
         )
-    finally:
-        cur.close()
-        release_connection(conn)
+
+
+def _admin_feed_response(feed: str):
+    try:
+        filters = parse_feed_filters(feed, request.args)
+        cursor = request.args.get("cursor") or None
+        if cursor:
+            decode_cursor(cursor)
+        limit = int(request.args.get("limit", ADMIN_FEED_DEFAULT_LIMIT))
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    if request.args.get("stream") == "1":
+        return Response(iter_feed_export(feed, filters, cursor), mimetype="application/x-ndjson")
+    if not cursor and "limit" not in request.args and not FEEDS[feed]["paged_by_default"]:
+        return Response(iter_feed_array(feed, filters), mimetype="application/json")
+
+    rows, next_cursor = read_feed_page(feed, filters, cursor, limit)
+    response = Response("[" + ",".join(rows) + "]", mimetype="application/json")
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return response
 
 
 @app.route("/admin/ai-flags", methods=["GET"])
 def admin_ai_flags():
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
-        cur.execute("SELECT wallet, reason, severity, created_at FROM ai_flags ORDER BY created_at DESC")
-        rows = cur.fetchall()
-        return jsonify(
-            [
-                {
-                    "email": r[0],
-                    "reason": r[1],
-                    "severity": r[2],
-                    "created_at": r[3].isoformat(),
-                }
-                for r in rows
-            ]
-        )
-    finally:
-        cur.close()
-        release_connection(conn)
+    return _admin_feed_response("ai_flags")
 
 
 @app.route("/admin/audit-events", methods=["GET"])
 def admin_audit_events():
-    limit_raw = request.args.get("limit", "100")
-    try:
-        limit = max(1, min(500, int(limit_raw)))
-    except ValueError:
-        limit = 100
-
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
-        cur.execute(
-            """
-            SELECT event_type, severity, payload_json, entry_hash, anchored_tx_id, anchored_round, created_at
-            FROM audit_events
-            ORDER BY created_at DESC
-            LIMIT %s
-            """,
-            (limit,),
-        )
-        rows = cur.fetchall()
-        events: list[dict[str, Any]] = []
-        for row in rows:
-            payload = None
-            if row[2]:
-                try:
-                    payload = json.loads(row[2])
-                except Exception:
-                    payload = row[2]
-            events.append(
-                {
-                    "event_type": row[0],
-                    "severity": row[1],
-                    "payload": payload,
-                    "entry_hash": row[3],
-                    "anchored_tx_id": row[4],
-                    "anchored_round": row[5],
-                    "created_at": row[6].isoformat(),
-                }
-            )
-        return jsonify(events)
-    finally:
-        cur.close()
-        release_connection(conn)
+    return _admin_feed_response("audit_events")
 
 
 @app.route("/admin/acknowledge-flag", methods=["POST"])
@@ -1442,15 +1825,10 @@ def admin_acknowledge_flag():
     if not email:
         return jsonify({"error": "Email is required"}), 400
 
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
+    with db_cursor() as (conn, cur):
         cur.execute("DELETE FROM ai_flags WHERE wallet = %s", (email,))
         conn.commit()
         return jsonify({"message": "Flag acknowledged"})
-    finally:
-        cur.close()
-        release_connection(conn)
 
 
 @app.route("/admin/block-email", methods=["POST"])
@@ -1482,9 +1860,7 @@ def admin_block_email():
         risk_level=risk_level,
     )
 
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
+    with db_cursor() as (conn, cur):
         blocked_until = datetime.utcnow() + timedelta(minutes=minutes)
         cur.execute("UPDATE users SET blocked_until = %s WHERE email = %s", (blocked_until, email))
         if cur.rowcount == 0:
@@ -1492,15 +1868,32 @@ def admin_block_email():
         conn.commit()
         anchor_audit_event("email_blocked", "HIGH", {"email": email, "minutes": minutes})
         return jsonify({"message": "Email blocked", "blocked_until": blocked_until.isoformat()})
-    finally:
-        cur.close()
-        release_connection(conn)
 
 
 @app.route("/admin/reconcile", methods=["POST"])
 def admin_reconcile():
+    data = request.get_json(silent=True) or {}
+    full = bool(data.get("full"))
+    if data.get("mode") == "bulk":
+        try:
+            min_round = int(data["min_round"]) if data.get("min_round") else None
+            max_round = int(data["max_round"]) if data.get("max_round") else None
+            return jsonify(bulk_verify_anchors(min_round=min_round, max_round=max_round))
+        except (TypeError, ValueError):
+            return jsonify({"error": "min_round and max_round must be integers"}), 400
+        except Exception as exc:
+            return jsonify({"error": str(exc)}), 500
+    if data.get("stream") or request.args.get("stream") == "1":
+        def generate():
+            try:
+                for item in iter_audit_reconciliation(full=full):
+                    yield canonical_json(item) + "\n"
+            except Exception as exc:
+                yield canonical_json({"type": "error", "error": str(exc)}) + "\n"
+
+        return Response(generate(), mimetype="application/x-ndjson")
     try:
-        result = reconcile_audit_anchors()
+        result = reconcile_audit_anchors(full=full)
         return jsonify(result)
     except Exception as exc:
         return jsonify({"error": str(exc)}), 500
@@ -1508,13 +1901,91 @@ def admin_reconcile():
 
 @app.route("/admin/fairness/recalculate", methods=["POST"])
 def admin_recalculate_fairness():
+    data = request.get_json(silent=True) or {}
+    election_id, election_err = _resolve_election_id(data.get("election_id"))
+    if election_err:
+        return jsonify(election_err[0]), election_err[1]
     try:
-        result = recalculate_fairness("manual_admin")
+        if data.get("rebuild_counters"):
+            with db_connection() as conn:
+                rebuild_fairness_counters(conn, election_id)
+        result = recalculate_fairness(election_id, "manual_admin")
         return jsonify(result)
     except Exception as exc:
         return jsonify({"error": str(exc)}), 500
 
 
+@app.route("/admin/mail-queue", methods=["GET"])
+def admin_mail_queue():
+    message_id = request.args.get("message_id")
+    if message_id:
+        status = MAIL_QUEUE.status(message_id)
+        if not status:
+            return jsonify({"error": "Message not found"}), 404
+        return jsonify(status)
+    return jsonify(MAIL_QUEUE.stats())
+
+
+@app.route("/admin/anchor-mirror", methods=["GET", "POST"])
+def admin_anchor_mirror():
+    try:
+        if request.method == "POST":
+            return jsonify({"sync": sync_anchor_mirror(), **mirror_status()})
+        return jsonify(mirror_status())
+    except Exception as exc:
+        return jsonify({"error": str(exc)}), 500
+
+
+@app.route("/admin/tallies", methods=["GET", "POST"])
+def admin_tallies():
+    election_id, election_err = _resolve_election_id(request.args.get("election_id"))
+    if election_err:
+        return jsonify(election_err[0]), election_err[1]
+    try:
+        reconciled = TALLY_RECONCILER.run_once() if request.method == "POST" else None
+        return jsonify({"election_id": election_id, "tallies": tally_status(election_id), "reconciled": reconciled})
+    except Exception as exc:
+        return jsonify({"error": str(exc)}), 500
+
+
+@app.route("/admin/vote-attempts/rescore", methods=["GET"])
+def admin_rescore_vote_attempts():
+    # vote_attempts keeps whatever election_id the client sent, so it is not checked against elections.
+    election_id = (request.args.get("election_id") or ELECTION_ID).strip()
+    try:
+        return jsonify(rescore_vote_attempts(election_id))
+    except RuntimeError as exc:
+        return jsonify({"error": str(exc)}), 503
+    except Exception as exc:
+        return jsonify({"error": str(exc)}), 500
+
+
+@app.route("/admin/chain-cache", methods=["GET"])
+def admin_chain_cache():
+    return jsonify(
+        {
+            "suggested_params": SUGGESTED_PARAMS_CACHE.stats(),
+            "block_followers": follower_stats(),
+            "vote_batcher": VOTE_BATCHER.stats(),
+            "signer_pool": SIGNER_POOL.stats() if SIGNER_POOL else None,
+            "tally": tally_cache_stats(),
+        }
+    )
+
+
+@app.route("/admin/feature-store", methods=["GET"])
+def admin_feature_store():
+    email = normalize_email(request.args.get("email", ""))
+    if email:
+        return jsonify({"email": email, "features": FEATURE_STORE.features(email)})
+    return jsonify(FEATURE_STORE.stats())
+
+
+@app.route("/admin/db-pool", methods=["GET"])
+def admin_db_pool():
+    return jsonify(pool_metrics())
+
+
 @app.route("/health")
 def health():
     return jsonify(
@@ -1535,21 +2006,60 @@ def verify_decision():
     if not tx_id or not decision_hash:
         return jsonify({"error": "tx_id and decision_hash are required"}), 400
 
-    onchain_note = fetch_tx_note(tx_id)
+    merkle_root = data.get("merkle_root")
+    merkle_proof = data.get("merkle_proof")
+    if merkle_proof is None:
+        with db_cursor() as (conn, cur):
+            cur.execute(
+                """
+                SELECT merkle_root, merkle_proof FROM admin_audit_log
+                WHERE decision_hash = %s AND algorand_tx_id = %s AND merkle_root IS NOT NULL
+                UNION ALL
+                SELECT merkle_root, merkle_proof FROM audit_events
+                WHERE entry_hash = %s AND anchored_tx_id = %s AND merkle_root IS NOT NULL
+                LIMIT 1
+                """,
+                (decision_hash, tx_id, decision_hash, tx_id),
+            )
+            proof_row = cur.fetchone()
+        if proof_row:
+            merkle_root, merkle_proof = proof_row
+
+    merkle_verified = None
+    anchored_hash = decision_hash
+    if merkle_root and merkle_proof is not None:
+        merkle_verified = verify_merkle_proof(decision_hash, merkle_proof, merkle_root)
+        anchored_hash = merkle_root
+
+    # Notes already in the anchor mirror are answered from Postgres; anything else asks the indexer.
+    onchain_note = None
+    try:
+        for anchor in find_anchor(anchored_hash, voter_ref):
+            if anchor["tx_id"] == tx_id:
+                onchain_note = build_anchor_note(anchor["voter_ref"], anchored_hash)
+                break
+    except Exception:
+        pass
+    if not onchain_note:
+        onchain_note = fetch_tx_note(tx_id)
     if not onchain_note:
         return jsonify({"verified": False, "reason": "No note found on transaction"}), 404
 
     note_voter_ref, note_hash = parse_anchor_note(onchain_note)
     if note_voter_ref and note_hash:
-        verified = note_hash == decision_hash and (not voter_ref or voter_ref == note_voter_ref)
+        verified = note_hash == anchored_hash and (not voter_ref or voter_ref == note_voter_ref)
     else:
-        verified = onchain_note == decision_hash
+        verified = onchain_note == anchored_hash
+    if merkle_verified is False:
+        verified = False
 
     return jsonify(
         {
             "verified": verified,
             "onchain_note": onchain_note,
             "decision_hash": decision_hash,
+            "merkle_root": merkle_root,
+            "merkle_proof_verified": merkle_verified,
             "note_prefix": ANCHOR_NOTE_PREFIX,
             "voter_ref_match": (note_voter_ref == voter_ref) if voter_ref and note_voter_ref else None,
         }
@@ -1559,4 +2069,8 @@ def verify_decision():
 if __name__ == "__main__":
     ensure_schema()
     _start_governance_monitor_if_needed()
+    _start_signer_monitor_if_needed()
+    _start_tally_reconciler_if_needed()
+    _start_vote_pipeline_if_needed()
+    FEATURE_STORE.start()
     app.run(debug=True)
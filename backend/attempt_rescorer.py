@@ -0,0 +1,115 @@
+import os
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from consensus import ALLOW, FLAG, VERDICTS, require_numpy, run_consensus_batch
+from db import db_connection
+from feature_store import (
+    FEATURE_STORE_FANOUT_WINDOW_SECONDS,
+    FEATURE_STORE_MAX_FANOUT,
+    FEATURE_STORE_RATE_WINDOW_SECONDS,
+)
+
+ATTEMPT_RESCORE_CHUNK_SIZE = int(os.getenv("ATTEMPT_RESCORE_CHUNK_SIZE", "50000"))
+
+# Rebuilds, for every stored attempt, the features the live feature store would have handed
+# to the validators at that moment: attempts in the rate window, gap to the previous attempt,
+# sample variance of all gaps so far and capped ip/device fan-out over the fan-out window.
+_ATTEMPT_FEATURES_SQL = """
+    WITH gaps AS (
+        SELECT
+            id, wallet, timestamp, result,
+            EXTRACT(EPOCH FROM timestamp - LAG(timestamp) OVER w)::DOUBLE PRECISION AS gap
+        FROM vote_attempts
+        WHERE election_id = %(election_id)s
+        WINDOW w AS (PARTITION BY wallet ORDER BY timestamp, id)
+    ),
+    features AS (
+        SELECT
+            id, wallet, timestamp, result, gap,
+            COUNT(*) OVER (
+                PARTITION BY wallet ORDER BY timestamp
+                RANGE BETWEEN make_interval(secs => %(window)s) PRECEDING AND CURRENT ROW
+            ) AS attempts,
+            VAR_SAMP(gap) OVER (PARTITION BY wallet ORDER BY timestamp, id ROWS UNBOUNDED PRECEDING) AS variance
+        FROM gaps
+    )
+    SELECT
+        f.id, f.result, f.attempts, CASE WHEN f.attempts >= 2 THEN f.gap END, f.variance,
+        LEAST(fanout.ips, %(max_fanout)s), LEAST(fanout.devices, %(max_fanout)s)
+    FROM features f
+    CROSS JOIN LATERAL (
+        SELECT COUNT(DISTINCT v.ip_hash) AS ips, COUNT(DISTINCT v.device_fingerprint_hash) AS devices
+        FROM vote_attempts v
+        WHERE v.wallet = f.wallet
+          AND v.election_id = %(election_id)s
+          AND v.timestamp >= f.timestamp - make_interval(secs => %(fanout_window)s)
+          AND (v.timestamp, v.id) <= (f.timestamp, f.id)
+    ) fanout
+    ORDER BY f.id
+"""
+
+
+def _score_chunk(rows, report: dict[str, Any]) -> None:
+    columns = list(zip(*rows))
+    # vote_attempts only records whether an attempt was flagged, which stands in for the AI verdict.
+    ai = np.array([result == "flagged" for result in columns[1]])
+    scored = run_consensus_batch(
+        np.where(ai, FLAG, ALLOW),
+        np.array(columns[2], dtype=np.int64),
+        np.array(columns[3], dtype=np.float64),
+        np.array(columns[5], dtype=np.int64),
+        np.array(columns[6], dtype=np.int64),
+        np.array(columns[4], dtype=np.float64),
+    )
+    report["attempts"] += len(rows)
+    for name in ("final", "rule_based", "statistical"):
+        counts = np.bincount(scored[name], minlength=len(VERDICTS))
+        for code, verdict in enumerate(VERDICTS):
+            report["verdicts"][name][verdict] += int(counts[code])
+    for validator, masks in scored["rule_masks"].items():
+        for rule, mask in masks.items():
+            report["rules"][validator][rule] = report["rules"][validator].get(rule, 0) + int(mask.sum())
+    final_flagged = scored["final"] != ALLOW
+    report["newly_flagged"] += int((final_flagged & ~ai).sum())
+    report["cleared"] += int((~final_flagged & ai).sum())
+
+
+def rescore_vote_attempts(election_id: str, chunk_size: int = ATTEMPT_RESCORE_CHUNK_SIZE) -> dict[str, Any]:
+    require_numpy()
+    report: dict[str, Any] = {
+        "election_id": election_id,
+        "attempts": 0,
+        "chunks": 0,
+        "verdicts": {name: dict.fromkeys(VERDICTS, 0) for name in ("final", "rule_based", "statistical")},
+        "rules": {"rule_based": {}, "statistical": {}},
+        "newly_flagged": 0,
+        "cleared": 0,
+    }
+    with db_connection() as conn:
+        # The server-side cursor hands rows over chunk by chunk; each chunk is scored as one set of arrays.
+        cur = conn.cursor(name="vote_attempts_rescore")
+        try:
+            cur.execute(
+                _ATTEMPT_FEATURES_SQL,
+                {
+                    "election_id": election_id,
+                    "window": FEATURE_STORE_RATE_WINDOW_SECONDS,
+                    "max_fanout": FEATURE_STORE_MAX_FANOUT,
+                    "fanout_window": FEATURE_STORE_FANOUT_WINDOW_SECONDS,
+                },
+            )
+            while True:
+                rows = cur.fetchmany(max(1, chunk_size))
+                if not rows:
+                    break
+                _score_chunk(rows, report)
+                report["chunks"] += 1
+        finally:
+            cur.close()
+            conn.rollback()
+    return report
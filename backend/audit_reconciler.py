@@ -0,0 +1,190 @@
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Iterator
+
+from db import db_cursor
+from merkle import verify_merkle_proof
+
+RECONCILE_CONCURRENCY = int(os.getenv("RECONCILE_CONCURRENCY", "8"))
+RECONCILE_BATCH_SIZE = int(os.getenv("RECONCILE_BATCH_SIZE", "500"))
+RECONCILE_MAX_ATTEMPTS = int(os.getenv("RECONCILE_MAX_ATTEMPTS", "3"))
+RECONCILE_RETRY_BASE_SECONDS = float(os.getenv("RECONCILE_RETRY_BASE_SECONDS", "0.5"))
+RECONCILE_CHECKPOINT_KEY = "audit_reconcile_checkpoint"
+
+RECONCILE_OK = "ok"
+RECONCILE_HASH_MISMATCH = "hash_mismatch"
+RECONCILE_PROOF_INVALID = "proof_invalid"
+RECONCILE_NOTE_MISMATCH = "note_mismatch"
+RECONCILE_LOOKUP_FAILED = "lookup_failed"
+
+_LOOKUP_FAILED = object()
+
+
+def read_reconcile_checkpoint() -> int:
+    with db_cursor() as (conn, cur):
+        cur.execute("SELECT value FROM governance_state WHERE key = %s", (RECONCILE_CHECKPOINT_KEY,))
+        row = cur.fetchone()
+        return int(row[0]) if row else 0
+
+
+def _write_reconcile_checkpoint(checkpoint: int) -> None:
+    with db_cursor() as (conn, cur):
+        cur.execute(
+            """
+            INSERT INTO governance_state (key, value, updated_at)
+            VALUES (%s, %s, NOW())
+            ON CONFLICT (key)
+            DO UPDATE SET value = EXCLUDED.value, updated_at = NOW()
+            WHERE governance_state.value::BIGINT < EXCLUDED.value::BIGINT;
+            """,
+            (RECONCILE_CHECKPOINT_KEY, str(checkpoint)),
+        )
+        conn.commit()
+
+
+def check_audit_event(payload_json: str, stored_hash: str, merkle_root: str | None, merkle_proof: str | None) -> tuple[str | None, str]:
+    if hashlib.sha256(payload_json.encode("utf-8")).hexdigest() != stored_hash:
+        return RECONCILE_HASH_MISMATCH, stored_hash
+    if merkle_root:
+        if not verify_merkle_proof(stored_hash, merkle_proof or "[]", merkle_root):
+            return RECONCILE_PROOF_INVALID, merkle_root
+        return None, merkle_root
+    return None, stored_hash
+
+
+class AuditReconciler:
+    def __init__(
+        self,
+        fetch_note: Callable[[str], str | None],
+        concurrency: int = RECONCILE_CONCURRENCY,
+        batch_size: int = RECONCILE_BATCH_SIZE,
+        max_attempts: int = RECONCILE_MAX_ATTEMPTS,
+        retry_base_seconds: float = RECONCILE_RETRY_BASE_SECONDS,
+    ) -> None:
+        self._fetch_note = fetch_note
+        self._concurrency = max(1, concurrency)
+        self._batch_size = max(1, batch_size)
+        self._max_attempts = max(1, max_attempts)
+        self._retry_base_seconds = retry_base_seconds
+
+    def _fetch_with_retry(self, tx_id: str):
+        for attempt in range(self._max_attempts):
+            try:
+                return self._fetch_note(tx_id)
+            except Exception:
+                if attempt + 1 < self._max_attempts:
+                    time.sleep(self._retry_base_seconds * (2**attempt))
+        return _LOOKUP_FAILED
+
+    def _fetch_batch(self, after_id: int) -> list[tuple]:
+        with db_cursor() as (conn, cur):
+            cur.execute(
+                """
+                SELECT id, payload_json, entry_hash, anchored_tx_id, merkle_root, merkle_proof
+                FROM audit_events
+                WHERE severity IN ('HIGH', 'CRITICAL')
+                AND anchored_tx_id IS NOT NULL
+                AND id > %s
+                ORDER BY id
+                LIMIT %s
+                """,
+                (after_id, self._batch_size),
+            )
+            return cur.fetchall()
+
+    def run(self, full: bool = False) -> Iterator[dict[str, Any]]:
+        start_id = 0 if full else read_reconcile_checkpoint()
+        with db_cursor() as (conn, cur):
+            # Rows still waiting for an anchor get one later, so the checkpoint must stay below them.
+            cur.execute(
+                """
+                SELECT MIN(id)
+                FROM audit_events
+                WHERE severity IN ('HIGH', 'CRITICAL') AND anchored_tx_id IS NULL
+                """
+            )
+            first_pending = cur.fetchone()[0]
+        checkpoint_cap = first_pending - 1 if first_pending is not None else None
+
+        notes: dict[str, Any] = {}
+        counts = {
+            RECONCILE_OK: 0,
+            RECONCILE_HASH_MISMATCH: 0,
+            RECONCILE_PROOF_INVALID: 0,
+            RECONCILE_NOTE_MISMATCH: 0,
+            RECONCILE_LOOKUP_FAILED: 0,
+        }
+        verified_through = start_id
+        contiguous = True
+        after_id = start_id
+
+        with ThreadPoolExecutor(max_workers=self._concurrency, thread_name_prefix="audit-reconcile") as pool:
+            while True:
+                rows = self._fetch_batch(after_id)
+                if not rows:
+                    break
+                after_id = rows[-1][0]
+
+                statuses: dict[int, str] = {}
+                waiting: dict[str, list[tuple[int, str]]] = {}
+                ready: list[dict[str, Any]] = []
+                for row in rows:
+                    row_id, tx_id = row[0], row[3]
+                    failure, expected_note = check_audit_event(row[1], row[2], row[4], row[5])
+                    if failure:
+                        statuses[row_id] = failure
+                        ready.append({"type": "event", "id": row_id, "tx_id": tx_id, "status": failure})
+                    else:
+                        waiting.setdefault(tx_id, []).append((row_id, expected_note))
+
+                for result in ready:
+                    counts[result["status"]] += 1
+                    yield result
+
+                # Batched rows often share one Merkle anchor, so each transaction is looked up once.
+                futures = {
+                    pool.submit(self._fetch_with_retry, tx_id): tx_id for tx_id in waiting if tx_id not in notes
+                }
+                cached = [(tx_id, notes[tx_id]) for tx_id in waiting if tx_id in notes]
+                fetched = ((futures[future], future.result()) for future in as_completed(futures))
+                for source in (cached, fetched):
+                    for tx_id, note in source:
+                        notes[tx_id] = note
+                        for row_id, expected_note in waiting[tx_id]:
+                            if note is _LOOKUP_FAILED:
+                                status = RECONCILE_LOOKUP_FAILED
+                            elif note != expected_note:
+                                status = RECONCILE_NOTE_MISMATCH
+                            else:
+                                status = RECONCILE_OK
+                            statuses[row_id] = status
+                            counts[status] += 1
+                            yield {"type": "event", "id": row_id, "tx_id": tx_id, "status": status}
+
+                for row in rows:
+                    if not contiguous:
+                        break
+                    if checkpoint_cap is not None and row[0] > checkpoint_cap:
+                        contiguous = False
+                        break
+                    if statuses[row[0]] != RECONCILE_OK:
+                        contiguous = False
+                        break
+                    verified_through = row[0]
+
+                if len(rows) < self._batch_size:
+                    break
+
+        if verified_through > start_id:
+            _write_reconcile_checkpoint(verified_through)
+
+        yield {
+            "type": "summary",
+            "checked_events": sum(counts.values()),
+            "status_counts": counts,
+            "started_after_id": start_id,
+            "checkpoint": max(verified_through, start_id),
+            "compromised": any(counts[status] for status in counts if status != RECONCILE_OK),
+        }
@@ -0,0 +1,180 @@
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable
+
+from algosdk.v2client import algod
+
+from params_cache import SUGGESTED_PARAMS_CACHE
+
+
+class _Waiter:
+    def __init__(self, tx_id: str, timeout_rounds: int) -> None:
+        self.tx_id = tx_id
+        self.timeout_rounds = max(1, timeout_rounds)
+        self.deadline_round: int | None = None
+        self.future: Future = Future()
+
+
+class BlockFollower:
+    def __init__(self, client: algod.AlgodClient, retry_seconds: float = 1.0) -> None:
+        self._client = client
+        self._retry_seconds = retry_seconds
+        self._lock = threading.Lock()
+        self._waiting: dict[str, list[_Waiter]] = {}
+        self._unchecked: list[_Waiter] = []
+        self._subscribers: list[Callable[[int], None]] = []
+        self._thread: threading.Thread | None = None
+        self._last_round = 0
+        self._stats = {"blocks": 0, "resolved": 0, "timeouts": 0, "pending_lookups": 0}
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="algod-block-follower", daemon=True)
+            self._thread.start()
+
+    def subscribe(self, callback: Callable[[int], None]) -> None:
+        with self._lock:
+            self._subscribers.append(callback)
+        self.start()
+
+    def watch(self, tx_id: str, timeout_rounds: int) -> Future:
+        self.start()
+        with self._lock:
+            waiter = _Waiter(tx_id, timeout_rounds)
+            self._waiting.setdefault(tx_id, []).append(waiter)
+            self._unchecked.append(waiter)
+        return waiter.future
+
+    def wait(self, tx_id: str, timeout_rounds: int, timeout_seconds: float | None = None) -> dict[str, Any]:
+        # Rounds close roughly every 3.3s; the wall-clock bound only guards against a stalled follower.
+        return self.watch(tx_id, timeout_rounds).result(timeout=timeout_seconds or (timeout_rounds + 2) * 5)
+
+    def _resolve(self, tx_id: str, result: dict[str, Any] | None = None, error: Exception | None = None) -> None:
+        with self._lock:
+            waiters = self._waiting.pop(tx_id, [])
+            self._stats["resolved" if error is None else "timeouts"] += len(waiters)
+        for waiter in waiters:
+            if waiter.future.done():
+                continue
+            if error is None:
+                waiter.future.set_result(result)
+            else:
+                waiter.future.set_exception(error)
+
+    def _check_pending(self, tx_id: str) -> bool:
+        with self._lock:
+            self._stats["pending_lookups"] += 1
+        pending_txn = self._client.pending_transaction_info(tx_id)
+        confirmed_round = pending_txn.get("confirmed-round", 0)
+        if confirmed_round > 0:
+            pending_txn["block-timestamp"] = int(self._client.block_info(confirmed_round)["block"].get("ts", 0))
+            self._resolve(tx_id, pending_txn)
+            return True
+        if pending_txn.get("pool-error"):
+            self._resolve(tx_id, error=RuntimeError(f"Transaction rejected: {pending_txn['pool-error']}"))
+            return True
+        return False
+
+    def _process_round(self, round_number: int) -> None:
+        with self._lock:
+            has_waiters = bool(self._waiting)
+        if has_waiters:
+            try:
+                txids = set(self._client.get_block_txids(round_number).get("blockTxids", []))
+            except Exception:
+                txids = None
+            with self._lock:
+                waiting = list(self._waiting)
+            if txids is None:
+                # Nodes without the block txids endpoint fall back to one pending lookup per waiter.
+                for tx_id in waiting:
+                    try:
+                        self._check_pending(tx_id)
+                    except Exception:
+                        pass
+            else:
+                confirmed = [tx_id for tx_id in waiting if tx_id in txids]
+                if confirmed:
+                    block_timestamp = int(self._client.block_info(round_number)["block"].get("ts", 0))
+                    for tx_id in confirmed:
+                        self._resolve(tx_id, {"confirmed-round": round_number, "block-timestamp": block_timestamp})
+
+        with self._lock:
+            # Transactions registered since the last block may already have been confirmed
+            # before they were watched, so each one gets a single pending lookup.
+            unchecked = [w for w in self._unchecked if not w.future.done()]
+            self._unchecked = []
+            for waiter in unchecked:
+                waiter.deadline_round = round_number + waiter.timeout_rounds
+            expired = [
+                tx_id
+                for tx_id, waiters in self._waiting.items()
+                if all(w.deadline_round is not None and w.deadline_round <= round_number for w in waiters)
+            ]
+        for waiter in unchecked:
+            try:
+                self._check_pending(waiter.tx_id)
+            except Exception:
+                pass
+        for tx_id in expired:
+            try:
+                if self._check_pending(tx_id):
+                    continue
+            except Exception:
+                pass
+            self._resolve(tx_id, error=TimeoutError("Transaction not confirmed within timeout"))
+
+        with self._lock:
+            self._stats["blocks"] += 1
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(round_number)
+            except Exception:
+                pass
+
+    def _run(self) -> None:
+        while True:
+            try:
+                if not self._last_round:
+                    latest = int(self._client.status()["last-round"])
+                    self._process_round(latest)
+                    self._last_round = latest
+                    continue
+                status = self._client.status_after_block(self._last_round)
+                latest = int(status["last-round"])
+                for round_number in range(self._last_round + 1, latest + 1):
+                    self._process_round(round_number)
+                    self._last_round = round_number
+            except Exception:
+                time.sleep(self._retry_seconds)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                **self._stats,
+                "last_round": self._last_round,
+                "waiting": sum(len(waiters) for waiters in self._waiting.values()),
+            }
+
+
+_FOLLOWERS: dict[str, BlockFollower] = {}
+_FOLLOWERS_LOCK = threading.Lock()
+
+
+def follower_for(client: algod.AlgodClient) -> BlockFollower:
+    with _FOLLOWERS_LOCK:
+        follower = _FOLLOWERS.get(client.algod_address)
+        if follower is None:
+            follower = BlockFollower(client)
+            follower.subscribe(SUGGESTED_PARAMS_CACHE.on_new_round)
+            _FOLLOWERS[client.algod_address] = follower
+        return follower
+
+
+def follower_stats() -> dict[str, dict[str, int]]:
+    with _FOLLOWERS_LOCK:
+        return {address: follower.stats() for address, follower in _FOLLOWERS.items()}
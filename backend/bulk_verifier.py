@@ -0,0 +1,180 @@
+import base64
+import hashlib
+import os
+from typing import Any
+
+from admin_audit import ADMIN_AUDIT_VOTER_REF
+from algorand_anchor import _indexer_client, build_anchor_note, scan_anchor_notes
+from algorand_client import AlgorandGovernanceClient
+from anchor_mirror import find_anchor
+from audit_reconciler import (
+    RECONCILE_HASH_MISMATCH,
+    RECONCILE_NOTE_MISMATCH,
+    RECONCILE_OK,
+    RECONCILE_PROOF_INVALID,
+    check_audit_event,
+)
+from db import db_cursor
+from merkle import verify_merkle_proof
+
+BULK_MISMATCH_SAMPLE = 20
+
+
+def _note_index(notes: dict[str, dict[str, Any]]) -> dict[str, set[str]]:
+    index: dict[str, set[str]] = {}
+    for tx_id, entry in notes.items():
+        index.setdefault(entry["note"], set()).add(tx_id)
+    return index
+
+
+def _round_window(rows_rounds: list[int | None], min_round: int | None, max_round: int | None) -> tuple[int | None, int | None]:
+    known = [int(r) for r in rows_rounds if r]
+    # Rows without a stored round force an open window on that side.
+    if min_round is None and known and len(known) == len(rows_rounds):
+        min_round = min(known)
+    if max_round is None and known and len(known) == len(rows_rounds):
+        max_round = max(known)
+    return min_round, max_round
+
+
+class _TableResult:
+    def __init__(self) -> None:
+        self.checked = 0
+        self.verified = 0
+        self.mismatches: list[dict[str, Any]] = []
+
+    def record(self, row_id: int, tx_id: str, status: str) -> None:
+        self.checked += 1
+        if status == RECONCILE_OK:
+            self.verified += 1
+        else:
+            self.mismatches.append({"id": row_id, "tx_id": tx_id, "status": status})
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "checked": self.checked,
+            "verified": self.verified,
+            "mismatched": len(self.mismatches),
+            "mismatches_sample": self.mismatches[:BULK_MISMATCH_SAMPLE],
+        }
+
+
+def _match(index: dict[str, set[str]], expected_note: str, tx_id: str) -> str:
+    if tx_id in index.get(expected_note, ()):
+        return RECONCILE_OK
+    return RECONCILE_NOTE_MISMATCH
+
+
+def _match_unpaged(tx_id: str, anchored_hash: str, expected_note: str) -> str:
+    # The mirror vouches for most anchors; anything it lacks is looked up by txid, limited to
+    # ANCHOR_SENDER so a tx_id pointed at someone else's transaction does not pass.
+    if any(anchor["tx_id"] == tx_id for anchor in find_anchor(anchored_hash, ADMIN_AUDIT_VOTER_REF)):
+        return RECONCILE_OK
+    res = _indexer_client().search_transactions(txid=tx_id, address=os.getenv("ANCHOR_SENDER"), address_role="sender")
+    for tx in res.get("transactions", []):
+        note_b64 = tx.get("note")
+        if note_b64 and base64.b64decode(note_b64).decode("utf-8", errors="replace") == expected_note:
+            return RECONCILE_OK
+    return RECONCILE_NOTE_MISMATCH
+
+
+def verify_anchors_in_bulk(
+    algo: AlgorandGovernanceClient,
+    min_round: int | None = None,
+    max_round: int | None = None,
+) -> dict[str, Any]:
+    with db_cursor() as (conn, cur):
+        cur.execute(
+            """
+            SELECT id, payload_json, entry_hash, anchored_tx_id, merkle_root, merkle_proof, anchored_round
+            FROM audit_events
+            WHERE severity IN ('HIGH', 'CRITICAL')
+            AND anchored_tx_id IS NOT NULL
+            AND (%s::BIGINT IS NULL OR anchored_round >= %s)
+            AND (%s::BIGINT IS NULL OR anchored_round <= %s)
+            ORDER BY id
+            """,
+            (min_round, min_round, max_round, max_round),
+        )
+        audit_rows = cur.fetchall()
+        cur.execute(
+            """
+            SELECT id, fairness_json, fairness_hash, tx_id, round
+            FROM fairness_snapshots
+            WHERE tx_id IS NOT NULL
+            AND (%s::BIGINT IS NULL OR round >= %s)
+            AND (%s::BIGINT IS NULL OR round <= %s)
+            ORDER BY id
+            """,
+            (min_round, min_round, max_round, max_round),
+        )
+        fairness_rows = cur.fetchall()
+        cur.execute(
+            """
+            SELECT id, decision_hash, algorand_tx_id, merkle_root, merkle_proof
+            FROM admin_audit_log
+            WHERE decision_hash IS NOT NULL
+            AND algorand_tx_id IS NOT NULL
+            ORDER BY id
+            """
+        )
+        admin_rows = cur.fetchall()
+
+    # Audit events and fairness snapshots are anchored by the governance client's sender,
+    # admin hashes by ANCHOR_SENDER; each sender is paged once over its round window.
+    service_window = _round_window([r[6] for r in audit_rows] + [r[4] for r in fairness_rows], min_round, max_round)
+    service_notes, service_pages = {}, 0
+    if audit_rows or fairness_rows:
+        service_notes, service_pages = algo.scan_sender_notes(*service_window)
+    service_index = _note_index(service_notes)
+
+    admin_notes, admin_pages = {}, 0
+    if admin_rows:
+        admin_notes, admin_pages = scan_anchor_notes(min_round=min_round, max_round=max_round)
+    admin_index = _note_index(admin_notes)
+
+    audit_result = _TableResult()
+    for row_id, payload_json, entry_hash, tx_id, merkle_root, merkle_proof, _ in audit_rows:
+        failure, expected_note = check_audit_event(payload_json, entry_hash, merkle_root, merkle_proof)
+        audit_result.record(row_id, tx_id, failure or _match(service_index, expected_note, tx_id))
+
+    fairness_result = _TableResult()
+    for row_id, fairness_json, fairness_hash, tx_id, _ in fairness_rows:
+        if hashlib.sha256(fairness_json.encode("utf-8")).hexdigest() != fairness_hash:
+            fairness_result.record(row_id, tx_id, RECONCILE_HASH_MISMATCH)
+            continue
+        fairness_result.record(row_id, tx_id, _match(service_index, fairness_hash, tx_id))
+
+    admin_result = _TableResult()
+    admin_outside_window = 0
+    windowed = min_round is not None or max_round is not None
+    for row_id, decision_hash, tx_id, merkle_root, merkle_proof in admin_rows:
+        if merkle_root and not verify_merkle_proof(decision_hash, merkle_proof or "[]", merkle_root):
+            admin_result.record(row_id, tx_id, RECONCILE_PROOF_INVALID)
+            continue
+        expected_note = build_anchor_note(ADMIN_AUDIT_VOTER_REF, merkle_root or decision_hash)
+        # Admin rows carry no round, so a windowed run resolves transactions it did not page on their own:
+        # a genuine anchor from another round is outside the window, anything else is a mismatch.
+        if windowed and tx_id not in admin_notes:
+            status = _match_unpaged(tx_id, merkle_root or decision_hash, expected_note)
+            if status == RECONCILE_OK:
+                admin_outside_window += 1
+            else:
+                admin_result.record(row_id, tx_id, status)
+            continue
+        admin_result.record(row_id, tx_id, _match(admin_index, expected_note, tx_id))
+
+    results = {
+        "audit_events": audit_result.as_dict(),
+        "fairness_snapshots": fairness_result.as_dict(),
+        "admin_audit_log": {**admin_result.as_dict(), "outside_window": admin_outside_window},
+    }
+    return {
+        "min_round": min_round,
+        "max_round": max_round,
+        "service_round_window": list(service_window),
+        "indexer_pages": service_pages + admin_pages,
+        "indexed_transactions": len(service_notes) + len(admin_notes),
+        "tables": results,
+        "compromised": any(table["mismatched"] for table in results.values()),
+    }
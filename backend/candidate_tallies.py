@@ -0,0 +1,194 @@
+import os
+import threading
+import time
+from typing import Any, Callable
+
+from db import db_cursor
+
+CANDIDATE_TALLIES_BUILT_KEY = "candidate_tallies_built"
+TALLY_RECONCILE_INTERVAL_SECONDS = float(os.getenv("TALLY_RECONCILE_INTERVAL_SECONDS", "60"))
+
+CANDIDATE_TALLIES_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS candidate_tallies (
+        candidate_id INTEGER PRIMARY KEY REFERENCES candidates(id) ON DELETE CASCADE,
+        votes BIGINT NOT NULL DEFAULT 0,
+        chain_votes BIGINT,
+        drift_passes INTEGER NOT NULL DEFAULT 0,
+        reconciled_at TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT NOW()
+    );
+
+    CREATE OR REPLACE FUNCTION apply_candidate_tally() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.candidate_id IS NOT NULL THEN
+            UPDATE candidate_tallies
+            SET votes = votes - 1, updated_at = NOW()
+            WHERE candidate_id = OLD.candidate_id;
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.candidate_id IS NOT NULL THEN
+            INSERT INTO candidate_tallies (candidate_id, votes, updated_at)
+            VALUES (NEW.candidate_id, 1, NOW())
+            ON CONFLICT (candidate_id)
+            DO UPDATE SET votes = candidate_tallies.votes + 1, updated_at = NOW();
+        END IF;
+        RETURN NULL;
+    END;
+    $$;
+
+    DROP TRIGGER IF EXISTS votes_candidate_tally ON votes;
+    CREATE TRIGGER votes_candidate_tally
+    AFTER INSERT OR DELETE OR UPDATE OF candidate_id ON votes
+    FOR EACH ROW EXECUTE FUNCTION apply_candidate_tally();
+"""
+
+
+def rebuild_candidate_tallies(cur) -> int:
+    # Writers are held off while the counts are recomputed so no vote lands between
+    # the aggregate and the trigger taking over.
+    cur.execute("LOCK TABLE votes IN SHARE MODE")
+    cur.execute("DELETE FROM candidate_tallies")
+    cur.execute(
+        """
+        INSERT INTO candidate_tallies (candidate_id, votes, updated_at)
+        SELECT c.id, COUNT(v.id), NOW()
+        FROM candidates c
+        LEFT JOIN votes v ON v.candidate_id = c.id
+        GROUP BY c.id
+        """
+    )
+    rebuilt = cur.rowcount
+    cur.execute(
+        """
+        INSERT INTO governance_state (key, value, updated_at)
+        VALUES (%s, 'true', NOW())
+        ON CONFLICT (key)
+        DO UPDATE SET value = EXCLUDED.value, updated_at = NOW();
+        """,
+        (CANDIDATE_TALLIES_BUILT_KEY,),
+    )
+    return rebuilt
+
+
+def ensure_candidate_tallies(cur) -> None:
+    cur.execute(CANDIDATE_TALLIES_SCHEMA)
+    cur.execute("SELECT 1 FROM governance_state WHERE key = %s", (CANDIDATE_TALLIES_BUILT_KEY,))
+    if not cur.fetchone():
+        rebuild_candidate_tallies(cur)
+
+
+def read_election_results(cur, election_id: str) -> list[dict[str, Any]]:
+    cur.execute(
+        """
+        SELECT c.id, c.name, COALESCE(t.votes, 0) AS votes
+        FROM candidates c
+        LEFT JOIN candidate_tallies t ON t.candidate_id = c.id
+        WHERE c.election_id = %s
+        ORDER BY votes DESC, c.name
+        """,
+        (election_id,),
+    )
+    return [{"id": r[0], "name": r[1], "votes": int(r[2])} for r in cur.fetchall()]
+
+
+def reconcile_candidate_tallies(election_id: str, slot_counts: dict[int, int]) -> dict[str, Any]:
+    # Chain counts lead the table while votes are still being recorded, so a gap only
+    # counts as drift once it has survived two consecutive passes; it is reported once.
+    with db_cursor() as (conn, cur):
+        cur.execute(
+            """
+            SELECT c.id, c.slot, COALESCE(t.votes, 0), COALESCE(t.drift_passes, 0)
+            FROM candidates c
+            LEFT JOIN candidate_tallies t ON t.candidate_id = c.id
+            WHERE c.election_id = %s
+            """,
+            (election_id,),
+        )
+        drifted = []
+        for candidate_id, slot, votes, drift_passes in cur.fetchall():
+            chain_votes = int(slot_counts.get(slot, 0))
+            drift_passes = drift_passes + 1 if chain_votes != votes else 0
+            cur.execute(
+                """
+                INSERT INTO candidate_tallies (candidate_id, votes, chain_votes, drift_passes, reconciled_at)
+                VALUES (%s, 0, %s, %s, NOW())
+                ON CONFLICT (candidate_id)
+                DO UPDATE SET chain_votes = EXCLUDED.chain_votes, drift_passes = EXCLUDED.drift_passes,
+                              reconciled_at = EXCLUDED.reconciled_at
+                """,
+                (candidate_id, chain_votes, drift_passes),
+            )
+            if drift_passes == 2:
+                drifted.append({"candidate_id": candidate_id, "db_votes": int(votes), "chain_votes": chain_votes})
+        conn.commit()
+    return {"election_id": election_id, "drifted": drifted}
+
+
+def tally_status(election_id: str) -> list[dict[str, Any]]:
+    with db_cursor() as (conn, cur):
+        cur.execute(
+            """
+            SELECT c.id, c.name, COALESCE(t.votes, 0), t.chain_votes, COALESCE(t.drift_passes, 0), t.reconciled_at
+            FROM candidates c
+            LEFT JOIN candidate_tallies t ON t.candidate_id = c.id
+            WHERE c.election_id = %s
+            ORDER BY c.id
+            """,
+            (election_id,),
+        )
+        return [
+            {
+                "id": r[0],
+                "name": r[1],
+                "votes": int(r[2]),
+                "chain_votes": r[3],
+                "drift_passes": int(r[4]),
+                "reconciled_at": r[5].isoformat() if r[5] else None,
+            }
+            for r in cur.fetchall()
+        ]
+
+
+class CandidateTallyReconciler:
+    def __init__(
+        self,
+        fetch_slot_counts: Callable[[str], dict[int, int]],
+        on_drift: Callable[[dict[str, Any]], None],
+        interval_seconds: float = TALLY_RECONCILE_INTERVAL_SECONDS,
+    ) -> None:
+        self._fetch_slot_counts = fetch_slot_counts
+        self._on_drift = on_drift
+        self._interval_seconds = max(5.0, interval_seconds)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="candidate-tally-reconciler", daemon=True)
+            self._thread.start()
+
+    def run_once(self) -> list[dict[str, Any]]:
+        with db_cursor() as (conn, cur):
+            cur.execute("SELECT election_id FROM elections ORDER BY election_id")
+            election_ids = [row[0] for row in cur.fetchall()]
+        results = []
+        for election_id in election_ids:
+            try:
+                result = reconcile_candidate_tallies(election_id, self._fetch_slot_counts(election_id))
+            except Exception:
+                continue
+            if result["drifted"]:
+                self._on_drift(result)
+            results.append(result)
+        return results
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self.run_once()
+            except Exception:
+                pass
+            time.sleep(self._interval_seconds)
@@ -1,13 +1,30 @@
 import json
+import os
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+CONSENSUS_FANOUT_FLAG = int(os.getenv("CONSENSUS_FANOUT_FLAG", "4"))
+CONSENSUS_REGULAR_CADENCE_STDDEV_SEC = float(os.getenv("CONSENSUS_REGULAR_CADENCE_STDDEV_SEC", "1.0"))
+
+VERDICTS = ("ALLOW", "FLAG", "BLOCK")
+ALLOW, FLAG, BLOCK = range(len(VERDICTS))
 
 
 def validator_rule_based(metadata):
     count = metadata["vote_attempt_count"]
     delta = metadata["time_between_attempts_sec"]
+    # A missing delta (no earlier attempt in the window) never satisfies a delta rule.
+    if delta is None:
+        delta = float("inf")
     if count >= 5 and delta <= 10:
         return "BLOCK", ["HIGH_FREQUENCY", "RETRY_PATTERN"]
     if count >= 3 and delta <= 20:
         return "FLAG", ["RAPID_ATTEMPTS"]
+    if max(metadata.get("ip_fanout", 0), metadata.get("device_fanout", 0)) >= CONSENSUS_FANOUT_FLAG:
+        return "FLAG", ["IDENTITY_FANOUT"]
     return "ALLOW", []
 
 
@@ -15,6 +32,8 @@ def validator_statistical(metadata):
     # Deterministic heuristic proxy for "statistical" behavior
     count = metadata["vote_attempt_count"]
     delta = metadata["time_between_attempts_sec"]
+    if delta is None:
+        delta = float("inf")
     score = 0.1
     if count >= 4:
         score += 0.3
@@ -22,6 +41,10 @@ def validator_statistical(metadata):
         score += 0.3
     if count >= 7:
         score += 0.3
+    # Scripted clients retry on a near-constant cadence; humans do not.
+    variance = metadata.get("inter_arrival_variance")
+    if count >= 4 and variance is not None and variance <= CONSENSUS_REGULAR_CADENCE_STDDEV_SEC**2:
+        score += 0.3
 
     if score >= 0.7:
         return "BLOCK", ["STAT_OUTLIER"]
@@ -30,7 +53,9 @@ def validator_statistical(metadata):
     return "ALLOW", []
 
 
-def run_consensus(ai_verdict, metadata):
+def run_consensus(ai_verdict, metadata=None, store=None, identity=None):
+    if metadata is None:
+        metadata = store.features(identity)
     validators = {
         "ai": {"verdict": ai_verdict, "rules": ["AI_DECISION"]},
         "rule_based": {},
@@ -51,3 +76,88 @@ def run_consensus(ai_verdict, metadata):
         final_verdict = "ALLOW"
 
     return final_verdict, validators, json.dumps(validators, sort_keys=True)
+
+
+# Batch scoring mirrors the scalar validators above over columnar arrays, one element per
+# attempt. Verdicts are int8 codes indexing VERDICTS; optional features default to values
+# that never fire, like missing keys in the scalar path.
+def require_numpy():
+    if np is None:
+        raise RuntimeError("numpy is required for batch consensus scoring")
+
+
+def _batch_inputs(counts, deltas, ip_fanout=None, device_fanout=None, inter_arrival_variance=None):
+    require_numpy()
+    counts = np.asarray(counts, dtype=np.int64)
+    deltas = np.asarray(deltas, dtype=np.float64)
+    size = counts.shape[0]
+    ip_fanout = np.zeros(size, dtype=np.int64) if ip_fanout is None else np.asarray(ip_fanout, dtype=np.int64)
+    device_fanout = (
+        np.zeros(size, dtype=np.int64) if device_fanout is None else np.asarray(device_fanout, dtype=np.int64)
+    )
+    # NaN stands in for a None delta or variance; it fails every comparison, as None does.
+    variance = (
+        np.full(size, np.nan) if inter_arrival_variance is None else np.asarray(inter_arrival_variance, dtype=np.float64)
+    )
+    return counts, deltas, ip_fanout, device_fanout, variance
+
+
+def validator_rule_based_batch(counts, deltas, ip_fanout=None, device_fanout=None):
+    counts, deltas, ip_fanout, device_fanout, _ = _batch_inputs(counts, deltas, ip_fanout, device_fanout)
+    block = (counts >= 5) & (deltas <= 10)
+    flag = ~block & (counts >= 3) & (deltas <= 20)
+    fanout = ~block & ~flag & (np.maximum(ip_fanout, device_fanout) >= CONSENSUS_FANOUT_FLAG)
+    verdicts = np.full(counts.shape[0], ALLOW, dtype=np.int8)
+    verdicts[flag | fanout] = FLAG
+    verdicts[block] = BLOCK
+    masks = {
+        "HIGH_FREQUENCY": block,
+        "RETRY_PATTERN": block,
+        "RAPID_ATTEMPTS": flag,
+        "IDENTITY_FANOUT": fanout,
+    }
+    return verdicts, masks
+
+
+def validator_statistical_batch(counts, deltas, inter_arrival_variance=None):
+    counts, deltas, _, _, variance = _batch_inputs(counts, deltas, inter_arrival_variance=inter_arrival_variance)
+    # Scores are accumulated in the scalar path's order so the float thresholds compare identically.
+    score = np.full(counts.shape[0], 0.1)
+    score += np.where(counts >= 4, 0.3, 0.0)
+    score += np.where(deltas <= 15, 0.3, 0.0)
+    score += np.where(counts >= 7, 0.3, 0.0)
+    score += np.where((counts >= 4) & (variance <= CONSENSUS_REGULAR_CADENCE_STDDEV_SEC**2), 0.3, 0.0)
+    verdicts = np.full(counts.shape[0], ALLOW, dtype=np.int8)
+    verdicts[score >= 0.4] = FLAG
+    verdicts[score >= 0.7] = BLOCK
+    return verdicts, {"STAT_OUTLIER": verdicts != ALLOW}
+
+
+def run_consensus_batch(ai_verdicts, counts, deltas, ip_fanout=None, device_fanout=None, inter_arrival_variance=None):
+    counts, deltas, ip_fanout, device_fanout, variance = _batch_inputs(
+        counts, deltas, ip_fanout, device_fanout, inter_arrival_variance
+    )
+    ai = np.asarray(ai_verdicts)
+    if ai.dtype.kind in "US":
+        ai = np.select([ai == "BLOCK", ai == "FLAG"], [BLOCK, FLAG], ALLOW).astype(np.int8)
+    ai = np.broadcast_to(ai.astype(np.int8), counts.shape)
+    rule_verdicts, rule_masks = validator_rule_based_batch(counts, deltas, ip_fanout, device_fanout)
+    stat_verdicts, stat_masks = validator_statistical_batch(counts, deltas, variance)
+
+    blocks = (ai == BLOCK).astype(np.int8) + (rule_verdicts == BLOCK) + (stat_verdicts == BLOCK)
+    flags = (ai == FLAG).astype(np.int8) + (rule_verdicts == FLAG) + (stat_verdicts == FLAG)
+    final = np.full(counts.shape[0], ALLOW, dtype=np.int8)
+    final[flags >= 2] = FLAG
+    final[blocks >= 2] = BLOCK
+    return {
+        "final": final,
+        "ai": ai,
+        "rule_based": rule_verdicts,
+        "statistical": stat_verdicts,
+        "rule_masks": {"rule_based": rule_masks, "statistical": stat_masks},
+    }
+
+
+def verdict_labels(codes):
+    require_numpy()
+    return np.asarray(VERDICTS)[np.asarray(codes)]
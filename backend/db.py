@@ -1,21 +1,254 @@
 import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import psycopg2
+from psycopg2 import extensions
 from psycopg2 import pool as pg_pool
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise RuntimeError("DATABASE_URL environment variable is not set")
 
-_POOL = pg_pool.SimpleConnectionPool(
-    1,
-    10,
+DB_POOL_MIN = int(os.getenv("DB_POOL_MIN", "1"))
+DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", "10"))
+DB_POOL_ACQUIRE_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_ACQUIRE_TIMEOUT_SECONDS", "10"))
+DB_POOL_IDLE_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_IDLE_TIMEOUT_SECONDS", "300"))
+DB_POOL_HEALTH_CHECK_IDLE_SECONDS = float(os.getenv("DB_POOL_HEALTH_CHECK_IDLE_SECONDS", "30"))
+
+CHECKOUT_LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class PoolTimeout(pg_pool.PoolError):
+    pass
+
+
+class ConnectionPool:
+    def __init__(
+        self,
+        minconn: int,
+        maxconn: int,
+        acquire_timeout: float,
+        idle_timeout: float,
+        health_check_idle: float,
+        **connect_kwargs,
+    ) -> None:
+        if maxconn < 1 or minconn < 0 or minconn > maxconn:
+            raise ValueError("Invalid connection pool bounds")
+        self._minconn = minconn
+        self._maxconn = maxconn
+        self._acquire_timeout = acquire_timeout
+        self._idle_timeout = idle_timeout
+        self._health_check_idle = health_check_idle
+        self._connect_kwargs = connect_kwargs
+        self._cond = threading.Condition()
+        self._idle: deque = deque()
+        self._size = 0
+        self._in_use = 0
+        self._waiting = 0
+        self._stats = {
+            "checkouts": 0,
+            "timeouts": 0,
+            "connections_created": 0,
+            "connections_closed": 0,
+            "health_check_failures": 0,
+            "idle_reaped": 0,
+            "wait_seconds_total": 0.0,
+            "max_wait_seconds": 0.0,
+        }
+        self._latency_buckets = [0] * (len(CHECKOUT_LATENCY_BUCKETS_MS) + 1)
+
+        for _ in range(minconn):
+            conn = self._connect()
+            self._size += 1
+            self._idle.append((conn, time.monotonic()))
+
+        reaper = threading.Thread(target=self._reap_forever, name="db-pool-reaper", daemon=True)
+        reaper.start()
+
+    def _connect(self):
+        conn = psycopg2.connect(**self._connect_kwargs)
+        with self._cond:
+            self._stats["connections_created"] += 1
+        return conn
+
+    def _discard(self, conn) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._size -= 1
+            self._stats["connections_closed"] += 1
+            self._cond.notify()
+
+    def _is_healthy(self, conn, idle_since: float) -> bool:
+        if conn.closed:
+            return False
+        if time.monotonic() - idle_since < self._health_check_idle:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    def getconn(self, timeout: float | None = None):
+        started = time.monotonic()
+        deadline = started + (self._acquire_timeout if timeout is None else timeout)
+        while True:
+            with self._cond:
+                while True:
+                    if self._idle:
+                        conn, idle_since = self._idle.pop()
+                        break
+                    if self._size < self._maxconn:
+                        self._size += 1
+                        conn, idle_since = None, None
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        raise PoolTimeout(f"No database connection available within {deadline - started:.1f}s")
+                    self._waiting += 1
+                    try:
+                        self._cond.wait(remaining)
+                    finally:
+                        self._waiting -= 1
+                waited = time.monotonic() - started
+                self._stats["wait_seconds_total"] += waited
+                self._stats["max_wait_seconds"] = max(self._stats["max_wait_seconds"], waited)
+
+            if conn is None:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+            elif not self._is_healthy(conn, idle_since):
+                with self._cond:
+                    self._stats["health_check_failures"] += 1
+                self._discard(conn)
+                continue
+
+            latency_ms = (time.monotonic() - started) * 1000
+            with self._cond:
+                self._in_use += 1
+                self._stats["checkouts"] += 1
+                bucket = len(CHECKOUT_LATENCY_BUCKETS_MS)
+                for idx, bound in enumerate(CHECKOUT_LATENCY_BUCKETS_MS):
+                    if latency_ms <= bound:
+                        bucket = idx
+                        break
+                self._latency_buckets[bucket] += 1
+            return conn
+
+    def putconn(self, conn, close: bool = False) -> None:
+        with self._cond:
+            self._in_use -= 1
+        if close or conn.closed:
+            self._discard(conn)
+            return
+        try:
+            # Never hand out a connection that still carries another request's open transaction.
+            if conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+        except Exception:
+            self._discard(conn)
+            return
+        with self._cond:
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    def reap_idle(self) -> int:
+        cutoff = time.monotonic() - self._idle_timeout
+        expired = []
+        with self._cond:
+            # Oldest idle connections sit at the left of the deque.
+            while self._idle and self._size - len(expired) > self._minconn and self._idle[0][1] < cutoff:
+                expired.append(self._idle.popleft()[0])
+            self._stats["idle_reaped"] += len(expired)
+        for conn in expired:
+            self._discard(conn)
+        return len(expired)
+
+    def _reap_forever(self) -> None:
+        interval = max(1.0, self._idle_timeout / 2)
+        while True:
+            time.sleep(interval)
+            try:
+                self.reap_idle()
+            except Exception:
+                pass
+
+    def metrics(self) -> dict:
+        with self._cond:
+            stats = dict(self._stats)
+            stats.update(
+                {
+                    "min_size": self._minconn,
+                    "max_size": self._maxconn,
+                    "size": self._size,
+                    "in_use": self._in_use,
+                    "idle": len(self._idle),
+                    "waiters": self._waiting,
+                }
+            )
+            labels = [f"le_{bound}ms" for bound in CHECKOUT_LATENCY_BUCKETS_MS] + ["le_inf"]
+            stats["checkout_latency_histogram"] = dict(zip(labels, self._latency_buckets))
+        if stats["checkouts"]:
+            stats["avg_wait_seconds"] = stats["wait_seconds_total"] / stats["checkouts"]
+        return stats
+
+
+_POOL = ConnectionPool(
+    DB_POOL_MIN,
+    DB_POOL_MAX,
+    acquire_timeout=DB_POOL_ACQUIRE_TIMEOUT_SECONDS,
+    idle_timeout=DB_POOL_IDLE_TIMEOUT_SECONDS,
+    health_check_idle=DB_POOL_HEALTH_CHECK_IDLE_SECONDS,
     dsn=DATABASE_URL,
     sslmode="require",
-    connect_timeout=10
+    connect_timeout=10,
 )
 
+
 def get_connection():
     return _POOL.getconn()
 
+
 def release_connection(conn):
     if conn:
-        _POOL.putconn(conn)
\ No newline at end of file
+        _POOL.putconn(conn)
+
+
+def pool_metrics():
+    return _POOL.metrics()
+
+
+@contextmanager
+def db_connection():
+    conn = get_connection()
+    try:
+        yield conn
+    finally:
+        release_connection(conn)
+
+
+@contextmanager
+def db_cursor():
+    conn = get_connection()
+    try:
+        cur = conn.cursor()
+        try:
+            yield conn, cur
+        finally:
+            cur.close()
+    finally:
+        release_connection(conn)
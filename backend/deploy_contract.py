@@ -7,6 +7,8 @@ import base64
 
 load_dotenv()
 
+from algorand_client import TALLY_STORAGE, election_app_args, tally_box_mbr, with_tally_box_refs
+
 ALGOD_ADDRESS = os.getenv("ALGORAND_ALGOD_ADDRESS")
 ALGOD_TOKEN = os.getenv("ALGORAND_ALGOD_TOKEN", "")
 SERVICE_MNEMONIC = os.getenv("ALGORAND_SERVICE_MNEMONIC")
@@ -16,8 +18,17 @@ CANDIDATE_IDS = [int(x.strip()) for x in os.getenv("SMART_CONTRACT_CANDIDATE_IDS
 MAX_CANDIDATES = int(os.getenv("SMART_CONTRACT_MAX_CANDIDATES", "50"))
 if MAX_CANDIDATES < len(CANDIDATE_IDS):
     raise ValueError("SMART_CONTRACT_MAX_CANDIDATES must be >= number of initial candidate ids")
-if MAX_CANDIDATES + 3 > 64:
-    raise ValueError("SMART_CONTRACT_MAX_CANDIDATES too high for Algorand global state limits")
+TALLY_SLOTS = MAX_CANDIDATES + 1
+# Initial candidates are registered under these values as their tally slots, so each one
+# must be a slot the box contract accepts and match `candidates.slot` in the database.
+if TALLY_STORAGE == "box" and any(cid < 1 or cid >= TALLY_SLOTS for cid in CANDIDATE_IDS):
+    raise ValueError("SMART_CONTRACT_CANDIDATE_IDS must be slots between 1 and SMART_CONTRACT_MAX_CANDIDATES")
+if TALLY_STORAGE == "box":
+    # The packed tally box must fit the 8KB of box I/O that one transaction's references can buy.
+    if TALLY_SLOTS * 8 + 1 > 8 * 1024:
+        raise ValueError("SMART_CONTRACT_MAX_CANDIDATES too high for a single tally box")
+elif MAX_CANDIDATES + 3 > 64:
+    raise ValueError("SMART_CONTRACT_MAX_CANDIDATES too high for Algorand global state limits (use ALGORAND_TALLY_STORAGE=box)")
 
 headers = {"X-API-Key": ALGOD_TOKEN} if ALGOD_TOKEN else {}
 client = algod.AlgodClient(ALGOD_TOKEN, ALGOD_ADDRESS, headers=headers)
@@ -28,7 +39,7 @@ from algosdk import account
 sender = account.address_from_private_key(private_key)
 
 
-approval_teal, clear_teal = compile_contract(CANDIDATE_IDS)
+approval_teal, clear_teal = compile_contract(CANDIDATE_IDS, TALLY_STORAGE, TALLY_SLOTS)
 
 approval_compiled = client.compile(approval_teal)
 clear_compiled = client.compile(clear_teal)
@@ -45,7 +56,7 @@ txn = transaction.ApplicationCreateTxn(
     approval_program=approval_program,
     clear_program=clear_program,
     global_schema=transaction.StateSchema(
-        num_uints=MAX_CANDIDATES + 1,
+        num_uints=1 if TALLY_STORAGE == "box" else MAX_CANDIDATES + 1,
         num_byte_slices=2,
     ),
     local_schema=transaction.StateSchema(0, 0),
@@ -60,12 +71,45 @@ txid = client.send_transaction(signed_txn)
 
 print("txid:", txid)
 
-last_round = client.status()["last-round"]
-while True:
-    pending = client.pending_transaction_info(txid)
-    if pending.get("confirmed-round", 0) > 0:
-        print("confirmed_round:", pending["confirmed-round"])
-        print("app_id:", pending["application-index"])
-        break
-    last_round += 1
-    client.status_after_block(last_round)
+
+def wait_confirmed(txid):
+    last_round = client.status()["last-round"]
+    while True:
+        pending = client.pending_transaction_info(txid)
+        if pending.get("confirmed-round", 0) > 0:
+            return pending
+        last_round += 1
+        client.status_after_block(last_round)
+
+
+pending = wait_confirmed(txid)
+print("confirmed_round:", pending["confirmed-round"])
+app_id = pending["application-index"]
+print("app_id:", app_id)
+
+if TALLY_STORAGE == "box":
+    # Box tallies cannot be written at creation: fund the app account, open the
+    # default election's tally box, then register the initial candidates one by one.
+    from algosdk.logic import get_application_address
+
+    fund_txn = transaction.PaymentTxn(sender, client.suggested_params(), get_application_address(app_id), 100000 + tally_box_mbr())
+    wait_confirmed(client.send_transaction(fund_txn.sign(private_key)))
+    create_election_txn = transaction.ApplicationNoOpTxn(
+        sender=sender,
+        sp=client.suggested_params(),
+        index=app_id,
+        app_args=[b"create_election"] + election_app_args(ELECTION_ID) + [DEADLINE_TS.to_bytes(8, "big")],
+        boxes=with_tally_box_refs([], ELECTION_ID),
+    )
+    wait_confirmed(client.send_transaction(create_election_txn.sign(private_key)))
+    print("created election:", ELECTION_ID)
+    for candidate_id in CANDIDATE_IDS:
+        add_txn = transaction.ApplicationNoOpTxn(
+            sender=sender,
+            sp=client.suggested_params(),
+            index=app_id,
+            app_args=[b"add_candidate", candidate_id.to_bytes(8, "big")] + election_app_args(ELECTION_ID),
+            boxes=with_tally_box_refs([], ELECTION_ID),
+        )
+        wait_confirmed(client.send_transaction(add_txn.sign(private_key)))
+        print("registered candidate:", candidate_id)
@@ -1,27 +1,209 @@
-import smtplib
+import heapq
 import os
+import queue
+import smtplib
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
 from email.message import EmailMessage
 
+MAIL_DELIVERY_MODE = os.getenv("MAIL_DELIVERY_MODE", "queue").strip().lower()
+MAIL_WORKERS = int(os.getenv("MAIL_WORKERS", "2"))
+MAIL_BATCH_SIZE = int(os.getenv("MAIL_BATCH_SIZE", "20"))
+MAIL_MAX_ATTEMPTS = int(os.getenv("MAIL_MAX_ATTEMPTS", "5"))
+MAIL_RETRY_BASE_SECONDS = float(os.getenv("MAIL_RETRY_BASE_SECONDS", "2"))
+MAIL_IDLE_DISCONNECT_SECONDS = float(os.getenv("MAIL_IDLE_DISCONNECT_SECONDS", "60"))
+MAIL_STATUS_HISTORY = int(os.getenv("MAIL_STATUS_HISTORY", "10000"))
 
-def _send_email(to_email, subject, body):
+
+def _build_message(to_email, subject, body):
     msg = EmailMessage()
     msg["Subject"] = subject
     msg["From"] = os.getenv("SMTP_EMAIL")
     msg["To"] = to_email
     msg.set_content(body)
+    return msg
 
-    server = smtplib.SMTP(os.getenv("SMTP_HOST"), int(os.getenv("SMTP_PORT")))
-    server.starttls()
-    server.login(
-        os.getenv("SMTP_EMAIL"),
-        os.getenv("SMTP_PASSWORD")
-    )
-    server.send_message(msg)
-    server.quit()
+
+def _open_smtp():
+    server = smtplib.SMTP(os.getenv("SMTP_HOST"), int(os.getenv("SMTP_PORT")), timeout=30)
+    # A local stand-in server (e.g. `python -m aiosmtpd -n`) speaks neither TLS nor AUTH.
+    if os.getenv("SMTP_STARTTLS", "true").strip().lower() != "false":
+        server.starttls()
+    if os.getenv("SMTP_PASSWORD"):
+        server.login(
+            os.getenv("SMTP_EMAIL"),
+            os.getenv("SMTP_PASSWORD")
+        )
+    return server
+
+
+def _close_smtp(server):
+    try:
+        server.quit()
+    except Exception:
+        try:
+            server.close()
+        except Exception:
+            pass
+
+
+def _send_email(to_email, subject, body):
+    server = _open_smtp()
+    try:
+        server.send_message(_build_message(to_email, subject, body))
+    finally:
+        _close_smtp(server)
+
+
+@dataclass
+class OutboundMail:
+    message_id: str
+    to_email: str
+    subject: str
+    body: str
+    attempts: int = 0
+
+
+class MailQueue:
+    def __init__(
+        self,
+        connect=_open_smtp,
+        workers=MAIL_WORKERS,
+        batch_size=MAIL_BATCH_SIZE,
+        max_attempts=MAIL_MAX_ATTEMPTS,
+        retry_base_seconds=MAIL_RETRY_BASE_SECONDS,
+        idle_disconnect_seconds=MAIL_IDLE_DISCONNECT_SECONDS,
+    ):
+        self._connect = connect
+        self._workers = max(1, workers)
+        self._batch_size = max(1, batch_size)
+        self._max_attempts = max(1, max_attempts)
+        self._retry_base_seconds = retry_base_seconds
+        self._idle_disconnect_seconds = idle_disconnect_seconds
+        self._queue = queue.Queue()
+        self._retries = []
+        self._lock = threading.Lock()
+        self._status = OrderedDict()
+        self._started = False
+
+    def start(self):
+        with self._lock:
+            if self._started:
+                return
+            for idx in range(self._workers):
+                threading.Thread(target=self._run, name=f"mail-worker-{idx}", daemon=True).start()
+            self._started = True
+
+    def enqueue(self, to_email, subject, body):
+        mail = OutboundMail(uuid.uuid4().hex, to_email, subject, body)
+        self._set_status(mail, "queued")
+        self.start()
+        self._queue.put(mail)
+        return mail.message_id
+
+    def status(self, message_id):
+        with self._lock:
+            entry = self._status.get(message_id)
+            return dict(entry) if entry else None
+
+    def stats(self):
+        with self._lock:
+            counts = {}
+            for entry in self._status.values():
+                counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+            return {"queued": self._queue.qsize(), "scheduled_retries": len(self._retries), "by_status": counts}
+
+    def _set_status(self, mail, status, error=None):
+        with self._lock:
+            self._status[mail.message_id] = {
+                "status": status,
+                "to": mail.to_email,
+                "attempts": mail.attempts,
+                "last_error": error,
+                "updated_at": int(time.time()),
+            }
+            self._status.move_to_end(mail.message_id)
+            while len(self._status) > MAIL_STATUS_HISTORY:
+                self._status.popitem(last=False)
+
+    def _schedule_retry(self, mail, error):
+        if mail.attempts >= self._max_attempts:
+            self._set_status(mail, "failed", error)
+            return
+        delay = self._retry_base_seconds * (2 ** (mail.attempts - 1))
+        with self._lock:
+            heapq.heappush(self._retries, (time.monotonic() + delay, mail.message_id, mail))
+        self._set_status(mail, "retrying", error)
+
+    def _promote_due_retries(self):
+        now = time.monotonic()
+        with self._lock:
+            while self._retries and self._retries[0][0] <= now:
+                _, _, mail = heapq.heappop(self._retries)
+                self._queue.put(mail)
+
+    def _next_batch(self):
+        try:
+            batch = [self._queue.get(timeout=0.5)]
+        except queue.Empty:
+            return []
+        while len(batch) < self._batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        server = None
+        last_used = time.monotonic()
+        while True:
+            self._promote_due_retries()
+            batch = self._next_batch()
+            if not batch:
+                if server is not None and time.monotonic() - last_used > self._idle_disconnect_seconds:
+                    _close_smtp(server)
+                    server = None
+                continue
+
+            for mail in batch:
+                mail.attempts += 1
+                try:
+                    if server is None:
+                        server = self._connect()
+                    server.send_message(_build_message(mail.to_email, mail.subject, mail.body))
+                    self._set_status(mail, "sent")
+                except smtplib.SMTPResponseException as exc:
+                    if 500 <= exc.smtp_code < 600:
+                        # Permanent rejection: retrying the same message will not help.
+                        self._set_status(mail, "failed", str(exc))
+                    else:
+                        self._schedule_retry(mail, str(exc))
+                except smtplib.SMTPRecipientsRefused as exc:
+                    self._set_status(mail, "failed", str(exc))
+                except Exception as exc:
+                    if server is not None:
+                        _close_smtp(server)
+                        server = None
+                    self._schedule_retry(mail, str(exc))
+            last_used = time.monotonic()
+
+
+MAIL_QUEUE = MailQueue()
+
+
+def _deliver(to_email, subject, body):
+    if MAIL_DELIVERY_MODE == "sync":
+        _send_email(to_email=to_email, subject=subject, body=body)
+        return None
+    return MAIL_QUEUE.enqueue(to_email, subject, body)
 
 
 def send_verification_otp(to_email, otp):
-    _send_email(
+    return _deliver(
         to_email=to_email,
         subject="TrustPoll - Verify your email",
         body=f"""
@@ -40,7 +222,7 @@ If you did not request this, please ignore this email.
 
 
 def send_registration_success_email(to_email):
-    _send_email(
+    return _deliver(
         to_email=to_email,
         subject="TrustPoll - Registration successful",
         body=f"""
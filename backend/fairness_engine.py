@@ -0,0 +1,218 @@
+import os
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import Future
+from typing import Any, Callable
+
+MISSING_COUNTER_KEY = "fairness_missing_vote_tx"
+INVALID_COUNTER_KEY = "fairness_invalid_vote_tx"
+FAIRNESS_COUNTER_KEYS = (MISSING_COUNTER_KEY, INVALID_COUNTER_KEY)
+VERIFY_BATCH_SIZE = int(os.getenv("FAIRNESS_VERIFY_BATCH_SIZE", "200"))
+SNAPSHOT_WINDOW_SECONDS = float(os.getenv("FAIRNESS_SNAPSHOT_WINDOW_SECONDS", "5"))
+
+
+def _verify_vote_tx(algo, tx_id: str | None) -> tuple[str, int | None]:
+    if not tx_id:
+        return "MISSING", None
+    try:
+        verification = algo.verify_vote_transaction(tx_id)
+    except Exception:
+        return "ERROR", None
+    status = "SUCCESS" if verification.get("status") == "SUCCESS" else "FAILED"
+    return status, int(verification.get("confirmed_round") or 0) or None
+
+
+def _stored_key(key: str, election_id: str) -> str:
+    # Counters live in governance_state under one key per election.
+    return f"{key}:{election_id}"
+
+
+def _read_counters(cur, election_id: str, for_update: bool = False) -> dict[str, int]:
+    stored = {_stored_key(key, election_id): key for key in FAIRNESS_COUNTER_KEYS}
+    query = "SELECT key, value FROM governance_state WHERE key = ANY(%s)"
+    if for_update:
+        # Seed the rows first so a new election's counters have something to lock.
+        cur.execute(
+            """
+            INSERT INTO governance_state (key, value)
+            SELECT key, '0' FROM unnest(%s::TEXT[]) AS key
+            ON CONFLICT (key) DO NOTHING
+            """,
+            (list(stored),),
+        )
+        query += " FOR UPDATE"
+    cur.execute(query, (list(stored),))
+    counters = {key: 0 for key in FAIRNESS_COUNTER_KEYS}
+    for key, value in cur.fetchall():
+        counters[stored[key]] = int(value)
+    return counters
+
+
+def _write_counters(cur, election_id: str, counters: dict[str, int]) -> None:
+    for key, value in counters.items():
+        cur.execute(
+            """
+            INSERT INTO governance_state (key, value, updated_at)
+            VALUES (%s, %s, NOW())
+            ON CONFLICT (key)
+            DO UPDATE SET value = EXCLUDED.value, updated_at = NOW();
+            """,
+            (_stored_key(key, election_id), str(value)),
+        )
+
+
+def _lookup_verifications(algo, rows, skip_errors: bool) -> list[tuple[int, str, int | None]]:
+    results = []
+    for vote_id, tx_id in rows:
+        status, verified_round = _verify_vote_tx(algo, tx_id)
+        if status == "ERROR" and skip_errors:
+            continue
+        results.append((vote_id, status, verified_round))
+    return results
+
+
+def _apply_verifications(cur, results, previous_status: str | None, counters: dict[str, int]) -> None:
+    for vote_id, status, verified_round in results:
+        # Only the sync that moves a vote out of its previous status counts it, so a
+        # concurrent sync that looked up the same vote does not count it twice.
+        cur.execute(
+            """
+            UPDATE votes
+            SET verification_status = %s, verified_round = %s, verified_at = NOW()
+            WHERE id = %s AND verification_status IS NOT DISTINCT FROM %s
+            """,
+            (status, verified_round, vote_id, previous_status),
+        )
+        if cur.rowcount != 1:
+            continue
+        if status == "MISSING":
+            counters[MISSING_COUNTER_KEY] += 1
+        elif status == "FAILED":
+            counters[INVALID_COUNTER_KEY] += 1
+
+
+def _verify_batch(conn, cur, algo, election_id: str, rows, previous_status: str | None, skip_errors: bool) -> None:
+    # Indexer round trips happen outside any transaction; the counter rows are
+    # locked only while the results are written back.
+    conn.commit()
+    results = _lookup_verifications(algo, rows, skip_errors)
+    counters = _read_counters(cur, election_id, for_update=True)
+    _apply_verifications(cur, results, previous_status, counters)
+    _write_counters(cur, election_id, counters)
+    conn.commit()
+
+
+def sync_vote_verifications(conn, algo, election_id: str) -> dict[str, int]:
+    # Every vote is verified against the chain once and folded into the running
+    # counters; lookups that errored are retried and count as invalid meanwhile.
+    cur = conn.cursor()
+    newly_verified = 0
+    try:
+        cur.execute(
+            "SELECT id, tx_id FROM votes WHERE election_id = %s AND verification_status = 'ERROR' ORDER BY id",
+            (election_id,),
+        )
+        _verify_batch(conn, cur, algo, election_id, cur.fetchall(), "ERROR", skip_errors=True)
+
+        while True:
+            cur.execute(
+                """
+                SELECT id, tx_id
+                FROM votes
+                WHERE election_id = %s AND verification_status IS NULL
+                ORDER BY id
+                LIMIT %s
+                """,
+                (election_id, VERIFY_BATCH_SIZE),
+            )
+            rows = cur.fetchall()
+            _verify_batch(conn, cur, algo, election_id, rows, None, skip_errors=False)
+            newly_verified += len(rows)
+            if len(rows) < VERIFY_BATCH_SIZE:
+                break
+
+        cur.execute(
+            "SELECT COUNT(*) FROM votes WHERE election_id = %s AND verification_status = 'ERROR'",
+            (election_id,),
+        )
+        unresolved = int(cur.fetchone()[0])
+        counters = _read_counters(cur, election_id)
+        return {
+            "missing_vote_tx_count": counters[MISSING_COUNTER_KEY],
+            "invalid_vote_tx_count": counters[INVALID_COUNTER_KEY] + unresolved,
+            "unresolved_vote_tx_count": unresolved,
+            "newly_verified_vote_tx_count": newly_verified,
+        }
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cur.close()
+
+
+def rebuild_fairness_counters(conn, election_id: str) -> dict[str, int]:
+    cur = conn.cursor()
+    try:
+        _read_counters(cur, election_id, for_update=True)
+        cur.execute(
+            """
+            SELECT
+                COUNT(*) FILTER (WHERE verification_status = 'MISSING'),
+                COUNT(*) FILTER (WHERE verification_status = 'FAILED')
+            FROM votes
+            WHERE election_id = %s
+            """,
+            (election_id,),
+        )
+        missing, invalid = cur.fetchone()
+        counters = {MISSING_COUNTER_KEY: int(missing or 0), INVALID_COUNTER_KEY: int(invalid or 0)}
+        _write_counters(cur, election_id, counters)
+        conn.commit()
+        return counters
+    finally:
+        cur.close()
+
+
+class FairnessSnapshotScheduler:
+    def __init__(self, compute: Callable[[str, dict[str, int]], dict[str, Any]], window_seconds: float = 5.0) -> None:
+        self._compute = compute
+        self._window_seconds = max(0.0, window_seconds)
+        self._cond = threading.Condition()
+        # Triggers coalesce per election; each election gets its own snapshot.
+        self._pending: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        self._waiters: defaultdict[str, list[Future]] = defaultdict(list)
+        self._thread: threading.Thread | None = None
+
+    def request(self, election_id: str, trigger: str) -> Future:
+        future: Future = Future()
+        with self._cond:
+            self._pending[election_id][trigger] += 1
+            self._waiters[election_id].append(future)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="fairness-snapshots", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return future
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+            if self._window_seconds:
+                time.sleep(self._window_seconds)
+            with self._cond:
+                pending = self._pending
+                waiters = self._waiters
+                self._pending = defaultdict(Counter)
+                self._waiters = defaultdict(list)
+            for election_id, triggers in pending.items():
+                try:
+                    result = self._compute(election_id, dict(triggers))
+                except Exception as exc:
+                    for waiter in waiters[election_id]:
+                        waiter.set_exception(exc)
+                    continue
+                for waiter in waiters[election_id]:
+                    waiter.set_result(result)
@@ -0,0 +1,281 @@
+import csv
+import io
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from db import db_cursor
+
+FEATURE_STORE_MAX_IDENTITIES = int(os.getenv("FEATURE_STORE_MAX_IDENTITIES", "100000"))
+FEATURE_STORE_RATE_WINDOW_SECONDS = float(os.getenv("FEATURE_STORE_RATE_WINDOW_SECONDS", "60"))
+FEATURE_STORE_MAX_FANOUT = int(os.getenv("FEATURE_STORE_MAX_FANOUT", "32"))
+FEATURE_STORE_FANOUT_WINDOW_SECONDS = float(os.getenv("FEATURE_STORE_FANOUT_WINDOW_SECONDS", "3600"))
+FEATURE_STORE_SNAPSHOT_INTERVAL_SECONDS = float(os.getenv("FEATURE_STORE_SNAPSHOT_INTERVAL_SECONDS", "30"))
+FEATURE_STORE_IDLE_TTL_SECONDS = float(os.getenv("FEATURE_STORE_IDLE_TTL_SECONDS", "86400"))
+
+# Attempts inside the rate window are kept as timestamps; this caps the deque so a flood
+# from one identity cannot grow it without bound (the count saturates instead).
+_MAX_RECENT_ATTEMPTS = 256
+
+SNAPSHOT_COLUMNS = (
+    "identity",
+    "attempts",
+    "last_seen",
+    "gap_count",
+    "gap_mean",
+    "gap_m2",
+    "recent_json",
+    "ip_hashes_json",
+    "device_hashes_json",
+)
+
+
+@dataclass
+class IdentityFeatures:
+    attempts: int = 0
+    last_seen: float | None = None
+    # Welford running mean / sum of squared deviations over inter-arrival gaps.
+    gap_count: int = 0
+    gap_mean: float = 0.0
+    gap_m2: float = 0.0
+    recent: deque = field(default_factory=lambda: deque(maxlen=_MAX_RECENT_ATTEMPTS))
+    # value -> last seen, least recently seen first.
+    ip_hashes: OrderedDict = field(default_factory=OrderedDict)
+    device_hashes: OrderedDict = field(default_factory=OrderedDict)
+
+    def observe(self, ts: float, ip_hash: str | None, device_hash: str | None) -> None:
+        if self.last_seen is not None:
+            gap = max(0.0, ts - self.last_seen)
+            self.gap_count += 1
+            delta = gap - self.gap_mean
+            self.gap_mean += delta / self.gap_count
+            self.gap_m2 += delta * (gap - self.gap_mean)
+        self.attempts += 1
+        self.last_seen = ts
+        self.recent.append(ts)
+        _touch(self.ip_hashes, ip_hash, ts)
+        _touch(self.device_hashes, device_hash, ts)
+
+    def to_metadata(self, now: float, window_seconds: float) -> dict[str, Any]:
+        cutoff = now - window_seconds
+        while self.recent and self.recent[0] < cutoff:
+            self.recent.popleft()
+        # Fan-out only counts addresses and devices used recently, so switching networks
+        # a few times over an identity's life does not flag it for good.
+        fanout_cutoff = now - FEATURE_STORE_FANOUT_WINDOW_SECONDS
+        for seen in (self.ip_hashes, self.device_hashes):
+            while seen and next(iter(seen.values())) < fanout_cutoff:
+                seen.popitem(last=False)
+        count = len(self.recent)
+        # None means "no previous attempt in the window"; the validators skip delta rules for it.
+        delta = self.recent[-1] - self.recent[-2] if count >= 2 else None
+        variance = self.gap_m2 / (self.gap_count - 1) if self.gap_count > 1 else None
+        return {
+            "vote_attempt_count": count,
+            "time_between_attempts_sec": delta,
+            "attempt_rate_per_min": count * 60.0 / window_seconds,
+            "inter_arrival_mean_sec": self.gap_mean if self.gap_count else None,
+            "inter_arrival_variance": variance,
+            "ip_fanout": len(self.ip_hashes),
+            "device_fanout": len(self.device_hashes),
+            "total_attempts": self.attempts,
+        }
+
+
+def _touch(seen: OrderedDict, value: str | None, ts: float) -> None:
+    if not value:
+        return
+    seen.pop(value, None)
+    seen[value] = ts
+    while len(seen) > FEATURE_STORE_MAX_FANOUT:
+        seen.popitem(last=False)
+
+
+class FeatureStore:
+    def __init__(
+        self,
+        max_identities: int = FEATURE_STORE_MAX_IDENTITIES,
+        window_seconds: float = FEATURE_STORE_RATE_WINDOW_SECONDS,
+        snapshot_interval_seconds: float = FEATURE_STORE_SNAPSHOT_INTERVAL_SECONDS,
+    ) -> None:
+        self._max_identities = max(1, max_identities)
+        self._window_seconds = max(1.0, window_seconds)
+        self._snapshot_interval = max(1.0, snapshot_interval_seconds)
+        self._lock = threading.Lock()
+        # identity -> features, least recently seen first.
+        self._features: OrderedDict[str, IdentityFeatures] = OrderedDict()
+        self._dirty: set[str] = set()
+        self._thread: threading.Thread | None = None
+        self._stats = {"observed": 0, "evicted": 0, "snapshots": 0, "snapshot_rows": 0, "restored": 0}
+
+    def record(
+        self, identity: str, ip_hash: str | None = None, device_hash: str | None = None, ts: float | None = None
+    ) -> dict[str, Any]:
+        ts = time.time() if ts is None else ts
+        with self._lock:
+            features = self._features.pop(identity, None) or IdentityFeatures()
+            features.observe(ts, ip_hash, device_hash)
+            self._features[identity] = features
+            self._dirty.add(identity)
+            self._stats["observed"] += 1
+            while len(self._features) > self._max_identities:
+                evicted, _ = self._features.popitem(last=False)
+                self._dirty.discard(evicted)
+                self._stats["evicted"] += 1
+            return features.to_metadata(ts, self._window_seconds)
+
+    def features(self, identity: str, now: float | None = None) -> dict[str, Any]:
+        now = time.time() if now is None else now
+        with self._lock:
+            features = self._features.get(identity)
+            if features is None:
+                return IdentityFeatures().to_metadata(now, self._window_seconds)
+            return features.to_metadata(now, self._window_seconds)
+
+    def snapshot(self) -> int:
+        with self._lock:
+            dirty = list(self._dirty)
+            self._dirty.clear()
+            rows = [_snapshot_row(identity, self._features[identity]) for identity in dirty if identity in self._features]
+        if not rows:
+            return 0
+        try:
+            with db_cursor() as (conn, cur):
+                _copy_snapshot(cur, rows)
+                cur.execute(
+                    "DELETE FROM identity_features WHERE last_seen < %s",
+                    (time.time() - FEATURE_STORE_IDLE_TTL_SECONDS,),
+                )
+                conn.commit()
+        except Exception:
+            # Keep the identities dirty so the next pass retries them.
+            with self._lock:
+                self._dirty.update(row[0] for row in rows)
+            raise
+        with self._lock:
+            self._stats["snapshots"] += 1
+            self._stats["snapshot_rows"] += len(rows)
+        return len(rows)
+
+    def restore(self) -> int:
+        with db_cursor() as (conn, cur):
+            cur.execute(
+                f"""
+                SELECT {', '.join(SNAPSHOT_COLUMNS)}
+                FROM identity_features
+                WHERE last_seen >= %s
+                ORDER BY last_seen DESC
+                LIMIT %s
+                """,
+                (time.time() - FEATURE_STORE_IDLE_TTL_SECONDS, self._max_identities),
+            )
+            rows = cur.fetchall()
+        restored = 0
+        with self._lock:
+            # Restored identities are older than anything seen live, so each is pushed to the
+            # least-recent end; rows arrive most recent first, leaving the oldest at the front.
+            for row in rows:
+                if row[0] in self._features:
+                    continue
+                self._features[row[0]] = _from_snapshot_row(row)
+                self._features.move_to_end(row[0], last=False)
+                restored += 1
+            while len(self._features) > self._max_identities:
+                self._features.popitem(last=False)
+            self._stats["restored"] += restored
+        return restored
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="feature-store-snapshot", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            self.restore()
+        except Exception:
+            pass
+        while True:
+            time.sleep(self._snapshot_interval)
+            try:
+                self.snapshot()
+            except Exception:
+                pass
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {**self._stats, "identities": len(self._features), "dirty": len(self._dirty)}
+
+
+def _snapshot_row(identity: str, features: IdentityFeatures) -> tuple:
+    return (
+        identity,
+        features.attempts,
+        features.last_seen,
+        features.gap_count,
+        features.gap_mean,
+        features.gap_m2,
+        json.dumps(list(features.recent)),
+        json.dumps(list(features.ip_hashes.items())),
+        json.dumps(list(features.device_hashes.items())),
+    )
+
+
+def _from_snapshot_row(row) -> IdentityFeatures:
+    features = IdentityFeatures(
+        attempts=int(row[1]),
+        last_seen=float(row[2]) if row[2] is not None else None,
+        gap_count=int(row[3]),
+        gap_mean=float(row[4]),
+        gap_m2=float(row[5]),
+    )
+    features.recent.extend(json.loads(row[6] or "[]"))
+    for seen, raw in ((features.ip_hashes, row[7]), (features.device_hashes, row[8])):
+        for entry in json.loads(raw or "[]"):
+            # Older snapshots stored bare values; treat them as seen at the identity's last attempt.
+            value, ts = entry if isinstance(entry, list) else (entry, features.last_seen or 0.0)
+            _touch(seen, value, ts)
+    return features
+
+
+def _copy_snapshot(cur, rows) -> None:
+    # Dirty identities are streamed into a session-local staging table with COPY and merged in one statement.
+    cur.execute(
+        """
+        CREATE TEMP TABLE IF NOT EXISTS identity_features_staging (
+            identity TEXT,
+            attempts BIGINT,
+            last_seen DOUBLE PRECISION,
+            gap_count BIGINT,
+            gap_mean DOUBLE PRECISION,
+            gap_m2 DOUBLE PRECISION,
+            recent_json TEXT,
+            ip_hashes_json TEXT,
+            device_hashes_json TEXT
+        ) ON COMMIT DELETE ROWS
+        """
+    )
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(["" if value is None else value for value in row])
+    buffer.seek(0)
+    cur.copy_expert(
+        f"COPY identity_features_staging ({', '.join(SNAPSHOT_COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+        buffer,
+    )
+    updates = ", ".join(f"{column} = EXCLUDED.{column}" for column in SNAPSHOT_COLUMNS[1:])
+    cur.execute(
+        f"""
+        INSERT INTO identity_features ({', '.join(SNAPSHOT_COLUMNS)}, updated_at)
+        SELECT {', '.join(SNAPSHOT_COLUMNS)}, NOW() FROM identity_features_staging
+        ON CONFLICT (identity)
+        DO UPDATE SET {updates}, updated_at = NOW()
+        """
+    )
@@ -0,0 +1,52 @@
+import hashlib
+import json
+
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+
+
+def _leaf_hash(value: str) -> str:
+    return hashlib.sha256(LEAF_PREFIX + value.encode("utf-8")).hexdigest()
+
+
+def _node_hash(left: str, right: str) -> str:
+    return hashlib.sha256(NODE_PREFIX + bytes.fromhex(left) + bytes.fromhex(right)).hexdigest()
+
+
+def build_merkle_tree(leaves: list[str]) -> tuple[str, list[list[list[str]]]]:
+    if not leaves:
+        raise ValueError("Cannot build a Merkle tree without leaves")
+
+    level = [_leaf_hash(leaf) for leaf in leaves]
+    proofs: list[list[list[str]]] = [[] for _ in leaves]
+    positions = list(range(len(leaves)))
+    while len(level) > 1:
+        next_level = []
+        for idx in range(0, len(level), 2):
+            if idx + 1 < len(level):
+                next_level.append(_node_hash(level[idx], level[idx + 1]))
+            else:
+                # Odd node is promoted unchanged rather than paired with itself.
+                next_level.append(level[idx])
+        for leaf_idx, pos in enumerate(positions):
+            sibling = pos ^ 1
+            if sibling < len(level):
+                proofs[leaf_idx].append(["L" if sibling < pos else "R", level[sibling]])
+            positions[leaf_idx] = pos // 2
+        level = next_level
+    return level[0], proofs
+
+
+def verify_merkle_proof(leaf: str, proof: list[list[str]] | str, root: str) -> bool:
+    if isinstance(proof, str):
+        try:
+            proof = json.loads(proof)
+        except ValueError:
+            return False
+    try:
+        node = _leaf_hash(leaf)
+        for side, sibling in proof:
+            node = _node_hash(sibling, node) if side == "L" else _node_hash(node, sibling)
+    except (TypeError, ValueError):
+        return False
+    return node == root
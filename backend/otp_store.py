@@ -0,0 +1,182 @@
+import hashlib
+import heapq
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+
+from db import db_cursor
+
+OTP_STORE_BACKEND = os.getenv("OTP_STORE_BACKEND", "memory").strip().lower()
+OTP_STORE_MAX_ENTRIES = int(os.getenv("OTP_STORE_MAX_ENTRIES", "100000"))
+OTP_STORE_PURGE_INTERVAL_SECONDS = int(os.getenv("OTP_STORE_PURGE_INTERVAL_SECONDS", "60"))
+OTP_STORE_EXPIRED_GRACE_SECONDS = int(os.getenv("OTP_STORE_EXPIRED_GRACE_SECONDS", "300"))
+
+OTP_OK = "ok"
+OTP_NOT_FOUND = "not_found"
+OTP_TOO_MANY_ATTEMPTS = "too_many_attempts"
+OTP_EXPIRED = "expired"
+OTP_INVALID = "invalid"
+
+
+def _otp_digest(otp: str) -> str:
+    return hashlib.sha256(otp.encode("utf-8")).hexdigest()
+
+
+class OTPStore(ABC):
+    @abstractmethod
+    def issue(self, key: str, otp: str, ttl_seconds: int, cooldown_seconds: int) -> bool:
+        ...
+
+    @abstractmethod
+    def verify(self, key: str, otp: str, max_attempts: int) -> str:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+
+class InMemoryOTPStore(OTPStore):
+    def __init__(
+        self, max_entries: int = OTP_STORE_MAX_ENTRIES, expired_grace_seconds: int = OTP_STORE_EXPIRED_GRACE_SECONDS
+    ) -> None:
+        self._max_entries = max(1, max_entries)
+        self._expired_grace = max(0, expired_grace_seconds)
+        self._lock = threading.Lock()
+        self._records: dict[str, dict] = {}
+        # (expires_at, key) min-heap; entries whose expiry no longer matches the record are stale.
+        self._expiry_heap: list[tuple[float, str]] = []
+
+    def _evict(self, now: float) -> None:
+        # Expired codes linger for the grace period so verify can still answer OTP_EXPIRED
+        # rather than OTP_NOT_FOUND, as the Postgres store does until its next purge.
+        heap = self._expiry_heap
+        cutoff = now - self._expired_grace
+        while heap and (heap[0][0] <= cutoff or len(self._records) > self._max_entries):
+            expires_at, key = heapq.heappop(heap)
+            record = self._records.get(key)
+            if record and record["expires_at"] == expires_at:
+                del self._records[key]
+        if len(heap) > 2 * len(self._records) + 64:
+            self._expiry_heap = [(r["expires_at"], k) for k, r in self._records.items()]
+            heapq.heapify(self._expiry_heap)
+
+    def issue(self, key: str, otp: str, ttl_seconds: int, cooldown_seconds: int) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            self._evict(now)
+            existing = self._records.get(key)
+            if existing and now < existing["last_sent"] + cooldown_seconds:
+                return False
+            expires_at = now + ttl_seconds
+            self._records[key] = {
+                "otp_hash": _otp_digest(otp),
+                "expires_at": expires_at,
+                "attempts": 0,
+                "last_sent": now,
+            }
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+            self._evict(now)
+            return True
+
+    def verify(self, key: str, otp: str, max_attempts: int) -> str:
+        now = time.monotonic()
+        with self._lock:
+            self._evict(now)
+            record = self._records.get(key)
+            if not record:
+                return OTP_NOT_FOUND
+            if record["attempts"] >= max_attempts:
+                return OTP_TOO_MANY_ATTEMPTS
+            if now > record["expires_at"]:
+                return OTP_EXPIRED
+            if _otp_digest(otp) != record["otp_hash"]:
+                record["attempts"] += 1
+                return OTP_INVALID
+            return OTP_OK
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._records.pop(key, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._records)
+
+
+class PostgresOTPStore(OTPStore):
+    def __init__(self, purge_interval_seconds: int = OTP_STORE_PURGE_INTERVAL_SECONDS) -> None:
+        self._purge_interval = purge_interval_seconds
+        self._last_purge = 0.0
+        self._lock = threading.Lock()
+
+    def _maybe_purge(self, cur) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_purge < self._purge_interval:
+                return
+            self._last_purge = now
+        cur.execute("DELETE FROM otp_codes WHERE expires_at < NOW()")
+
+    def issue(self, key: str, otp: str, ttl_seconds: int, cooldown_seconds: int) -> bool:
+        with db_cursor() as (conn, cur):
+            self._maybe_purge(cur)
+            cur.execute(
+                """
+                INSERT INTO otp_codes (otp_key, otp_hash, expires_at, attempts, last_sent)
+                VALUES (%s, %s, NOW() + make_interval(secs => %s), 0, NOW())
+                ON CONFLICT (otp_key)
+                DO UPDATE SET
+                    otp_hash = EXCLUDED.otp_hash,
+                    expires_at = EXCLUDED.expires_at,
+                    attempts = 0,
+                    last_sent = EXCLUDED.last_sent
+                WHERE otp_codes.last_sent <= NOW() - make_interval(secs => %s)
+                RETURNING otp_key
+                """,
+                (key, _otp_digest(otp), ttl_seconds, cooldown_seconds),
+            )
+            issued = cur.fetchone() is not None
+            conn.commit()
+            return issued
+
+    def verify(self, key: str, otp: str, max_attempts: int) -> str:
+        otp_hash = _otp_digest(otp)
+        with db_cursor() as (conn, cur):
+            # The attempt counter is bumped in the same statement that checks the code.
+            cur.execute(
+                """
+                UPDATE otp_codes
+                SET attempts = attempts + CASE WHEN otp_hash = %s THEN 0 ELSE 1 END
+                WHERE otp_key = %s AND attempts < %s AND expires_at >= NOW()
+                RETURNING otp_hash = %s
+                """,
+                (otp_hash, key, max_attempts, otp_hash),
+            )
+            row = cur.fetchone()
+            if row is not None:
+                conn.commit()
+                return OTP_OK if row[0] else OTP_INVALID
+
+            cur.execute("SELECT attempts FROM otp_codes WHERE otp_key = %s", (key,))
+            existing = cur.fetchone()
+            conn.commit()
+            if not existing:
+                return OTP_NOT_FOUND
+            if existing[0] >= max_attempts:
+                return OTP_TOO_MANY_ATTEMPTS
+            return OTP_EXPIRED
+
+    def delete(self, key: str) -> None:
+        with db_cursor() as (conn, cur):
+            cur.execute("DELETE FROM otp_codes WHERE otp_key = %s", (key,))
+            conn.commit()
+
+
+def create_otp_store(backend: str = OTP_STORE_BACKEND) -> OTPStore:
+    if backend == "postgres":
+        return PostgresOTPStore()
+    if backend == "memory":
+        return InMemoryOTPStore()
+    raise RuntimeError(f"Unknown OTP_STORE_BACKEND: {backend}")
@@ -0,0 +1,82 @@
+import copy
+import os
+import threading
+import time
+
+from algosdk import transaction
+from algosdk.v2client import algod
+
+PARAMS_CACHE_MAX_AGE_SECONDS = float(os.getenv("PARAMS_CACHE_MAX_AGE_SECONDS", "10"))
+PARAMS_VALIDITY_ROUNDS = int(os.getenv("PARAMS_VALIDITY_ROUNDS", "100"))
+
+
+class SuggestedParamsCache:
+    def __init__(
+        self,
+        max_age_seconds: float = PARAMS_CACHE_MAX_AGE_SECONDS,
+        validity_rounds: int = PARAMS_VALIDITY_ROUNDS,
+    ) -> None:
+        self._max_age_seconds = max_age_seconds
+        self._validity_rounds = max(1, validity_rounds)
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[transaction.SuggestedParams, float]] = {}
+        self._latest_round = 0
+        self._stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def get(self, client: algod.AlgodClient) -> transaction.SuggestedParams:
+        key = client.algod_address
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and now - entry[1] < self._max_age_seconds and entry[0].first >= self._latest_round:
+                self._stats["hits"] += 1
+                cached = entry[0]
+            else:
+                self._stats["misses"] += 1
+                cached = None
+
+        if cached is None:
+            cached = client.suggested_params()
+            with self._lock:
+                self._entries[key] = (cached, time.monotonic())
+
+        # Each caller gets its own copy; the validity window is re-anchored on the cached
+        # first round so a reused entry never hands out an already-expired last round.
+        sp = copy.copy(cached)
+        sp.last = sp.first + self._validity_rounds
+        return sp
+
+    def send(self, client: algod.AlgodClient, signed_txn) -> str:
+        try:
+            if isinstance(signed_txn, list):
+                return client.send_transactions(signed_txn)
+            return client.send_transaction(signed_txn)
+        except Exception:
+            # A rejected submission may mean the cached fee or validity window went stale.
+            self.invalidate(client)
+            raise
+
+    def on_new_round(self, round_number: int) -> None:
+        with self._lock:
+            self._latest_round = max(self._latest_round, round_number)
+
+    def invalidate(self, client: algod.AlgodClient | None = None) -> None:
+        with self._lock:
+            self._stats["invalidations"] += 1
+            if client is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(client.algod_address, None)
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "latest_round": self._latest_round,
+                "hit_ratio": self._stats["hits"] / lookups if lookups else 0.0,
+            }
+
+
+SUGGESTED_PARAMS_CACHE = SuggestedParamsCache()
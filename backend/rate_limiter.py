@@ -0,0 +1,187 @@
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from db import db_cursor
+
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory").strip().lower()
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))
+RATE_LIMIT_PURGE_INTERVAL_SECONDS = int(os.getenv("RATE_LIMIT_PURGE_INTERVAL_SECONDS", "60"))
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    name: str
+    limit: int
+    window_seconds: int
+
+
+def _window_start(rule: RateLimit, now: float) -> int:
+    return int(now // rule.window_seconds) * rule.window_seconds
+
+
+def _roll(rule: RateLimit, window_start: int, stored_start: int, current: int, previous: int) -> tuple[int, int]:
+    # Moves a stored (current, previous) pair forward to the window starting at window_start.
+    if stored_start >= window_start:
+        return current, previous
+    if stored_start == window_start - rule.window_seconds:
+        return 0, current
+    return 0, 0
+
+
+def _refund(rule: RateLimit, window_start: int, stored_start: int, current: int, previous: int) -> tuple[int, int]:
+    # A refunded hit sits in whichever window it was counted in, which may have rolled to previous.
+    if stored_start >= window_start:
+        return max(0, current - 1), previous
+    if stored_start == window_start - rule.window_seconds:
+        return 0, max(0, current - 1)
+    return 0, 0
+
+
+def _estimate(rule: RateLimit, now: float, window_start: int, current: int, previous: int) -> float:
+    # Sliding window from two fixed windows: the previous window's count is weighted by
+    # how much of it still overlaps the trailing window ending now.
+    overlap = max(0.0, 1.0 - (now - window_start) / rule.window_seconds)
+    return previous * overlap + current
+
+
+class RateLimiter(ABC):
+    @abstractmethod
+    def hit(self, rule: RateLimit, identity: str) -> tuple[bool, int]:
+        ...
+
+    @abstractmethod
+    def refund(self, rule: RateLimit, identity: str) -> None:
+        # Takes back one hit that turned out not to count against the identity.
+        ...
+
+
+class InMemoryRateLimiter(RateLimiter):
+    def __init__(self, max_keys: int = RATE_LIMIT_MAX_KEYS) -> None:
+        self._max_keys = max(1, max_keys)
+        self._lock = threading.Lock()
+        # key -> [window_start, current_count, previous_count], least recently hit first.
+        self._counters: OrderedDict[str, list[int]] = OrderedDict()
+
+    def hit(self, rule: RateLimit, identity: str) -> tuple[bool, int]:
+        now = time.time()
+        window_start = _window_start(rule, now)
+        key = f"{rule.name}:{identity}"
+        with self._lock:
+            counter = self._counters.pop(key, None)
+            current, previous = _roll(rule, window_start, *counter) if counter else (0, 0)
+            counter = [window_start, current + 1, previous]
+            self._counters[key] = counter
+            while len(self._counters) > self._max_keys:
+                self._counters.popitem(last=False)
+            attempts = _estimate(rule, now, counter[0], counter[1], counter[2])
+        return attempts <= rule.limit, int(round(attempts))
+
+    def refund(self, rule: RateLimit, identity: str) -> None:
+        window_start = _window_start(rule, time.time())
+        with self._lock:
+            counter = self._counters.get(f"{rule.name}:{identity}")
+            if counter:
+                counter[:] = [window_start, *_refund(rule, window_start, *counter)]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._counters)
+
+
+class PostgresRateLimiter(RateLimiter):
+    def __init__(self, purge_interval_seconds: int = RATE_LIMIT_PURGE_INTERVAL_SECONDS) -> None:
+        self._purge_interval = purge_interval_seconds
+        self._last_purge = 0.0
+        self._lock = threading.Lock()
+        self._local = InMemoryRateLimiter()
+
+    def _maybe_purge(self, cur, now: float) -> None:
+        with self._lock:
+            if time.monotonic() - self._last_purge < self._purge_interval:
+                return
+            self._last_purge = time.monotonic()
+        cur.execute("DELETE FROM rate_limit_counters WHERE expires_at < %s", (int(now),))
+
+    def hit(self, rule: RateLimit, identity: str) -> tuple[bool, int]:
+        # This process's hits are a lower bound on the shared count, so an identity that is
+        # already over the limit locally is refused without a database round trip.
+        local_allowed, local_attempts = self._local.hit(rule, identity)
+        if not local_allowed:
+            return False, local_attempts
+        now = time.time()
+        window_start = _window_start(rule, now)
+        with db_cursor() as (conn, cur):
+            self._maybe_purge(cur, now)
+            # One keyed upsert rolls the window forward and counts the hit.
+            cur.execute(
+                """
+                INSERT INTO rate_limit_counters (rate_key, window_start, current_count, previous_count, expires_at)
+                VALUES (%s, %s, 1, 0, %s)
+                ON CONFLICT (rate_key)
+                DO UPDATE SET
+                    previous_count = CASE
+                        WHEN rate_limit_counters.window_start >= EXCLUDED.window_start THEN rate_limit_counters.previous_count
+                        WHEN rate_limit_counters.window_start = EXCLUDED.window_start - %s THEN rate_limit_counters.current_count
+                        ELSE 0
+                    END,
+                    current_count = CASE
+                        WHEN rate_limit_counters.window_start >= EXCLUDED.window_start THEN rate_limit_counters.current_count + 1
+                        ELSE 1
+                    END,
+                    window_start = GREATEST(rate_limit_counters.window_start, EXCLUDED.window_start),
+                    expires_at = GREATEST(rate_limit_counters.expires_at, EXCLUDED.expires_at)
+                RETURNING window_start, current_count, previous_count
+                """,
+                (
+                    f"{rule.name}:{identity}",
+                    window_start,
+                    window_start + 2 * rule.window_seconds,
+                    rule.window_seconds,
+                ),
+            )
+            stored_start, current, previous = cur.fetchone()
+            conn.commit()
+        attempts = _estimate(rule, now, stored_start, current, previous)
+        return attempts <= rule.limit, int(round(attempts))
+
+    def refund(self, rule: RateLimit, identity: str) -> None:
+        self._local.refund(rule, identity)
+        window_start = _window_start(rule, time.time())
+        with db_cursor() as (conn, cur):
+            cur.execute(
+                """
+                UPDATE rate_limit_counters
+                SET
+                    previous_count = CASE
+                        WHEN window_start >= %s THEN previous_count
+                        WHEN window_start = %s THEN GREATEST(current_count - 1, 0)
+                        ELSE 0
+                    END,
+                    current_count = CASE
+                        WHEN window_start >= %s THEN GREATEST(current_count - 1, 0)
+                        ELSE 0
+                    END,
+                    window_start = GREATEST(window_start, %s)
+                WHERE rate_key = %s
+                """,
+                (
+                    window_start,
+                    window_start - rule.window_seconds,
+                    window_start,
+                    window_start,
+                    f"{rule.name}:{identity}",
+                ),
+            )
+            conn.commit()
+
+
+def create_rate_limiter(backend: str = RATE_LIMIT_BACKEND) -> RateLimiter:
+    if backend == "postgres":
+        return PostgresRateLimiter()
+    if backend == "memory":
+        return InMemoryRateLimiter()
+    raise RuntimeError(f"Unknown RATE_LIMIT_BACKEND: {backend}")
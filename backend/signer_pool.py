@@ -0,0 +1,204 @@
+import itertools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from algosdk import account, mnemonic, transaction
+from algosdk.v2client import algod
+
+from block_follower import follower_for
+from params_cache import SUGGESTED_PARAMS_CACHE
+
+SIGNER_STRATEGY = os.getenv("SIGNER_STRATEGY", "shard").strip().lower()
+SIGNER_MIN_SPENDABLE_MICROALGOS = int(os.getenv("SIGNER_MIN_SPENDABLE_MICROALGOS", "200000"))
+SIGNER_TOPUP_MICROALGOS = int(os.getenv("SIGNER_TOPUP_MICROALGOS", "1000000"))
+SIGNER_BALANCE_REFRESH_SECONDS = float(os.getenv("SIGNER_BALANCE_REFRESH_SECONDS", "60"))
+SIGNER_MAX_PENDING = int(os.getenv("SIGNER_MAX_PENDING", "64"))
+SIGNER_PENDING_TIMEOUT_ROUNDS = int(os.getenv("SIGNER_PENDING_TIMEOUT_ROUNDS", "20"))
+
+
+@dataclass
+class ServiceAccount:
+    address: str
+    private_key: str
+    pending: int = 0
+    submitted: int = 0
+    balance: int | None = None
+    min_balance: int | None = None
+    healthy: bool = True
+
+    @property
+    def spendable(self) -> int | None:
+        if self.balance is None:
+            return None
+        return self.balance - (self.min_balance or 0)
+
+
+class SignerPool:
+    def __init__(self, private_keys: list[str], strategy: str = SIGNER_STRATEGY) -> None:
+        if not private_keys:
+            raise RuntimeError("At least one service account is required")
+        self.accounts = [ServiceAccount(account.address_from_private_key(key), key) for key in private_keys]
+        self._strategy = strategy
+        self._lock = threading.Lock()
+        self._rotation = itertools.count()
+        self._monitor: threading.Thread | None = None
+        self._stats = {"topups": 0, "topup_failures": 0, "refresh_failures": 0}
+
+    @property
+    def primary(self) -> ServiceAccount:
+        # The first account deployed the contract and stays the only one allowed to add candidates.
+        return self.accounts[0]
+
+    @property
+    def addresses(self) -> list[str]:
+        return [acct.address for acct in self.accounts]
+
+    def _usable(self) -> list[ServiceAccount]:
+        usable = [acct for acct in self.accounts if acct.healthy and acct.pending < SIGNER_MAX_PENDING]
+        return usable or self.accounts
+
+    def acquire(self, shard_key: str | None = None) -> ServiceAccount:
+        with self._lock:
+            usable = self._usable()
+            if self._strategy == "shard" and shard_key:
+                chosen = usable[int(shard_key[:8], 16) % len(usable)]
+            else:
+                offset = next(self._rotation)
+                rotated = usable[offset % len(usable) :] + usable[: offset % len(usable)]
+                chosen = min(rotated, key=lambda acct: acct.pending)
+            chosen.pending += 1
+            chosen.submitted += 1
+            return chosen
+
+    def release(self, acct: ServiceAccount) -> None:
+        with self._lock:
+            acct.pending = max(0, acct.pending - 1)
+
+    def send(self, client: algod.AlgodClient, acct: ServiceAccount, signed_txn) -> str:
+        # The reservation taken by acquire() becomes one pending slot per submitted
+        # transaction, each released only once the block follower sees it confirm or fail.
+        tx_id = SUGGESTED_PARAMS_CACHE.send(client, signed_txn)
+        tx_ids = [stxn.get_txid() for stxn in (signed_txn if isinstance(signed_txn, list) else [signed_txn])]
+        with self._lock:
+            acct.pending += len(tx_ids) - 1
+        follower = follower_for(client)
+        for pending_tx_id in tx_ids:
+            follower.watch(pending_tx_id, SIGNER_PENDING_TIMEOUT_ROUNDS).add_done_callback(
+                lambda _, acct=acct: self.release(acct)
+            )
+        return tx_id
+
+    @contextmanager
+    def signer(self, shard_key: str | None = None):
+        # Transactions must go out through send() inside the block; leaving it with an
+        # error hands the reservation back.
+        acct = self.acquire(shard_key)
+        try:
+            yield acct
+        except BaseException:
+            self.release(acct)
+            raise
+
+    def refresh_balances(self, client: algod.AlgodClient) -> None:
+        for acct in self.accounts:
+            try:
+                info = client.account_info(acct.address)
+            except Exception:
+                with self._lock:
+                    self._stats["refresh_failures"] += 1
+                continue
+            with self._lock:
+                acct.balance = int(info.get("amount", 0))
+                acct.min_balance = int(info.get("min-balance", 0))
+                acct.healthy = acct.spendable >= SIGNER_MIN_SPENDABLE_MICROALGOS
+
+    def rebalance(self, client: algod.AlgodClient) -> int:
+        with self._lock:
+            low = [acct for acct in self.accounts if acct.spendable is not None and not acct.healthy]
+            donors = sorted(
+                (acct for acct in self.accounts if acct.spendable is not None and acct.healthy),
+                key=lambda acct: acct.spendable,
+                reverse=True,
+            )
+        topped_up = 0
+        for target in low:
+            if not donors or donors[0].spendable < SIGNER_MIN_SPENDABLE_MICROALGOS + 2 * SIGNER_TOPUP_MICROALGOS:
+                break
+            donor = donors[0]
+            try:
+                txn = transaction.PaymentTxn(
+                    donor.address, SUGGESTED_PARAMS_CACHE.get(client), target.address, SIGNER_TOPUP_MICROALGOS
+                )
+                SUGGESTED_PARAMS_CACHE.send(client, txn.sign(donor.private_key))
+            except Exception:
+                with self._lock:
+                    self._stats["topup_failures"] += 1
+                continue
+            with self._lock:
+                donor.balance -= SIGNER_TOPUP_MICROALGOS
+                target.balance += SIGNER_TOPUP_MICROALGOS
+                target.healthy = target.spendable >= SIGNER_MIN_SPENDABLE_MICROALGOS
+                self._stats["topups"] += 1
+            donors.sort(key=lambda acct: acct.spendable, reverse=True)
+            topped_up += 1
+        return topped_up
+
+    def start_monitor(self, client: algod.AlgodClient, interval_seconds: float = SIGNER_BALANCE_REFRESH_SECONDS) -> None:
+        with self._lock:
+            if self._monitor is not None:
+                return
+            self._monitor = threading.Thread(
+                target=self._monitor_forever,
+                args=(client, max(5.0, interval_seconds)),
+                name="signer-pool-monitor",
+                daemon=True,
+            )
+            self._monitor.start()
+
+    def _monitor_forever(self, client: algod.AlgodClient, interval_seconds: float) -> None:
+        while True:
+            try:
+                self.refresh_balances(client)
+                if len(self.accounts) > 1:
+                    self.rebalance(client)
+            except Exception:
+                pass
+            time.sleep(interval_seconds)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                **self._stats,
+                "strategy": self._strategy,
+                "accounts": [
+                    {
+                        "address": acct.address,
+                        "pending": acct.pending,
+                        "submitted": acct.submitted,
+                        "balance": acct.balance,
+                        "min_balance": acct.min_balance,
+                        "healthy": acct.healthy,
+                    }
+                    for acct in self.accounts
+                ],
+            }
+
+
+_POOL: SignerPool | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def load_signer_pool() -> SignerPool:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            phrases = [os.getenv("ALGORAND_SERVICE_MNEMONIC", "").strip()]
+            phrases += [p.strip() for p in os.getenv("ALGORAND_SERVICE_MNEMONICS", "").split(";")]
+            phrases = list(dict.fromkeys(p for p in phrases if p))
+            if not phrases:
+                raise RuntimeError("ALGORAND_SERVICE_MNEMONIC is required")
+            _POOL = SignerPool([mnemonic.to_private_key(p) for p in phrases])
+        return _POOL
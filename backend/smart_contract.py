@@ -12,7 +12,20 @@ def _candidate_key_literal(candidate_id: int) -> Expr:
     return Bytes("base16", key_bytes.hex())
 
 
-def build_approval_program(candidate_ids: Iterable[int] | None = None) -> Expr:
+TALLY_BOX_NAME = b"tallies"
+
+
+def _tally_offset(candidate_slot: Expr) -> Expr:
+    return candidate_slot * Int(8)
+
+
+def build_approval_program(
+    candidate_ids: Iterable[int] | None = None,
+    tally_storage: str = "global",
+    tally_slots: int = 0,
+) -> Expr:
+    if tally_storage == "box":
+        return build_box_approval_program(tally_slots)
     configured_ids = list(candidate_ids or [])
 
     deadline_key = Bytes("deadline")
@@ -82,13 +95,107 @@ def build_approval_program(candidate_ids: Iterable[int] | None = None) -> Expr:
     )
 
 
+def build_box_approval_program(tally_slots: int) -> Expr:
+    # Every election gets its own packed uint64 tally box, `tallies<election key>`.
+    # Slot 0 holds the election deadline; candidate slots (per-election ordinals
+    # 1..tally_slots-1, not database ids) hold votes + 1 once registered, so 0
+    # still means "no such candidate".
+    if tally_slots < 2:
+        raise ValueError("tally_slots must leave room for at least one candidate slot")
+
+    deadline_key = Bytes("deadline")
+    election_id_key = Bytes("election_id")
+    admin_key = Bytes("admin")
+
+    on_create = Seq(
+        Assert(Txn.application_args.length() == Int(2)),
+        App.globalPut(election_id_key, Txn.application_args[0]),
+        App.globalPut(deadline_key, Btoi(Txn.application_args[1])),
+        App.globalPut(admin_key, Txn.sender()),
+        Approve(),
+    )
+
+    create_tallies = ScratchVar(TealType.bytes)
+    create_election = Seq(
+        Assert(Txn.application_args.length() == Int(3)),
+        Assert(Txn.sender() == App.globalGet(admin_key)),
+        Assert(Len(Txn.application_args[1]) == Int(8)),
+        Assert(Len(Txn.application_args[2]) == Int(8)),
+        create_tallies.store(Concat(Bytes("base16", TALLY_BOX_NAME.hex()), Txn.application_args[1])),
+        Assert(BoxCreate(create_tallies.load(), Int(tally_slots * 8))),
+        BoxReplace(create_tallies.load(), Int(0), Txn.application_args[2]),
+        Approve(),
+    )
+
+    add_tallies = ScratchVar(TealType.bytes)
+    add_slot = ScratchVar(TealType.uint64)
+    add_candidate = Seq(
+        Assert(Txn.application_args.length() == Int(3)),
+        Assert(Txn.sender() == App.globalGet(admin_key)),
+        Assert(Len(Txn.application_args[1]) == Int(8)),
+        Assert(Len(Txn.application_args[2]) == Int(8)),
+        add_tallies.store(Concat(Bytes("base16", TALLY_BOX_NAME.hex()), Txn.application_args[2])),
+        add_slot.store(Btoi(Txn.application_args[1])),
+        Assert(add_slot.load() > Int(0)),
+        Assert(add_slot.load() < Int(tally_slots)),
+        Assert(Btoi(BoxExtract(add_tallies.load(), _tally_offset(add_slot.load()), Int(8))) == Int(0)),
+        BoxReplace(add_tallies.load(), _tally_offset(add_slot.load()), Itob(Int(1))),
+        Approve(),
+    )
+
+    tallies = ScratchVar(TealType.bytes)
+    voter_box_name = ScratchVar(TealType.bytes)
+    voter_exists = BoxLen(voter_box_name.load())
+    candidate_slot = ScratchVar(TealType.uint64)
+    current = ScratchVar(TealType.uint64)
+    vote = Seq(
+        Assert(Txn.application_args.length() == Int(4)),
+        Assert(Len(Txn.application_args[1]) == Int(32)),
+        Assert(Len(Txn.application_args[2]) == Int(8)),
+        Assert(Len(Txn.application_args[3]) == Int(8)),
+        tallies.store(Concat(Bytes("base16", TALLY_BOX_NAME.hex()), Txn.application_args[3])),
+        Assert(Global.latest_timestamp() < Btoi(BoxExtract(tallies.load(), Int(0), Int(8)))),
+        voter_box_name.store(Concat(Bytes("voter_"), Txn.application_args[3], Txn.application_args[1])),
+        voter_exists,
+        Assert(Not(voter_exists.hasValue())),
+        candidate_slot.store(Btoi(Txn.application_args[2])),
+        Assert(candidate_slot.load() > Int(0)),
+        Assert(candidate_slot.load() < Int(tally_slots)),
+        current.store(Btoi(BoxExtract(tallies.load(), _tally_offset(candidate_slot.load()), Int(8)))),
+        Assert(current.load() > Int(0)),
+        BoxReplace(tallies.load(), _tally_offset(candidate_slot.load()), Itob(current.load() + Int(1))),
+        BoxPut(voter_box_name.load(), Bytes("1")),
+        Approve(),
+    )
+
+    return Cond(
+        [Txn.application_id() == Int(0), on_create],
+        [
+            Txn.on_completion() == OnComplete.NoOp,
+            Cond(
+                [Txn.application_args[0] == Bytes("create_election"), create_election],
+                [Txn.application_args[0] == Bytes("add_candidate"), add_candidate],
+                [Txn.application_args[0] == Bytes("vote"), vote],
+            ),
+        ],
+        [Txn.on_completion() == OnComplete.OptIn, Reject()],
+        [Txn.on_completion() == OnComplete.CloseOut, Reject()],
+        [Txn.on_completion() == OnComplete.UpdateApplication, Reject()],
+        [Txn.on_completion() == OnComplete.DeleteApplication, Reject()],
+    )
+
+
 def build_clear_program() -> Expr:
     return Approve()
 
 
-def compile_contract(candidate_ids: Iterable[int] | None = None) -> tuple[str, str]:
+def compile_contract(
+    candidate_ids: Iterable[int] | None = None,
+    tally_storage: str = "global",
+    tally_slots: int = 0,
+) -> tuple[str, str]:
     approval = compileTeal(
-        build_approval_program(candidate_ids),
+        build_approval_program(candidate_ids, tally_storage, tally_slots),
         mode=Mode.Application,
         version=8,
     )
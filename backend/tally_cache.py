@@ -0,0 +1,112 @@
+import os
+import threading
+import time
+from concurrent.futures import Future
+
+from algorand_client import AlgorandGovernanceClient, candidate_counts_for_slots
+from block_follower import follower_for
+
+TALLY_CACHE_MAX_AGE_SECONDS = float(os.getenv("TALLY_CACHE_MAX_AGE_SECONDS", "5"))
+
+
+class TallyCache:
+    def __init__(
+        self,
+        client: AlgorandGovernanceClient,
+        election_id: str | None = None,
+        max_age_seconds: float = TALLY_CACHE_MAX_AGE_SECONDS,
+    ) -> None:
+        self._client = client
+        self._election_id = election_id
+        self._max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._counts: dict[int, int] | None = None
+        self._counts_round = -1
+        self._fetched_at = 0.0
+        self._latest_round = -1
+        self._inflight: Future | None = None
+        self._subscribed = False
+        self._stats = {"hits": 0, "refreshes": 0, "shared_waits": 0}
+
+    def start(self) -> None:
+        with self._lock:
+            if self._subscribed:
+                return
+            self._subscribed = True
+        follower_for(self._client.algod).subscribe(self.on_new_round)
+
+    def on_new_round(self, round_number: int) -> None:
+        with self._lock:
+            self._latest_round = max(self._latest_round, round_number)
+
+    def _is_fresh(self) -> bool:
+        if self._counts is None:
+            return False
+        if self._latest_round > self._counts_round:
+            return False
+        return time.monotonic() - self._fetched_at < self._max_age_seconds
+
+    def counts(self) -> dict[int, int]:
+        with self._lock:
+            if self._is_fresh():
+                self._stats["hits"] += 1
+                return self._counts
+            if self._inflight is not None:
+                # Single-flight: concurrent readers share the refresh already in progress.
+                future = self._inflight
+                self._stats["shared_waits"] += 1
+                leader = False
+            else:
+                future = Future()
+                self._inflight = future
+                fetch_round = self._latest_round
+                leader = True
+
+        if not leader:
+            return future.result()
+
+        try:
+            counts = self._client.fetch_slot_counts(self._election_id)
+        except Exception as exc:
+            with self._lock:
+                self._inflight = None
+            future.set_exception(exc)
+            raise
+        with self._lock:
+            self._counts = counts
+            self._counts_round = fetch_round
+            self._fetched_at = time.monotonic()
+            self._inflight = None
+            self._stats["refreshes"] += 1
+        future.set_result(counts)
+        return counts
+
+    def get_candidate_counts(self, candidate_slots: dict[int, int]) -> dict[int, int]:
+        self.start()
+        return candidate_counts_for_slots(self.counts(), candidate_slots)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._counts = None
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {**self._stats, "cached_round": self._counts_round, "latest_round": self._latest_round}
+
+
+_CACHES: dict[str, TallyCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def tally_cache_for(client: AlgorandGovernanceClient, election_id: str) -> TallyCache:
+    with _CACHES_LOCK:
+        cache = _CACHES.get(election_id)
+        if cache is None:
+            cache = TallyCache(client, election_id)
+            _CACHES[election_id] = cache
+        return cache
+
+
+def tally_cache_stats() -> dict[str, dict[str, int]]:
+    with _CACHES_LOCK:
+        return {election_id: cache.stats() for election_id, cache in _CACHES.items()}
@@ -0,0 +1,88 @@
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+np = pytest.importorskip("numpy")
+
+from consensus import (  # noqa: E402
+    CONSENSUS_FANOUT_FLAG,
+    CONSENSUS_REGULAR_CADENCE_STDDEV_SEC,
+    VERDICTS,
+    run_consensus,
+    run_consensus_batch,
+)
+
+CASES = 20000
+
+# Values on and around every threshold the validators compare against.
+DELTAS = [None, 0.0, 9.999, 10.0, 10.001, 14.999, 15.0, 15.001, 19.999, 20.0, 20.001, 1e9]
+STDDEV = CONSENSUS_REGULAR_CADENCE_STDDEV_SEC
+VARIANCES = [None, 0.0, STDDEV**2 * 0.999, STDDEV**2, STDDEV**2 * 1.001, 1e9]
+FANOUTS = [0, 1, CONSENSUS_FANOUT_FLAG - 1, CONSENSUS_FANOUT_FLAG, CONSENSUS_FANOUT_FLAG + 1]
+
+
+def _random_case(rng):
+    return {
+        "ai": rng.choice(VERDICTS),
+        "vote_attempt_count": rng.randint(0, 9),
+        "time_between_attempts_sec": rng.choice(DELTAS + [rng.uniform(0, 30)]),
+        "inter_arrival_variance": rng.choice(VARIANCES + [rng.uniform(0, 2 * STDDEV**2)]),
+        "ip_fanout": rng.choice(FANOUTS),
+        "device_fanout": rng.choice(FANOUTS),
+    }
+
+
+def _nan_for_none(values):
+    return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+
+
+def test_batch_matches_scalar_consensus():
+    rng = random.Random(20240917)
+    cases = [_random_case(rng) for _ in range(CASES)]
+
+    scored = run_consensus_batch(
+        [case["ai"] for case in cases],
+        [case["vote_attempt_count"] for case in cases],
+        _nan_for_none(case["time_between_attempts_sec"] for case in cases),
+        [case["ip_fanout"] for case in cases],
+        [case["device_fanout"] for case in cases],
+        _nan_for_none(case["inter_arrival_variance"] for case in cases),
+    )
+
+    mismatches = []
+    for i, case in enumerate(cases):
+        final, validators, _ = run_consensus(case["ai"], metadata=case)
+        batch = {
+            "final": VERDICTS[scored["final"][i]],
+            "rule_based": VERDICTS[scored["rule_based"][i]],
+            "statistical": VERDICTS[scored["statistical"][i]],
+        }
+        scalar = {
+            "final": final,
+            "rule_based": validators["rule_based"]["verdict"],
+            "statistical": validators["statistical"]["verdict"],
+        }
+        for name, masks in scored["rule_masks"].items():
+            batch[f"{name}_rules"] = sorted(rule for rule, mask in masks.items() if mask[i])
+            scalar[f"{name}_rules"] = sorted(validators[name]["rules"])
+        if batch != scalar:
+            mismatches.append((case, scalar, batch))
+
+    assert not mismatches, f"{len(mismatches)} mismatches, first: {mismatches[0]}"
+
+
+def test_batch_defaults_match_missing_optional_features():
+    counts = [0, 3, 5, 7]
+    deltas = [np.nan, 12.0, 5.0, 1.0]
+    scored = run_consensus_batch(["ALLOW", "FLAG", "BLOCK", "FLAG"], counts, deltas)
+    for i, (count, delta) in enumerate(zip(counts, deltas)):
+        metadata = {
+            "vote_attempt_count": count,
+            "time_between_attempts_sec": None if np.isnan(delta) else delta,
+        }
+        final, _, _ = run_consensus(VERDICTS[scored["ai"][i]], metadata=metadata)
+        assert VERDICTS[scored["final"][i]] == final
@@ -0,0 +1,53 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from merkle import build_merkle_tree, verify_merkle_proof  # noqa: E402
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 4, 5, 7, 8, 9, 16, 33])
+def test_every_proof_verifies_against_the_root(size):
+    leaves = [f"vote-{i}" for i in range(size)]
+    root, proofs = build_merkle_tree(leaves)
+    assert len(proofs) == size
+    for leaf, proof in zip(leaves, proofs):
+        assert verify_merkle_proof(leaf, proof, root)
+        assert verify_merkle_proof(leaf, json.dumps(proof), root)
+
+
+def test_proof_does_not_verify_another_leaf_or_root():
+    leaves = ["a", "b", "c", "d", "e"]
+    root, proofs = build_merkle_tree(leaves)
+    other_root, _ = build_merkle_tree(leaves[:-1])
+    assert not verify_merkle_proof("b", proofs[0], root)
+    assert not verify_merkle_proof("a", proofs[0], other_root)
+    assert not verify_merkle_proof("x", proofs[0], root)
+
+
+def test_tampered_proof_is_rejected():
+    root, proofs = build_merkle_tree(["a", "b", "c"])
+    side, sibling = proofs[0][0]
+    flipped = [["R" if side == "L" else "L", sibling]] + proofs[0][1:]
+    assert not verify_merkle_proof("a", flipped, root)
+    assert not verify_merkle_proof("a", proofs[0][:-1], root)
+
+
+def test_leaf_is_not_confused_with_an_interior_node():
+    root, _ = build_merkle_tree(["a", "b"])
+    assert not verify_merkle_proof(root, [], root)
+
+
+def test_malformed_proofs_are_rejected():
+    root, _ = build_merkle_tree(["a", "b"])
+    assert not verify_merkle_proof("a", "not json", root)
+    assert not verify_merkle_proof("a", [["L", "zz"]], root)
+    assert not verify_merkle_proof("a", [["L"]], root)
+
+
+def test_empty_tree_is_rejected():
+    with pytest.raises(ValueError):
+        build_merkle_tree([])
@@ -0,0 +1,97 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("psycopg2")
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/trustpoll_test")
+os.environ.setdefault("DB_POOL_MIN", "0")
+
+import otp_store  # noqa: E402
+from otp_store import (  # noqa: E402
+    OTP_EXPIRED,
+    OTP_INVALID,
+    OTP_NOT_FOUND,
+    OTP_OK,
+    OTP_TOO_MANY_ATTEMPTS,
+    InMemoryOTPStore,
+)
+
+
+class _Clock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock(1000.0)
+    monkeypatch.setattr(otp_store.time, "monotonic", clock)
+    return clock
+
+
+def test_code_verifies_until_it_expires(clock):
+    store = InMemoryOTPStore(expired_grace_seconds=60)
+    assert store.issue("a", "123456", ttl_seconds=300, cooldown_seconds=30)
+    assert store.verify("a", "123456", max_attempts=5) == OTP_OK
+    clock.now += 300
+    assert store.verify("a", "123456", max_attempts=5) == OTP_OK
+    clock.now += 1
+    assert store.verify("a", "123456", max_attempts=5) == OTP_EXPIRED
+
+
+def test_expired_code_is_dropped_after_the_grace_period(clock):
+    store = InMemoryOTPStore(expired_grace_seconds=60)
+    store.issue("a", "123456", ttl_seconds=300, cooldown_seconds=30)
+    clock.now += 359
+    assert store.verify("a", "123456", max_attempts=5) == OTP_EXPIRED
+    clock.now += 1
+    assert store.verify("a", "123456", max_attempts=5) == OTP_NOT_FOUND
+    assert len(store) == 0
+
+
+def test_reissue_is_refused_during_the_cooldown(clock):
+    store = InMemoryOTPStore()
+    assert store.issue("a", "111111", ttl_seconds=300, cooldown_seconds=30)
+    clock.now += 29
+    assert not store.issue("a", "222222", ttl_seconds=300, cooldown_seconds=30)
+    assert store.verify("a", "111111", max_attempts=5) == OTP_OK
+    clock.now += 1
+    assert store.issue("a", "222222", ttl_seconds=300, cooldown_seconds=30)
+    assert store.verify("a", "111111", max_attempts=5) == OTP_INVALID
+    assert store.verify("a", "222222", max_attempts=5) == OTP_OK
+
+
+def test_wrong_codes_use_up_attempts_and_reissue_resets_them(clock):
+    store = InMemoryOTPStore()
+    store.issue("a", "123456", ttl_seconds=300, cooldown_seconds=30)
+    assert [store.verify("a", "000000", max_attempts=3) for _ in range(3)] == [OTP_INVALID] * 3
+    assert store.verify("a", "123456", max_attempts=3) == OTP_TOO_MANY_ATTEMPTS
+    clock.now += 30
+    store.issue("a", "654321", ttl_seconds=300, cooldown_seconds=30)
+    assert store.verify("a", "654321", max_attempts=3) == OTP_OK
+
+
+def test_delete_and_unknown_keys(clock):
+    store = InMemoryOTPStore()
+    assert store.verify("missing", "123456", max_attempts=5) == OTP_NOT_FOUND
+    store.issue("a", "123456", ttl_seconds=300, cooldown_seconds=30)
+    store.delete("a")
+    assert store.verify("a", "123456", max_attempts=5) == OTP_NOT_FOUND
+    assert store.issue("a", "123456", ttl_seconds=300, cooldown_seconds=30)
+
+
+def test_soonest_expiring_codes_are_evicted_over_capacity(clock):
+    store = InMemoryOTPStore(max_entries=2)
+    store.issue("a", "1", ttl_seconds=100, cooldown_seconds=0)
+    store.issue("b", "2", ttl_seconds=300, cooldown_seconds=0)
+    store.issue("c", "3", ttl_seconds=200, cooldown_seconds=0)
+    assert len(store) == 2
+    assert store.verify("a", "1", max_attempts=5) == OTP_NOT_FOUND
+    assert store.verify("b", "2", max_attempts=5) == OTP_OK
+    assert store.verify("c", "3", max_attempts=5) == OTP_OK
@@ -0,0 +1,96 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("psycopg2")
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/trustpoll_test")
+os.environ.setdefault("DB_POOL_MIN", "0")
+
+import rate_limiter  # noqa: E402
+from rate_limiter import InMemoryRateLimiter, RateLimit, _estimate, _refund, _roll  # noqa: E402
+
+RULE = RateLimit("test", 3, 60)
+
+
+class _Clock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock(6000.0)
+    monkeypatch.setattr(rate_limiter.time, "time", clock)
+    return clock
+
+
+def test_roll_keeps_the_current_window():
+    assert _roll(RULE, 6000, 6000, 4, 2) == (4, 2)
+
+
+def test_roll_shifts_the_adjacent_window_into_previous():
+    assert _roll(RULE, 6060, 6000, 4, 2) == (0, 4)
+
+
+def test_roll_drops_windows_older_than_the_previous_one():
+    assert _roll(RULE, 6120, 6000, 4, 2) == (0, 0)
+
+
+def test_estimate_weights_previous_by_remaining_overlap():
+    assert _estimate(RULE, 6000.0, 6000, 1, 4) == 5
+    assert _estimate(RULE, 6015.0, 6000, 1, 4) == 4
+    assert _estimate(RULE, 6030.0, 6000, 1, 4) == 3
+    assert _estimate(RULE, 6060.0, 6000, 1, 4) == 1
+
+
+def test_refund_takes_the_hit_from_the_window_it_landed_in():
+    assert _refund(RULE, 6000, 6000, 2, 1) == (1, 1)
+    assert _refund(RULE, 6060, 6000, 2, 1) == (0, 1)
+    assert _refund(RULE, 6120, 6000, 2, 1) == (0, 0)
+    assert _refund(RULE, 6000, 6000, 0, 1) == (0, 1)
+
+
+def test_hits_over_the_limit_are_refused(clock):
+    limiter = InMemoryRateLimiter()
+    assert [limiter.hit(RULE, "a") for _ in range(4)] == [(True, 1), (True, 2), (True, 3), (False, 4)]
+    assert limiter.hit(RULE, "b") == (True, 1)
+
+
+def test_previous_window_decays_across_the_boundary(clock):
+    limiter = InMemoryRateLimiter()
+    for _ in range(3):
+        limiter.hit(RULE, "a")
+    clock.now = 6060.0
+    assert limiter.hit(RULE, "a") == (False, 4)
+    clock.now = 6100.0
+    # 3 previous hits at a third overlap plus 2 current.
+    assert limiter.hit(RULE, "a") == (True, 3)
+    clock.now = 6240.0
+    assert limiter.hit(RULE, "a") == (True, 1)
+
+
+def test_refund_returns_a_hit(clock):
+    limiter = InMemoryRateLimiter()
+    for _ in range(3):
+        limiter.hit(RULE, "a")
+    limiter.refund(RULE, "a")
+    assert limiter.hit(RULE, "a") == (True, 3)
+    limiter.refund(RULE, "unknown")
+    assert len(limiter) == 1
+
+
+def test_least_recently_hit_keys_are_evicted(clock):
+    limiter = InMemoryRateLimiter(max_keys=2)
+    limiter.hit(RULE, "a")
+    limiter.hit(RULE, "b")
+    limiter.hit(RULE, "a")
+    limiter.hit(RULE, "c")
+    assert len(limiter) == 2
+    assert limiter.hit(RULE, "b") == (True, 1)
+    assert limiter.hit(RULE, "c") == (True, 2)
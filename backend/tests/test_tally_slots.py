@@ -0,0 +1,47 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("algosdk")
+
+from algorand_client import AlgorandGovernanceClient, candidate_counts_for_slots  # noqa: E402
+
+
+def _box(*words: int) -> bytes:
+    return b"".join(int(word).to_bytes(8, "big") for word in words)
+
+
+def test_box_slots_store_count_plus_one():
+    # Slot 0 holds the deadline; a registered slot stores its count + 1.
+    counts = AlgorandGovernanceClient.slot_counts_from_box(_box(1_900_000_000, 1, 4, 0, 2**64 - 1))
+    assert counts == {1: 0, 2: 3, 4: 2**64 - 2}
+
+
+def test_box_deadline_and_unregistered_slots_are_skipped():
+    assert AlgorandGovernanceClient.slot_counts_from_box(_box(1_900_000_000)) == {}
+    assert AlgorandGovernanceClient.slot_counts_from_box(_box(0, 0, 0)) == {}
+    assert AlgorandGovernanceClient.slot_counts_from_box(b"") == {}
+
+
+def test_box_trailing_partial_word_is_ignored():
+    assert AlgorandGovernanceClient.slot_counts_from_box(_box(0, 6) + b"\x00\x01") == {1: 5}
+
+
+def test_state_binary_keys_win_over_legacy_text_keys():
+    decoded = {
+        b"cand_" + (1).to_bytes(8, "big"): 7,
+        b"cand_1": 2,
+        b"candidate_2_count": 3,
+        b"cand_2": 4,
+        b"cand_3": b"not a count",
+        b"deadline": 1_900_000_000,
+    }
+    assert AlgorandGovernanceClient.slot_counts_from_state(decoded) == {1: 7, 2: 3}
+
+
+def test_candidate_counts_map_slots_back_to_ids():
+    slot_counts = {1: 5, 2: 0, 3: 9}
+    assert candidate_counts_for_slots(slot_counts, {41: 1, 42: 2, 57: 4}) == {41: 5, 42: 0, 57: 0}
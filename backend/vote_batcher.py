@@ -0,0 +1,138 @@
+import os
+import queue
+import re
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable
+
+from algosdk import transaction
+
+from signer_pool import ServiceAccount
+
+VOTE_BATCH_MAX_SIZE = max(1, min(16, int(os.getenv("VOTE_BATCH_MAX_SIZE", "16"))))
+VOTE_BATCH_WINDOW_SECONDS = float(os.getenv("VOTE_BATCH_WINDOW_SECONDS", "0.05"))
+VOTE_BATCH_SUBMIT_TIMEOUT_SECONDS = float(os.getenv("VOTE_BATCH_SUBMIT_TIMEOUT_SECONDS", "30"))
+
+_FAILED_TXID = re.compile(r"transaction ([A-Z2-7]{52})")
+
+
+@dataclass
+class QueuedVote:
+    email_hash: str
+    candidate_slot: int
+    election_id: str
+    future: Future = field(default_factory=Future)
+
+
+class VoteGroupBatcher:
+    def __init__(
+        self,
+        params: Callable[[], transaction.SuggestedParams],
+        build_txn: Callable[[str, int, str, transaction.SuggestedParams, str], transaction.Transaction],
+        acquire: Callable[[], ServiceAccount],
+        release: Callable[[ServiceAccount], None],
+        send: Callable[[ServiceAccount, list[transaction.SignedTransaction]], str],
+        max_size: int = VOTE_BATCH_MAX_SIZE,
+        window_seconds: float = VOTE_BATCH_WINDOW_SECONDS,
+    ) -> None:
+        self._params = params
+        self._build_txn = build_txn
+        self._acquire = acquire
+        self._release = release
+        self._send = send
+        self._max_size = max(1, min(16, max_size))
+        self._window_seconds = max(0.0, window_seconds)
+        self._queue: queue.Queue[QueuedVote] = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stats = {"groups_sent": 0, "votes_sent": 0, "votes_failed": 0, "splits": 0}
+
+    def submit(self, email_hash: str, candidate_slot: int, election_id: str) -> Future:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="vote-group-batcher", daemon=True)
+                self._thread.start()
+        vote = QueuedVote(email_hash, candidate_slot, election_id)
+        self._queue.put(vote)
+        return vote.future
+
+    def _next_batch(self) -> list[QueuedVote]:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self._window_seconds
+        while len(batch) < self._max_size:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            try:
+                self._dispatch(batch)
+            except Exception as exc:
+                for vote in batch:
+                    if not vote.future.done():
+                        vote.future.set_exception(exc)
+
+    def _dispatch(self, batch: list[QueuedVote]) -> None:
+        # One service account signs and pays for the whole group.
+        signer = self._acquire()
+        try:
+            sp = self._params()
+            txns = [
+                self._build_txn(vote.email_hash, vote.candidate_slot, vote.election_id, sp, signer.address)
+                for vote in batch
+            ]
+            if len(txns) > 1:
+                transaction.assign_group_id(txns)
+            signed = [txn.sign(signer.private_key) for txn in txns]
+        except Exception as exc:
+            # Nothing reached algod, so splitting would only repeat the same failure.
+            self._release(signer)
+            self._fail(batch, exc)
+            return
+        try:
+            self._send(signer, signed)
+        except Exception as exc:
+            self._release(signer)
+            if len(batch) == 1:
+                self._fail(batch, exc)
+                return
+            # A group is all-or-nothing: drop the member algod named, or bisect when it named none.
+            match = _FAILED_TXID.search(str(exc))
+            txids = [txn.get_txid() for txn in txns]
+            with self._lock:
+                self._stats["splits"] += 1
+            if match and match.group(1) in txids:
+                failed_idx = txids.index(match.group(1))
+                self._dispatch([batch[failed_idx]])
+                rest = batch[:failed_idx] + batch[failed_idx + 1 :]
+                if rest:
+                    self._dispatch(rest)
+                return
+            middle = len(batch) // 2
+            self._dispatch(batch[:middle])
+            self._dispatch(batch[middle:])
+            return
+
+        # Once sent, the signer's pending slots are released as each transaction settles.
+        with self._lock:
+            self._stats["groups_sent"] += 1
+            self._stats["votes_sent"] += len(batch)
+        for vote, txn in zip(batch, txns):
+            vote.future.set_result((txn.get_txid(), txn.last_valid_round))
+
+    def _fail(self, batch: list[QueuedVote], exc: Exception) -> None:
+        with self._lock:
+            self._stats["votes_failed"] += len(batch)
+        for vote in batch:
+            vote.future.set_exception(exc)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {**self._stats, "queued": self._queue.qsize()}
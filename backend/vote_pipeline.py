@@ -0,0 +1,190 @@
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from db import db_cursor
+
+
+@dataclass
+class PendingVote:
+    election_id: str
+    email: str
+    email_hash: str
+    vote_hash: str
+    candidate_id: int | None
+    tx_id: str
+    last_valid_round: int | None = None
+
+
+def mark_vote_submitted(job: PendingVote) -> None:
+    with db_cursor() as (conn, cur):
+        cur.execute(
+            """
+            UPDATE pending_votes
+            SET tx_id = %s, wallet = %s, last_valid_round = %s, last_error = NULL, updated_at = NOW()
+            WHERE election_id = %s AND email_hash = %s
+            """,
+            (job.tx_id, job.email, job.last_valid_round, job.election_id, job.email_hash),
+        )
+        conn.commit()
+
+
+def mark_vote_failed(election_id: str, email_hash: str, error: str) -> None:
+    with db_cursor() as (conn, cur):
+        cur.execute(
+            """
+            UPDATE pending_votes
+            SET status = 'failed', last_error = %s, updated_at = NOW()
+            WHERE election_id = %s AND email_hash = %s
+            """,
+            (error, election_id, email_hash),
+        )
+        conn.commit()
+
+
+def record_confirmed_vote(job: PendingVote, confirmed_round: int, block_timestamp: int) -> tuple[dict[str, Any], bool]:
+    with db_cursor() as (conn, cur):
+        cur.execute(
+            """
+            INSERT INTO votes (
+                election_id,
+                wallet,
+                email_hash,
+                vote_hash,
+                candidate_id,
+                tx_id,
+                confirmed_round,
+                block_timestamp
+            )
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            ON CONFLICT (election_id, email_hash)
+            WHERE email_hash IS NOT NULL
+            DO NOTHING
+            """,
+            (
+                job.election_id,
+                job.email,
+                job.email_hash,
+                job.vote_hash,
+                job.candidate_id,
+                job.tx_id,
+                confirmed_round,
+                block_timestamp,
+            ),
+        )
+        inserted = cur.rowcount > 0
+        recorded = {"tx_id": job.tx_id, "confirmed_round": confirmed_round, "vote_hash": job.vote_hash}
+        if not inserted:
+            cur.execute(
+                "SELECT tx_id, confirmed_round, vote_hash FROM votes WHERE election_id = %s AND email_hash = %s",
+                (job.election_id, job.email_hash),
+            )
+            existing = cur.fetchone()
+            recorded = {"tx_id": existing[0], "confirmed_round": existing[1], "vote_hash": existing[2]}
+
+        # The pending row is settled either way, or recover_pending would re-queue it on every restart.
+        cur.execute(
+            """
+            UPDATE pending_votes
+            SET status = 'confirmed', tx_id = %s, last_error = NULL, updated_at = NOW()
+            WHERE election_id = %s AND email_hash = %s
+            """,
+            (recorded["tx_id"], job.election_id, job.email_hash),
+        )
+        conn.commit()
+        return recorded, inserted
+
+
+class VoteConfirmationWorker:
+    def __init__(
+        self,
+        confirm: Callable[[str, int | None], tuple[int, int]],
+        on_confirmed: Callable[[PendingVote, int], None] | None = None,
+        on_failed: Callable[[PendingVote, str], None] | None = None,
+        workers: int = 2,
+        max_queue: int = 10000,
+    ) -> None:
+        self._confirm = confirm
+        self._on_confirmed = on_confirmed
+        self._on_failed = on_failed
+        self._workers = max(1, workers)
+        self._queue: queue.Queue[PendingVote] = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._started = False
+
+    def start(self) -> bool:
+        with self._lock:
+            if self._started:
+                return False
+            for idx in range(self._workers):
+                thread = threading.Thread(target=self._run, name=f"vote-confirm-{idx}", daemon=True)
+                thread.start()
+            self._started = True
+            return True
+
+    def submit(self, job: PendingVote) -> bool:
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            return False
+        return True
+
+    def backlog(self) -> int:
+        return self._queue.qsize()
+
+    def recover_pending(self) -> int:
+        with db_cursor() as (conn, cur):
+            cur.execute(
+                """
+                SELECT election_id, wallet, email_hash, vote_hash, candidate_id, tx_id, last_valid_round
+                FROM pending_votes
+                WHERE status = 'pending' AND tx_id IS NOT NULL AND wallet IS NOT NULL
+                ORDER BY id
+                """
+            )
+            rows = cur.fetchall()
+
+        recovered = 0
+        for election_id, wallet, email_hash, vote_hash, candidate_id, tx_id, last_valid_round in rows:
+            if self.submit(PendingVote(election_id, wallet, email_hash, vote_hash, candidate_id, tx_id, last_valid_round)):
+                recovered += 1
+        return recovered
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                self._process(job)
+            finally:
+                self._queue.task_done()
+
+    def _process(self, job: PendingVote) -> None:
+        try:
+            confirmed_round, block_timestamp = self._confirm(job.tx_id, job.last_valid_round)
+        except Exception as exc:
+            err_msg = str(exc)
+            try:
+                mark_vote_failed(job.election_id, job.email_hash, err_msg)
+            except Exception:
+                pass
+            if self._on_failed:
+                try:
+                    self._on_failed(job, err_msg)
+                except Exception:
+                    pass
+            return
+
+        try:
+            _, inserted = record_confirmed_vote(job, confirmed_round, block_timestamp)
+        except Exception as exc:
+            try:
+                mark_vote_failed(job.election_id, job.email_hash, f"Confirmed on-chain but not recorded: {exc}")
+            except Exception:
+                pass
+            return
+        if inserted and self._on_confirmed:
+            try:
+                self._on_confirmed(job, confirmed_round)
+            except Exception:
+                pass
@@ -75,7 +75,7 @@ export default function AdminPage() {
       const [statsRes, flagsRes, candidatesRes, auditRes] = await Promise.all([
         fetch(`${API_BASE}/admin/stats`),
         fetch(`${API_BASE}/admin/ai-flags`),
-        fetch(`${API_BASE}/results`),
+        fetch(`${API_BASE}/admin/results`),
         fetch(`${API_BASE}/admin/audit-events?limit=100`)
       ]);
 